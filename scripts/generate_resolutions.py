@@ -10,7 +10,6 @@ For each conflicting file when applying discord after telegram:
 
 from __future__ import annotations
 
-import hashlib
 import shutil
 import subprocess
 import sys
@@ -22,14 +21,10 @@ from pathlib import Path
 import yaml
 
 from skills_engine.merge import cleanup_merge_state, merge_file, setup_rerere_adapter
+from skills_engine.state import compute_file_hash
 from skills_engine.types import FileInputHashes
 
 
-def sha256(file_path: Path) -> str:
-    content = file_path.read_bytes()
-    return hashlib.sha256(content).digest().hex()
-
-
 def main() -> None:
     project_root = Path.cwd()
     base_dir = ".g2/base"
@@ -98,9 +93,9 @@ def main() -> None:
 
         # Compute input file hashes for this conflicted file
         file_hashes[rel_path] = FileInputHashes(
-            base=sha256(base_path),
-            current=sha256(ours_path),  # "ours" = telegram's modify
-            skill=sha256(theirs_path),  # "theirs" = discord's modify
+            base=compute_file_hash(base_path),
+            current=compute_file_hash(ours_path),  # "ours" = telegram's modify
+            skill=compute_file_hash(theirs_path),  # "theirs" = discord's modify
         )
 
         preimage_content = tmp_file.read_text(encoding="utf-8")
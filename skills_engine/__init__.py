@@ -32,6 +32,7 @@ from .manifest import (
     read_manifest,
 )
 from .merge import (
+    apply_patches,
     cleanup_merge_state,
     is_git_repo,
     merge_file,
@@ -41,18 +42,22 @@ from .merge import (
 from .migrate import init_skills_system, migrate_existing
 from .path_remap import load_path_remap, record_path_remap, resolve_path_remap
 from .rebase import rebase
-from .replay import ReplayResult, find_skill_dir, replay_skills
+from .replay import ReplayResult, find_skill_dir, index_skill_dirs, replay_skills
 from .resolution_cache import (
     clear_all_resolutions,
     find_resolution_dir,
     load_resolutions,
     save_resolution,
 )
+from .skill_tests import run_skill_test, run_skill_tests
 from .state import (
     compare_semver,
+    compute_bytes_hash,
     compute_file_hash,
+    compute_file_hashes,
     get_applied_skills,
     get_custom_modifications,
+    index_file_owners,
     read_state,
     record_custom_modification,
     record_skill_application,
@@ -121,6 +126,7 @@ __all__ = [
     "check_system_version",
     "read_manifest",
     # merge
+    "apply_patches",
     "cleanup_merge_state",
     "is_git_repo",
     "merge_file",
@@ -138,17 +144,24 @@ __all__ = [
     # replay
     "ReplayResult",
     "find_skill_dir",
+    "index_skill_dirs",
     "replay_skills",
     # resolution_cache
     "clear_all_resolutions",
     "find_resolution_dir",
     "load_resolutions",
     "save_resolution",
+    # skill_tests
+    "run_skill_test",
+    "run_skill_tests",
     # state
     "compare_semver",
+    "compute_bytes_hash",
     "compute_file_hash",
+    "compute_file_hashes",
     "get_applied_skills",
     "get_custom_modifications",
+    "index_file_owners",
     "read_state",
     "record_custom_modification",
     "record_skill_application",
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 
 from .constants import BACKUP_DIR
+from .fs_utils import copy_file_contents
 
 TOMBSTONE_SUFFIX = ".tombstone"
 
@@ -16,17 +18,24 @@ def _get_backup_dir() -> Path:
 
 def create_backup(file_paths: list[str]) -> None:
     """Back up a list of files. Creates tombstones for files that don't exist yet."""
-    backup_dir = _get_backup_dir()
+    cwd = Path.cwd()
+    backup_dir = cwd / BACKUP_DIR
     backup_dir.mkdir(parents=True, exist_ok=True)
+    created_dirs: set[Path] = {backup_dir}
 
     for file_path in file_paths:
         abs_path = Path(file_path).resolve()
-        relative_path = abs_path.relative_to(Path.cwd())
+        relative_path = abs_path.relative_to(cwd)
         backup_path = backup_dir / relative_path
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        if backup_path.parent not in created_dirs:
+            backup_path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(backup_path.parent)
 
         if abs_path.exists():
-            shutil.copy2(abs_path, backup_path)
+            # Not a hardlink: project files are rewritten in place, which would
+            # corrupt a linked backup. copy_file_range still reflinks on CoW filesystems.
+            copy_file_contents(abs_path, backup_path)
+            shutil.copystat(abs_path, backup_path)
         else:
             # File doesn't exist yet -- write a tombstone so restore can delete it
             backup_path.with_name(backup_path.name + TOMBSTONE_SUFFIX).write_text("", encoding="utf-8")
@@ -38,24 +47,19 @@ def restore_backup() -> None:
     if not backup_dir.exists():
         return
 
-    def walk(dir_path: Path) -> None:
-        for entry in dir_path.iterdir():
-            if entry.is_dir():
-                walk(entry)
-            elif entry.name.endswith(TOMBSTONE_SUFFIX):
+    cwd = Path.cwd()
+    for root, _dirs, files in os.walk(backup_dir):
+        relative_root = Path(root).relative_to(backup_dir)
+        for name in files:
+            if name.endswith(TOMBSTONE_SUFFIX):
                 # Tombstone: delete the corresponding project file
-                tomb_rel_path = entry.relative_to(backup_dir)
-                original_rel = str(tomb_rel_path)[: -len(TOMBSTONE_SUFFIX)]
-                original_path = Path.cwd() / original_rel
+                original_path = cwd / relative_root / name[: -len(TOMBSTONE_SUFFIX)]
                 if original_path.exists():
                     original_path.unlink()
             else:
-                relative_path = entry.relative_to(backup_dir)
-                original_path = Path.cwd() / relative_path
+                original_path = cwd / relative_root / name
                 original_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(entry, original_path)
-
-    walk(backup_dir)
+                shutil.copy2(os.path.join(root, name), original_path)
 
 
 def clear_backup() -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from typing import TYPE_CHECKING
 
@@ -9,18 +10,48 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-def copy_dir(src: Path, dest: Path) -> None:
+def copy_file_contents(src: str | Path, dest: str | Path) -> None:
+    """Copy a regular file's contents and permission bits, but not timestamps.
+
+    Uses os.copy_file_range where available so the kernel copies (or reflinks)
+    the data without a round trip through userspace. Falls back to
+    shutil.copyfile when the syscall is missing or refuses the pair, e.g.
+    across filesystems on older kernels.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    copied = False
+    if copy_file_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                copied = remaining == 0
+        except OSError:
+            copied = False
+
+    if not copied:
+        shutil.copyfile(src, dest)
+    shutil.copymode(src, dest)
+
+
+def copy_dir(src: str | Path, dest: str | Path) -> None:
     """Recursively copy a directory tree from src to dest.
 
-    Creates destination directories as needed.
+    Creates destination directories as needed. Files are copied (reflinked on
+    copy-on-write filesystems), never hardlinked, so later in-place writes to
+    either tree cannot leak into the other.
     """
-    for entry in src.iterdir():
-        src_path = entry
-        dest_path = dest / entry.name
-
-        if entry.is_dir():
-            dest_path.mkdir(parents=True, exist_ok=True)
-            copy_dir(src_path, dest_path)
-        else:
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_path, dest_path)
+    src_root = os.fspath(src)
+    dest_root = os.fspath(dest)
+    # Plain string paths: this runs once per file of the core tree
+    for root, _dirs, files in os.walk(src_root, followlinks=True):
+        rel_dir = os.path.relpath(root, src_root)
+        dest_dir = dest_root if rel_dir == "." else os.path.join(dest_root, rel_dir)
+        os.makedirs(dest_dir, exist_ok=True)
+        for name in files:
+            src_path = os.path.join(root, name)
+            copy_file_contents(src_path, os.path.join(dest_dir, name))
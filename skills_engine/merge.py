@@ -200,3 +200,49 @@ def cleanup_merge_state(file_path: str | None = None) -> None:
     except subprocess.CalledProcessError:
         # May fail if nothing staged
         pass
+
+
+def apply_patches(patch_paths: list[Path], cwd: Path) -> list[Path]:
+    """Apply patch files in order with git apply --3way.
+
+    Returns the patches that failed to apply. When every patch applies
+    cleanly (verified by one dry run), they are applied in a single git
+    invocation; otherwise each is applied separately so failures can be
+    attributed to individual patches.
+    """
+    # Files rewritten with identical content leave stale stat info in the index, which
+    # git apply --index/--3way treats as "does not match index"
+    subprocess.run(["git", "update-index", "-q", "--refresh"], capture_output=True, cwd=cwd)
+
+    if len(patch_paths) > 1:
+        args = [str(p) for p in patch_paths]
+        # --3way implies --index; --3way --check would report conflicted merges as success
+        check = subprocess.run(
+            ["git", "apply", "--index", "--check", *args],
+            capture_output=True,
+            text=True,
+            cwd=cwd,
+        )
+        if check.returncode == 0:
+            applied = subprocess.run(
+                ["git", "apply", "--3way", *args],
+                capture_output=True,
+                text=True,
+                cwd=cwd,
+            )
+            if applied.returncode == 0:
+                return []
+
+    failed: list[Path] = []
+    for patch_path in patch_paths:
+        try:
+            subprocess.run(
+                ["git", "apply", "--3way", str(patch_path)],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=cwd,
+            )
+        except Exception:
+            failed.append(patch_path)
+    return failed
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from .state import read_state, write_state
+import time
+from pathlib import Path
+
+from .constants import G2_DIR, STATE_FILE
+from .state import _RACY_WINDOW_NS, read_state, write_state
+
+# Last remap parsed per state file, keyed on its stat identity. As with the file hash
+# cache, a file modified within the racy window is not cached: a reused inode with the
+# same size and a coarse mtime could otherwise match a stale entry.
+_remap_cache: dict[Path, tuple[tuple[int, int, int, int, int], dict[str, str]]] = {}
 
 
 def resolve_path_remap(rel_path: str, remap: dict[str, str]) -> str:
@@ -11,9 +20,25 @@ def resolve_path_remap(rel_path: str, remap: dict[str, str]) -> str:
 
 
 def load_path_remap() -> dict[str, str]:
-    """Load the current path remap from state."""
-    state = read_state()
-    return state.path_remap or {}
+    """Load the current path remap from state, reusing the last parse while state.yaml is unchanged."""
+    state_path = Path.cwd() / G2_DIR / STATE_FILE
+    try:
+        st = state_path.stat()
+    except FileNotFoundError:
+        # Let read_state raise its usual error
+        return read_state().path_remap or {}
+
+    key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+    cached = _remap_cache.get(state_path)
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+
+    remap = read_state().path_remap or {}
+    if time.time_ns() - max(st.st_mtime_ns, st.st_ctime_ns) > _RACY_WINDOW_NS:
+        _remap_cache[state_path] = (key, dict(remap))
+    else:
+        _remap_cache.pop(state_path, None)
+    return remap
 
 
 def record_path_remap(remap: dict[str, str]) -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import os
 import shutil
 import subprocess
 import tempfile
@@ -24,6 +25,7 @@ from .merge import (
 )
 from .path_remap import load_path_remap, resolve_path_remap
 from .resolution_cache import load_resolutions
+from .state import compute_bytes_hash, compute_file_hashes
 from .structured import (
     merge_docker_compose_services,
     merge_env_additions,
@@ -38,6 +40,7 @@ class ReplayResult(BaseModel):
     success: bool
     per_skill: dict[str, dict[str, Any]]
     merge_conflicts: list[str] | None = None
+    file_hashes: dict[str, dict[str, str]] | None = None
     error: str | None = None
 
 
@@ -66,6 +69,35 @@ def find_skill_dir(skill_name: str, project_root: Path | None = None) -> Path |
     return None
 
 
+def index_skill_dirs(project_root: Path | None = None) -> dict[str, Path]:
+    """Map each skill name to its directory under .claude/skills/ in one scan.
+
+    Reads every manifest once, so looking up several skills costs a single
+    pass instead of one find_skill_dir scan per skill. Where two directories
+    declare the same skill, the first one scanned wins, as in find_skill_dir.
+    """
+    root = project_root or Path.cwd()
+    skills_root = root / ".claude" / "skills"
+    index: dict[str, Path] = {}
+    try:
+        entries = list(os.scandir(skills_root))
+    except FileNotFoundError:
+        return index
+
+    for entry in entries:
+        if not entry.is_dir() or not os.path.exists(os.path.join(entry.path, "manifest.yaml")):
+            continue
+        skill_dir = Path(entry.path)
+        try:
+            manifest = read_manifest(skill_dir)
+        except Exception:
+            # Skip invalid manifests
+            continue
+        index.setdefault(manifest.skill, skill_dir)
+
+    return index
+
+
 def replay_skills(
     skills: list[str],
     skill_dirs: dict[str, Path],
@@ -81,9 +113,12 @@ def replay_skills(
 
     per_skill: dict[str, dict[str, Any]] = {}
     all_merge_conflicts: list[str] = []
+    # Digests of clean merge results, taken from the merged bytes while they are in memory
+    merged_hashes: dict[str, str] = {}
 
     # 1. Collect all files touched by any skill in the list
     all_touched_files: set[str] = set()
+    skill_files: dict[str, list[str]] = {}
     for skill_name in skills:
         skill_dir = skill_dirs.get(skill_name)
         if not skill_dir:
@@ -98,10 +133,8 @@ def replay_skills(
             )
 
         manifest = read_manifest(skill_dir)
-        for f in manifest.adds:
-            all_touched_files.add(f)
-        for f in manifest.modifies:
-            all_touched_files.add(f)
+        skill_files[skill_name] = [*manifest.adds, *manifest.modifies]
+        all_touched_files.update(skill_files[skill_name])
 
     # 2. Reset touched files to clean base
     for rel_path in all_touched_files:
@@ -136,6 +169,7 @@ def replay_skills(
 
             # Execute file_ops
             if manifest.file_ops and len(manifest.file_ops) > 0:
+                merged_hashes.clear()  # file ops may move or rewrite earlier merge results
                 file_ops_result = execute_file_ops(manifest.file_ops, project_root)
                 if not file_ops_result.success:
                     per_skill[skill_name] = {
@@ -158,6 +192,7 @@ def replay_skills(
                     if src_path.exists():
                         dest_path.parent.mkdir(parents=True, exist_ok=True)
                         shutil.copy2(src_path, dest_path)
+                        merged_hashes.pop(resolved_dest, None)
 
             # Three-way merge modify/ files
             skill_conflicts: list[str] = []
@@ -172,6 +207,7 @@ def replay_skills(
                     skill_conflicts.append(rel_path)
                     continue
 
+                merged_hashes.pop(resolved_path, None)
                 if not current_path.exists():
                     current_path.parent.mkdir(parents=True, exist_ok=True)
                     shutil.copy2(skill_path, current_path)
@@ -188,8 +224,11 @@ def replay_skills(
                 result = merge_file(tmp_current, base_path, skill_path)
 
                 if result.clean:
-                    shutil.copy2(tmp_current, current_path)
+                    # Hash the merged bytes now rather than re-reading the file in step 6
+                    merged_bytes = tmp_current.read_bytes()
+                    current_path.write_bytes(merged_bytes)
                     tmp_current.unlink()
+                    merged_hashes[resolved_path] = compute_bytes_hash(merged_bytes)
                 else:
                     shutil.copy2(tmp_current, current_path)
                     tmp_current.unlink()
@@ -265,6 +304,9 @@ def replay_skills(
         )
 
     # 4. Apply aggregated structured operations (only if no conflicts)
+    # These rewrite their target files, so drop any merge-time digests for them
+    for structured_file in ("package.json", ".env.example", "docker-compose.yml"):
+        merged_hashes.pop(structured_file, None)
     if has_npm_deps:
         pkg_path = project_root / "package.json"
         merge_npm_dependencies(pkg_path, all_npm_deps)
@@ -282,4 +324,22 @@ def replay_skills(
         with contextlib.suppress(Exception):
             run_npm_install()
 
-    return ReplayResult(success=True, per_skill=per_skill)
+    # 6. Hash the replayed files so callers can refresh state without re-walking
+    resolved_files = {
+        name: [resolve_path_remap(rel_path, path_remap) for rel_path in files] for name, files in skill_files.items()
+    }
+    existing = {
+        resolved: project_root / resolved
+        for files in resolved_files.values()
+        for resolved in files
+        if resolved not in merged_hashes and (project_root / resolved).exists()
+    }
+    hashes = {resolved: digest for resolved, digest in merged_hashes.items() if (project_root / resolved).exists()}
+    path_hashes = compute_file_hashes(existing.values())
+    hashes.update({resolved: path_hashes[path] for resolved, path in existing.items()})
+    file_hashes = {
+        name: {resolved: hashes[resolved] for resolved in files if resolved in hashes}
+        for name, files in resolved_files.items()
+    }
+
+    return ReplayResult(success=True, per_skill=per_skill, file_hashes=file_hashes)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
 import shutil
 import subprocess
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -14,8 +18,11 @@ from .constants import G2_DIR, RESOLUTIONS_DIR, SHIPPED_RESOLUTIONS_DIR
 from .state import compute_file_hash
 from .types import FileInputHashes, ResolutionMeta
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class PreimagePair(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class PreimagePair:
     """A preimage/resolution pair found in the resolution cache."""
 
     rel_path: str
@@ -23,12 +30,18 @@ class PreimagePair(BaseModel):
     resolution: Path
 
 
+@lru_cache(maxsize=256)
+def _cached_resolution_key(skills: tuple[str, ...]) -> str:
+    return "+".join(sorted(skills))
+
+
 def _resolution_key(skills: list[str]) -> str:
     """Build the resolution directory key from skill identifiers.
 
-    Skills are sorted alphabetically and joined with "+".
+    Skills are sorted alphabetically and joined with "+". Keys are memoized
+    per skill tuple so repeated lookups for the same combination skip the sort.
     """
-    return "+".join(sorted(skills))
+    return _cached_resolution_key(tuple(skills))
 
 
 def find_resolution_dir(
@@ -72,24 +85,71 @@ def _find_preimage_pairs(dir_path: Path, base_dir: Path) -> list[PreimagePair]:
     return pairs
 
 
-def _find_rerere_hash(rr_cache_dir: Path, preimage_content: str) -> str | None:
-    """Find the rerere hash for a given preimage by scanning rr-cache entries.
+def _index_rerere_preimages(rr_cache_dir: Path) -> dict[bytes, str]:
+    """Index rr-cache entries by their raw preimage bytes.
 
-    Returns the directory name (hash) whose preimage matches the given content.
+    Maps preimage content to the entry directory name (the rerere hash), so
+    each saved file resolves its hash with a dict lookup instead of a rescan.
     """
+    index: dict[bytes, str] = {}
     if not rr_cache_dir.exists():
-        return None
+        return index
 
     for entry in rr_cache_dir.iterdir():
         if not entry.is_dir():
             continue
         preimage_path = entry / "preimage"
         if preimage_path.exists():
-            content = preimage_path.read_text(encoding="utf-8")
-            if content == preimage_content:
-                return entry.name
+            index.setdefault(preimage_path.read_bytes(), entry.name)
 
-    return None
+    return index
+
+
+@lru_cache(maxsize=4)
+def _git_dir(project_root: Path) -> Path:
+    """Resolve the absolute git directory for project_root.
+
+    Memoized for the life of the process since the git dir does not move.
+    Raises CalledProcessError outside a git repo; failures are not cached.
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-dir"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=project_root,
+    )
+    git_dir = Path(result.stdout.strip())
+    if not git_dir.is_absolute():
+        git_dir = project_root / git_dir
+    return git_dir
+
+
+def _parse_meta(meta_path: Path) -> ResolutionMeta | None:
+    """Parse a resolution meta.yaml, returning None if missing or invalid.
+
+    Uses the LibYAML-backed loader when PyYAML was built with it.
+    """
+    if not meta_path.exists():
+        return None
+
+    try:
+        raw = yaml.load(meta_path.read_bytes(), Loader=_YAML_LOADER)
+        return ResolutionMeta(**raw)
+    except Exception:
+        return None
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write pre-encoded content with raw fd writes, skipping the buffered text layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
 
 def load_resolutions(
@@ -106,17 +166,8 @@ def load_resolutions(
     if res_dir is None:
         return False
 
-    meta_path = res_dir / "meta.yaml"
-    if not meta_path.exists():
-        return False
-
-    try:
-        raw = yaml.safe_load(meta_path.read_text(encoding="utf-8"))
-        meta = ResolutionMeta(**raw)
-    except Exception:
-        return False
-
-    if meta.input_hashes is None:
+    meta = _parse_meta(res_dir / "meta.yaml")
+    if meta is None or meta.input_hashes is None:
         return False
 
     # Find all preimage/resolution pairs
@@ -126,22 +177,21 @@ def load_resolutions(
 
     # Get the git directory
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=project_root,
-        )
-        git_dir = Path(result.stdout.strip())
-        if not git_dir.is_absolute():
-            git_dir = project_root / git_dir
+        rr_cache_dir = _git_dir(project_root) / "rr-cache"
     except subprocess.CalledProcessError:
         return False
 
-    rr_cache_dir = git_dir / "rr-cache"
     loaded_any = False
 
+    # Pairs often share inputs (e.g. the same base file) -- hash each path once
+    input_hashes: dict[Path, str] = {}
+
+    def hash_input(path: Path) -> str:
+        digest = input_hashes.get(path)
+        if digest is None:
+            digest = input_hashes[path] = compute_file_hash(path)
+        return digest
+
     for pair in pairs:
         # Verify file_hashes -- skip pair if hashes don't match
         expected = meta.file_hashes.get(pair.rel_path)
@@ -162,17 +212,17 @@ def load_resolutions(
             print(f"resolution-cache: skipping {pair.rel_path} -- input files not found")
             continue
 
-        base_hash = compute_file_hash(base_path)
+        base_hash = hash_input(base_path)
         if base_hash != expected.base:
             print(f"resolution-cache: skipping {pair.rel_path} -- base hash mismatch")
             continue
 
-        current_hash = compute_file_hash(current_path)
+        current_hash = hash_input(current_path)
         if current_hash != expected.current:
             print(f"resolution-cache: skipping {pair.rel_path} -- current hash mismatch")
             continue
 
-        skill_hash = compute_file_hash(skill_modify_path)
+        skill_hash = hash_input(skill_modify_path)
         if skill_hash != expected.skill:
             print(f"resolution-cache: skipping {pair.rel_path} -- skill hash mismatch")
             continue
@@ -241,37 +291,32 @@ def save_resolution(
 
     # Get the git rr-cache directory to find actual rerere hashes
     rr_cache_dir: Path | None = None
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=project_root,
-        )
-        git_dir = Path(result.stdout.strip())
-        if not git_dir.is_absolute():
-            git_dir = project_root / git_dir
-        rr_cache_dir = git_dir / "rr-cache"
-    except subprocess.CalledProcessError:
-        # Not a git repo -- skip hash capture
-        pass
+    # Not a git repo -- skip hash capture
+    with contextlib.suppress(subprocess.CalledProcessError):
+        rr_cache_dir = _git_dir(project_root) / "rr-cache"
+
+    # Index rr-cache preimages once rather than rescanning per file
+    rr_by_preimage: dict[bytes, str] = {}
+    if rr_cache_dir is not None:
+        rr_by_preimage = _index_rerere_preimages(rr_cache_dir)
 
     # Write preimage/resolution pairs
     for file in normalized_files:
         preimage_path = res_dir / (file.rel_path + ".preimage")
         resolution_path = res_dir / (file.rel_path + ".resolution")
 
+        # Encode once -- the same bytes are written and used for the rr-cache lookup
+        preimage_bytes = file.preimage.encode("utf-8")
+
         preimage_path.parent.mkdir(parents=True, exist_ok=True)
-        preimage_path.write_text(file.preimage, encoding="utf-8")
-        resolution_path.write_text(file.resolution, encoding="utf-8")
+        _write_bytes(preimage_path, preimage_bytes)
+        _write_bytes(resolution_path, file.resolution.encode("utf-8"))
 
         # Capture the actual rerere hash by finding the rr-cache entry
         # whose preimage matches ours
-        if rr_cache_dir is not None and rr_cache_dir.exists():
-            rerere_hash = _find_rerere_hash(rr_cache_dir, file.preimage)
-            if rerere_hash is not None:
-                preimage_path.with_name(preimage_path.name + ".hash").write_text(rerere_hash, encoding="utf-8")
+        rerere_hash = rr_by_preimage.get(preimage_bytes)
+        if rerere_hash is not None:
+            _write_bytes(preimage_path.with_name(preimage_path.name + ".hash"), rerere_hash.encode("utf-8"))
 
     # Collect file_hashes from individual files
     file_hashes: dict[str, FileInputHashes] = {}
@@ -315,9 +360,9 @@ def save_resolution(
 
     meta_yaml_path = res_dir / "meta.yaml"
     meta_yaml_path.parent.mkdir(parents=True, exist_ok=True)
-    meta_yaml_path.write_text(
-        yaml.safe_dump(full_meta.model_dump(), sort_keys=True),
-        encoding="utf-8",
+    _write_bytes(
+        meta_yaml_path,
+        yaml.safe_dump(full_meta.model_dump(), sort_keys=True).encode("utf-8"),
     )
 
 
@@ -0,0 +1,49 @@
+"""Run skill test commands after replays and updates."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+TEST_TIMEOUT_S = 120
+# Cap concurrency so several test suites don't oversubscribe the machine
+_MAX_PARALLEL_TESTS = min(8, os.cpu_count() or 4)
+
+
+def run_skill_test(test_cmd: str, cwd: Path) -> bool:
+    """Run a single skill test command through the shell. Returns True if it passed."""
+    try:
+        # Only the exit status is used, so output goes to DEVNULL rather than through
+        # pipes that would need draining and decoding. Keep to kwargs that let
+        # subprocess spawn via vfork (no preexec_fn, user/group or umask changes).
+        subprocess.run(
+            test_cmd,
+            shell=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            cwd=cwd,
+            timeout=TEST_TIMEOUT_S,
+        )
+        return True
+    except Exception:
+        return False
+
+
+def run_skill_tests(tests: list[tuple[str, str]], cwd: Path) -> dict[str, bool]:
+    """Run (skill_name, test_cmd) pairs with bounded concurrency.
+
+    Returns pass/fail per skill name, in the order the tests were given.
+    """
+    if len(tests) < 2:
+        return {name: run_skill_test(cmd, cwd) for name, cmd in tests}
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_TESTS, len(tests))) as executor:
+        passed = executor.map(lambda test: run_skill_test(test[1], cwd), tests)
+        return {name: ok for (name, _), ok in zip(tests, passed, strict=True)}
@@ -3,14 +3,30 @@
 from __future__ import annotations
 
 import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
 from .constants import G2_DIR, SKILLS_SCHEMA_VERSION, STATE_FILE
 from .types import AppliedSkill, CustomModification, SkillState
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# compute_file_hash memo: (st_dev, st_ino, st_size, st_mtime_ns) -> hex digest
+_hash_cache: dict[tuple[int, int, int, int], str] = {}
+_HASH_CACHE_MAX = 4096
+_RACY_WINDOW_NS = 2_000_000_000
+
+# hashlib releases the GIL while digesting, so threads overlap read I/O and hashing
+_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 def _get_state_path() -> Path:
     return Path.cwd() / G2_DIR / STATE_FILE
@@ -101,6 +117,15 @@ def record_custom_modification(
     write_state(state)
 
 
+def index_file_owners(state: SkillState) -> dict[str, set[str]]:
+    """Map each skill-touched file to the names of the skills that touch it."""
+    owners: dict[str, set[str]] = {}
+    for skill in state.applied_skills:
+        for file_path in skill.file_hashes:
+            owners.setdefault(file_path, set()).add(skill.name)
+    return owners
+
+
 def get_custom_modifications() -> list[CustomModification]:
     """Return the list of custom modifications."""
     state = read_state()
@@ -108,9 +133,50 @@ def get_custom_modifications() -> list[CustomModification]:
 
 
 def compute_file_hash(file_path: Path) -> str:
-    """Compute the SHA-256 hash of a file's contents."""
-    content = file_path.read_bytes()
-    return hashlib.sha256(content).hexdigest()
+    """Compute the SHA-256 hash of a file's contents.
+
+    Digests are memoized per process by file identity (device, inode, size,
+    mtime). Files modified within the last few seconds are not cached, since
+    a same-size rewrite inside the filesystem's timestamp granularity would
+    otherwise be indistinguishable.
+    """
+    with file_path.open("rb") as f:
+        st = os.fstat(f.fileno())
+        key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        cached = _hash_cache.get(key)
+        if cached is not None:
+            return cached
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+
+    if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+        if len(_hash_cache) >= _HASH_CACHE_MAX:
+            _hash_cache.clear()
+        _hash_cache[key] = digest
+    return digest
+
+
+def compute_bytes_hash(data: bytes) -> str:
+    """Compute the SHA-256 hash of in-memory content, matching compute_file_hash."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def compute_file_hashes(file_paths: Iterable[Path]) -> dict[Path, str]:
+    """Compute SHA-256 hashes for many files concurrently.
+
+    Returns a mapping of each input path to its hex digest.
+    """
+    paths = list(dict.fromkeys(file_paths))
+    if len(paths) < 2:
+        return {p: compute_file_hash(p) for p in paths}
+
+    with ThreadPoolExecutor(max_workers=min(_HASH_WORKERS, len(paths))) as executor:
+        return dict(zip(paths, executor.map(compute_file_hash, paths), strict=True))
+
+
+@lru_cache(maxsize=128)
+def _parse_semver(version: str) -> tuple[int, ...]:
+    """Parse a dotted version string into a tuple of ints."""
+    return tuple(int(x) for x in version.split("."))
 
 
 def compare_semver(a: str, b: str) -> int:
@@ -118,14 +184,12 @@ def compare_semver(a: str, b: str) -> int:
 
     Returns negative if a < b, 0 if equal, positive if a > b.
     """
-    parts_a = [int(x) for x in a.split(".")]
-    parts_b = [int(x) for x in b.split(".")]
+    parts_a = _parse_semver(a)
+    parts_b = _parse_semver(b)
 
-    for i in range(max(len(parts_a), len(parts_b))):
-        val_a = parts_a[i] if i < len(parts_a) else 0
-        val_b = parts_b[i] if i < len(parts_b) else 0
-        diff = val_a - val_b
-        if diff != 0:
-            return diff
+    # Pad the shorter version with zeros so "1.0" == "1.0.0"
+    length = max(len(parts_a), len(parts_b))
+    parts_a += (0,) * (length - len(parts_a))
+    parts_b += (0,) * (length - len(parts_b))
 
-    return 0
+    return (parts_a > parts_b) - (parts_a < parts_b)
@@ -12,6 +12,11 @@ import yaml
 if TYPE_CHECKING:
     from pathlib import Path
 
+_ENV_VAR_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)=")
+
+# Prefer the LibYAML-backed emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def _compare_version_parts(a: list[str], b: list[str]) -> int:
     """Compare two split version part lists numerically."""
@@ -35,28 +40,23 @@ def are_ranges_compatible(
     if existing == requested:
         return {"compatible": True, "resolved": existing}
 
-    # Both start with ^
-    if existing.startswith("^") and requested.startswith("^"):
-        e_parts = existing[1:].split(".")
-        r_parts = requested[1:].split(".")
-        if e_parts[0] != r_parts[0]:
-            return {"compatible": False, "resolved": existing}
-        # Same major -- take the higher version
-        resolved = existing if _compare_version_parts(e_parts, r_parts) >= 0 else requested
-        return {"compatible": True, "resolved": resolved}
-
-    # Both start with ~
-    if existing.startswith("~") and requested.startswith("~"):
-        e_parts = existing[1:].split(".")
-        r_parts = requested[1:].split(".")
-        if e_parts[0] != r_parts[0] or (len(e_parts) > 1 and len(r_parts) > 1 and e_parts[1] != r_parts[1]):
-            return {"compatible": False, "resolved": existing}
-        # Same major.minor -- take higher patch
-        resolved = existing if _compare_version_parts(e_parts, r_parts) >= 0 else requested
-        return {"compatible": True, "resolved": resolved}
-
-    # Mismatched prefixes or anything else (exact, >=, *, etc.)
-    return {"compatible": False, "resolved": existing}
+    # Only matching ^ or ~ prefixes can be reconciled; mismatched prefixes or
+    # anything else (exact, >=, *, etc.) is incompatible
+    prefix = existing[:1]
+    if prefix not in ("^", "~") or requested[:1] != prefix:
+        return {"compatible": False, "resolved": existing}
+
+    e_parts = existing[1:].split(".")
+    r_parts = requested[1:].split(".")
+    if e_parts[0] != r_parts[0]:
+        return {"compatible": False, "resolved": existing}
+    # ~ additionally pins the minor version
+    if prefix == "~" and len(e_parts) > 1 and len(r_parts) > 1 and e_parts[1] != r_parts[1]:
+        return {"compatible": False, "resolved": existing}
+
+    # Same major (^) or major.minor (~) -- take the higher version
+    resolved = existing if _compare_version_parts(e_parts, r_parts) >= 0 else requested
+    return {"compatible": True, "resolved": resolved}
 
 
 def merge_npm_dependencies(
@@ -91,7 +91,11 @@ def merge_npm_dependencies(
     if dev_dependencies is not None:
         pkg["devDependencies"] = dict(sorted(dev_dependencies.items()))
 
-    package_json_path.write_text(json.dumps(pkg, indent=2) + "\n")
+    # Only the dependency maps are sorted -- sort_keys would also reorder the
+    # rest of package.json. Skip the write when nothing changed.
+    new_content = json.dumps(pkg, indent=2) + "\n"
+    if new_content != content:
+        package_json_path.write_text(new_content)
 
 
 def merge_env_additions(
@@ -104,8 +108,8 @@ def merge_env_additions(
         content = env_example_path.read_text()
 
     existing_vars: set[str] = set()
-    for line in content.split("\n"):
-        match = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)=", line)
+    for line in content.splitlines():
+        match = _ENV_VAR_RE.match(line)
         if match:
             existing_vars.add(match.group(1))
 
@@ -124,10 +128,8 @@ def merge_env_additions(
 
 def _extract_host_port(port_mapping: str) -> str | None:
     """Extract the host port from a docker-compose port mapping string."""
-    parts = str(port_mapping).split(":")
-    if len(parts) >= 2:
-        return parts[0]
-    return None
+    host, sep, _ = str(port_mapping).partition(":")
+    return host if sep else None
 
 
 def merge_docker_compose_services(
@@ -172,7 +174,9 @@ def merge_docker_compose_services(
 
         existing_services[name] = definition
 
-    compose_path.write_text(yaml.dump(compose, default_flow_style=False))
+    # Stream straight to disk; keep the compose file's own key order
+    with compose_path.open("w", encoding="utf-8") as f:
+        yaml.dump(compose, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
 
 def run_npm_install() -> None:
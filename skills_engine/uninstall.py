@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-import contextlib
-import shutil
-import subprocess
+import os
 from pathlib import Path
 
 from .backup import clear_backup, create_backup, restore_backup
 from .constants import BASE_DIR
+from .fs_utils import copy_file_contents
 from .lock import acquire_lock
+from .merge import apply_patches
 from .path_remap import load_path_remap, resolve_path_remap
-from .replay import find_skill_dir, replay_skills
-from .state import compute_file_hash, read_state, write_state
+from .replay import index_skill_dirs, replay_skills
+from .skill_tests import run_skill_tests
+from .state import compute_file_hashes, index_file_owners, read_state, write_state
 from .types import UninstallResult
 
 
@@ -60,25 +61,25 @@ def uninstall_skill(skill_name: str) -> UninstallResult:
 
     try:
         # 4. Backup all files touched by any applied skill
-        all_touched_files: set[str] = set()
-        for skill in state.applied_skills:
-            for file_path in skill.file_hashes:
-                all_touched_files.add(file_path)
+        file_owners = index_file_owners(state)
+        all_touched_files: set[str] = set(file_owners)
         if state.custom_modifications:
             for mod in state.custom_modifications:
                 for f in mod.files_modified:
                     all_touched_files.add(f)
 
-        files_to_backup = [str(project_root / f) for f in all_touched_files]
+        root = str(project_root)
+        files_to_backup = [os.path.join(root, f) for f in all_touched_files]
         create_backup(files_to_backup)
 
         # 5. Build remaining skill list (original order, minus removed)
         remaining_skills = [s.name for s in state.applied_skills if s.name != skill_name]
 
         # 6. Locate all skill dirs
+        skill_dir_index = index_skill_dirs(project_root)
         skill_dirs: dict[str, Path] = {}
         for name in remaining_skills:
-            found_dir = find_skill_dir(name, project_root)
+            found_dir = skill_dir_index.get(name)
             if not found_dir:
                 restore_backup()
                 clear_backup()
@@ -93,30 +94,23 @@ def uninstall_skill(skill_name: str) -> UninstallResult:
             skill_dirs[name] = found_dir
 
         # 7. Reset files exclusive to the removed skill; replay_skills handles the rest
-        base_dir = project_root / BASE_DIR
+        base_root = os.path.join(root, BASE_DIR)
         path_remap = load_path_remap()
 
-        remaining_skill_files: set[str] = set()
-        for skill in state.applied_skills:
-            if skill.name == skill_name:
-                continue
-            for file_path in skill.file_hashes:
-                remaining_skill_files.add(file_path)
-
-        removed_skill_files = list(skill_entry.file_hashes.keys())
-        for file_path in removed_skill_files:
-            if file_path in remaining_skill_files:
-                continue  # replay_skills handles it
+        for file_path in skill_entry.file_hashes:
+            if file_owners[file_path] != {skill_name}:
+                continue  # also touched by a remaining skill -- replay_skills handles it
             resolved_path = resolve_path_remap(file_path, path_remap)
-            current_path = project_root / resolved_path
-            base_path = base_dir / resolved_path
-
-            if base_path.exists():
-                current_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(base_path, current_path)
-            elif current_path.exists():
+            current_path = os.path.join(root, resolved_path)
+            base_path = os.path.join(base_root, resolved_path)
+
+            if os.path.exists(base_path):
+                os.makedirs(os.path.dirname(current_path), exist_ok=True)
+                # Working tree files are tracked by content, so timestamps needn't be copied
+                copy_file_contents(base_path, current_path)
+            elif os.path.exists(current_path):
                 # Add-only file not in base -- remove
-                current_path.unlink()
+                os.unlink(current_path)
 
         # 8. Replay remaining skills on clean base
         replay_result = replay_skills(
@@ -136,41 +130,22 @@ def uninstall_skill(skill_name: str) -> UninstallResult:
             )
 
         # 10. Re-apply standalone custom_modifications
+        patches_applied = False
         if state.custom_modifications:
-            for mod in state.custom_modifications:
-                patch_path = project_root / mod.patch_file
-                if patch_path.exists():
-                    with contextlib.suppress(Exception):
-                        subprocess.run(
-                            ["git", "apply", "--3way", str(patch_path)],
-                            capture_output=True,
-                            text=True,
-                            check=True,
-                            cwd=project_root,
-                        )
+            patch_paths = [project_root / mod.patch_file for mod in state.custom_modifications]
+            existing_patches = [p for p in patch_paths if p.exists()]
+            apply_patches(existing_patches, project_root)
+            patches_applied = bool(existing_patches)
 
         # 11. Run skill tests
-        replay_results: dict[str, bool] = {}
+        skill_tests: list[tuple[str, str]] = []
         for skill in state.applied_skills:
             if skill.name == skill_name:
                 continue
             outcomes = skill.structured_outcomes
-            if not outcomes or not outcomes.get("test"):
-                continue
-
-            try:
-                subprocess.run(
-                    str(outcomes["test"]),
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=project_root,
-                    timeout=120,
-                )
-                replay_results[skill.name] = True
-            except Exception:
-                replay_results[skill.name] = False
+            if outcomes and outcomes.get("test"):
+                skill_tests.append((skill.name, str(outcomes["test"])))
+        replay_results = run_skill_tests(skill_tests, project_root)
 
         # Check for test failures
         test_failures = [name for name, passed in replay_results.items() if not passed]
@@ -187,14 +162,26 @@ def uninstall_skill(skill_name: str) -> UninstallResult:
         # 11. Update state
         state.applied_skills = [s for s in state.applied_skills if s.name != skill_name]
 
-        # Update file hashes for remaining skills
-        for skill in state.applied_skills:
-            new_hashes: dict[str, str] = {}
-            for file_path in skill.file_hashes:
-                abs_path = project_root / file_path
-                if abs_path.exists():
-                    new_hashes[file_path] = compute_file_hash(abs_path)
-            skill.file_hashes = new_hashes
+        if patches_applied:
+            # Custom patches may have changed files after replay hashed them -- rehash everything in one batch
+            existing_paths = {
+                file_path: project_root / file_path
+                for skill in state.applied_skills
+                for file_path in skill.file_hashes
+                if (project_root / file_path).exists()
+            }
+            fresh_hashes = compute_file_hashes(existing_paths.values())
+            for skill in state.applied_skills:
+                skill.file_hashes = {
+                    file_path: fresh_hashes[existing_paths[file_path]]
+                    for file_path in skill.file_hashes
+                    if file_path in existing_paths
+                }
+        else:
+            # Update file hashes for remaining skills from what replay just wrote
+            replayed_hashes = replay_result.file_hashes or {}
+            for skill in state.applied_skills:
+                skill.file_hashes = replayed_hashes.get(skill.name, skill.file_hashes)
 
         write_state(state)
 
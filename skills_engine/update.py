@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from .backup import clear_backup, create_backup, restore_backup
 from .constants import BASE_DIR
 from .customize import is_customize_active
 from .fs_utils import copy_dir
 from .lock import acquire_lock
 from .merge import (
+    apply_patches,
     cleanup_merge_state,
     is_git_repo,
     merge_file,
@@ -24,25 +26,94 @@ from .merge import (
     setup_rerere_adapter,
 )
 from .path_remap import record_path_remap
-from .state import compute_file_hash, read_state, write_state
+from .skill_tests import run_skill_tests
+from .state import compute_file_hashes, read_state, write_state
 from .structured import (
     merge_docker_compose_services,
     merge_env_additions,
     merge_npm_dependencies,
     run_npm_install,
 )
-from .types import UpdatePreview, UpdateResult
+from .types import MergeResult, UpdatePreview, UpdateResult
+
+# Each merge is a git subprocess, so threads just overlap process waits
+_MERGE_WORKERS = min(16, os.cpu_count() or 1)
+
+
+@dataclass
+class _PendingMerge:
+    """A changed file staged for three-way merge against the new core."""
+
+    rel_path: str
+    current_path: Path
+    base_path: Path
+    new_core_src_path: Path
+    tmp_current: Path
+    ours_bytes: bytes
+
+
+def _run_merges(pending: list[_PendingMerge]) -> list[MergeResult]:
+    """Run git merge-file for each staged file, concurrently when there are several.
+
+    Results are returned in the same order as pending.
+    """
+
+    def merge(job: _PendingMerge) -> MergeResult:
+        return merge_file(job.tmp_current, job.base_path, job.new_core_src_path)
+
+    if len(pending) < 2:
+        return [merge(job) for job in pending]
+
+    with ThreadPoolExecutor(max_workers=min(_MERGE_WORKERS, len(pending))) as executor:
+        return list(executor.map(merge, pending))
+
 
+def _stage_scratch_copy(current_path: Path, ours_bytes: bytes) -> Path:
+    """Write a scratch copy of current_path for git merge-file to merge into.
 
-def _walk_dir(directory: Path, root: Path | None = None) -> list[str]:
-    """Recursively walk a directory and return relative paths of all files."""
-    root_dir = root or directory
+    The copy sits next to the target, with the target's mode, so the merged
+    result can be renamed into place. Falls back to the temp dir when the
+    target's directory is not writable.
+    """
+    tmp_current = current_path.with_name(f"{current_path.name}.{uuid.uuid4().hex[:8]}.g2tmp")
+    try:
+        tmp_current.write_bytes(ours_bytes)
+        shutil.copymode(current_path, tmp_current)
+    except OSError:
+        tmp_current.unlink(missing_ok=True)
+        tmp_current = Path(tempfile.gettempdir()) / f"g2-update-{uuid.uuid4()}-{current_path.name}"
+        tmp_current.write_bytes(ours_bytes)
+    return tmp_current
+
+
+def _install_scratch_copy(tmp_current: Path, current_path: Path) -> None:
+    """Move a merged scratch copy over its target, copying across filesystems or through symlinks."""
+    if not current_path.is_symlink():
+        try:
+            os.replace(tmp_current, current_path)
+            return
+        except OSError:
+            pass
+    # copyfile, not copy2: keep current's own mode rather than the scratch file's
+    shutil.copyfile(tmp_current, current_path)
+    tmp_current.unlink()
+
+
+def _walk_dir(directory: Path) -> list[str]:
+    """Walk a directory tree and return relative paths of all files.
+
+    Uses os.walk, whose scandir-backed entries carry the file type, so no
+    per-entry stat or Path construction is needed.
+    """
+    base = str(directory)
     results: list[str] = []
-    for entry in directory.iterdir():
-        if entry.is_dir():
-            results.extend(_walk_dir(entry, root_dir))
+    # followlinks matches the previous Path.is_dir() traversal into symlinked dirs
+    for root, _dirs, files in os.walk(base, followlinks=True):
+        prefix = os.path.relpath(root, base)
+        if prefix == ".":
+            results.extend(files)
         else:
-            results.append(str(entry.relative_to(root_dir)))
+            results.extend(os.path.join(prefix, name) for name in files)
     return results
 
 
@@ -67,17 +138,28 @@ def preview_update(new_core_path: str | Path) -> UpdatePreview:
     files_changed: list[str] = []
     files_deleted: list[str] = []
 
+    # Settle what stat() can: files missing from base or differing in size are changed.
+    # Only the same-size remainder is hashed, in one batch.
+    changed: set[str] = set()
+    compared: set[str] = set()
+    base_root, new_root = str(base_dir), str(new_core_path)
     for rel_path in new_core_files:
-        base_path = base_dir / rel_path
-        new_path = new_core_path / rel_path
-
-        if not base_path.exists():
-            files_changed.append(rel_path)
+        try:
+            base_st = os.stat(os.path.join(base_root, rel_path))
+        except FileNotFoundError:
+            changed.add(rel_path)
             continue
+        new_st = os.stat(os.path.join(new_root, rel_path))
+        if base_st.st_size != new_st.st_size:
+            changed.add(rel_path)
+        else:
+            compared.add(rel_path)
+    hashes = compute_file_hashes([*(base_dir / p for p in compared), *(new_core_path / p for p in compared)])
 
-        base_hash = compute_file_hash(base_path)
-        new_hash = compute_file_hash(new_path)
-        if base_hash != new_hash:
+    for rel_path in new_core_files:
+        if rel_path in changed or (
+            rel_path in compared and hashes[base_dir / rel_path] != hashes[new_core_path / rel_path]
+        ):
             files_changed.append(rel_path)
 
     # Detect files deleted in the new core (exist in base but not in new_core_path)
@@ -133,21 +215,24 @@ def apply_update(new_core_path: str | Path) -> UpdateResult:
         )
 
     release_lock = acquire_lock()
+    pending: list[_PendingMerge] = []
 
     try:
         # --- Preview ---
         preview = preview_update(new_core_path)
 
         # --- Backup ---
+        root = str(project_root)
         files_to_backup = [
-            *[str(project_root / f) for f in preview.files_changed],
-            *[str(project_root / f) for f in preview.files_deleted],
+            *[os.path.join(root, f) for f in preview.files_changed],
+            *[os.path.join(root, f) for f in preview.files_deleted],
         ]
         create_backup(files_to_backup)
 
         # --- Three-way merge ---
         merge_conflicts: list[str] = []
 
+        # Prep pass: stage a scratch copy of each file that needs a real merge
         for rel_path in preview.files_changed:
             current_path = project_root / rel_path
             base_path = base_dir / rel_path
@@ -165,47 +250,52 @@ def apply_update(new_core_path: str | Path) -> UpdateResult:
                 shutil.copy2(current_path, base_path)
 
             # Three-way merge: current <- base -> new_core
-            # Save current content before merge overwrites it (needed for rerere stage 2 = "ours")
-            ours_content = current_path.read_text()
-            tmp_current = Path(tempfile.gettempdir()) / (f"g2-update-{uuid.uuid4()}-{Path(rel_path).name}")
-            shutil.copy2(current_path, tmp_current)
+            # Read current once: the bytes seed the scratch copy and, on conflict,
+            # become rerere stage 2 ("ours") -- git merge-file overwrites the scratch copy
+            ours_bytes = current_path.read_bytes()
+            tmp_current = _stage_scratch_copy(current_path, ours_bytes)
+            pending.append(_PendingMerge(rel_path, current_path, base_path, new_core_src_path, tmp_current, ours_bytes))
+
+        # Merge pass: each git merge-file only touches its own scratch file, so run them concurrently
+        results = _run_merges(pending)
+
+        # Post pass: rerere mutates the shared git index, so conflicts are handled serially
+        for job, result in zip(pending, results, strict=True):
+            rel_path = job.rel_path
+            current_path = job.current_path
+
+            # Conflict markers land in the working tree too, ready for rerere
+            _install_scratch_copy(job.tmp_current, current_path)
+            if result.clean:
+                continue
 
-            result = merge_file(tmp_current, base_path, new_core_src_path)
+            if is_git_repo():
+                # Base and theirs are only needed (and read) on the conflict path
+                base_content = job.base_path.read_text()
+                theirs_content = job.new_core_src_path.read_text()
 
-            if result.clean:
-                shutil.copy2(tmp_current, current_path)
-                tmp_current.unlink()
-            else:
-                # Copy conflict markers to working tree path before rerere
-                shutil.copy2(tmp_current, current_path)
-                tmp_current.unlink()
-
-                if is_git_repo():
-                    base_content = base_path.read_text()
-                    theirs_content = new_core_src_path.read_text()
-
-                    setup_rerere_adapter(rel_path, base_content, ours_content, theirs_content)
-                    auto_resolved = run_rerere(str(current_path))
-
-                    if auto_resolved:
-                        subprocess.run(
-                            ["git", "add", rel_path],
-                            capture_output=True,
-                            text=True,
-                            check=False,
-                        )
-                        subprocess.run(
-                            ["git", "rerere"],
-                            capture_output=True,
-                            text=True,
-                            check=False,
-                        )
-                        cleanup_merge_state(rel_path)
-                        continue
+                setup_rerere_adapter(rel_path, base_content, job.ours_bytes.decode(), theirs_content)
+                auto_resolved = run_rerere(str(current_path))
 
+                if auto_resolved:
+                    subprocess.run(
+                        ["git", "add", rel_path],
+                        capture_output=True,
+                        text=True,
+                        check=False,
+                    )
+                    subprocess.run(
+                        ["git", "rerere"],
+                        capture_output=True,
+                        text=True,
+                        check=False,
+                    )
                     cleanup_merge_state(rel_path)
+                    continue
+
+                cleanup_merge_state(rel_path)
 
-                merge_conflicts.append(rel_path)
+            merge_conflicts.append(rel_path)
 
         if merge_conflicts:
             # Preserve backup so user can resolve conflicts manually, then continue
@@ -224,32 +314,28 @@ def apply_update(new_core_path: str | Path) -> UpdateResult:
 
         # --- Remove deleted files ---
         for rel_path in preview.files_deleted:
-            current_path = project_root / rel_path
-            if current_path.exists():
-                current_path.unlink()
+            current_path = os.path.join(root, rel_path)
+            if os.path.exists(current_path):
+                os.unlink(current_path)
 
         # --- Re-apply custom patches ---
         custom_patch_failures: list[str] = []
         if state.custom_modifications:
+            patches: dict[Path, str] = {}
             for mod in state.custom_modifications:
                 patch_path = project_root / mod.patch_file
                 if not patch_path.exists():
                     custom_patch_failures.append(f"{mod.description}: patch file missing ({mod.patch_file})")
                     continue
-                try:
-                    subprocess.run(
-                        ["git", "apply", "--3way", str(patch_path)],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                        cwd=project_root,
-                    )
-                except Exception:
-                    custom_patch_failures.append(mod.description)
+                patches[patch_path] = mod.description
+            for failed_patch in apply_patches(list(patches), project_root):
+                custom_patch_failures.append(patches[failed_patch])
 
         # --- Record path remaps from update metadata ---
         remap_file = new_core_path / ".g2-meta" / "path_remap.yaml"
         if remap_file.exists():
+            import yaml
+
             remap = yaml.safe_load(remap_file.read_text())
             if remap and isinstance(remap, dict):
                 record_path_remap(remap)
@@ -261,10 +347,12 @@ def apply_update(new_core_path: str | Path) -> UpdateResult:
         copy_dir(new_core_path, base_dir)
 
         # --- Structured ops: re-apply from all skills ---
+        # One pass gathers the structured outcomes and the test commands run below
         all_npm_deps: dict[str, str] = {}
         all_env_additions: list[str] = []
         all_docker_services: dict[str, Any] = {}
         has_npm_deps = False
+        skill_tests: list[tuple[str, str]] = []
 
         for skill in state.applied_skills:
             outcomes = skill.structured_outcomes
@@ -278,6 +366,8 @@ def apply_update(new_core_path: str | Path) -> UpdateResult:
                 all_env_additions.extend(outcomes["env_additions"])
             if outcomes.get("docker_compose_services"):
                 all_docker_services.update(outcomes["docker_compose_services"])
+            if outcomes.get("test"):
+                skill_tests.append((skill.name, str(outcomes["test"])))
 
         if has_npm_deps:
             pkg_path = project_root / "package.json"
@@ -294,43 +384,12 @@ def apply_update(new_core_path: str | Path) -> UpdateResult:
         if has_npm_deps:
             run_npm_install()
 
-        # --- Run tests for each applied skill ---
-        skill_reapply_results: dict[str, bool] = {}
-
-        for skill in state.applied_skills:
-            outcomes = skill.structured_outcomes
-            if not outcomes or not outcomes.get("test"):
-                continue
-
-            test_cmd = str(outcomes["test"])
-            try:
-                subprocess.run(
-                    test_cmd,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=project_root,
-                    timeout=120,
-                )
-                skill_reapply_results[skill.name] = True
-            except Exception:
-                skill_reapply_results[skill.name] = False
-
         # --- Update state ---
         state.core_version = preview.new_version
         write_state(state)
 
         # --- Cleanup ---
         clear_backup()
-
-        return UpdateResult(
-            success=True,
-            previous_version=preview.current_version,
-            new_version=preview.new_version,
-            custom_patch_failures=custom_patch_failures if custom_patch_failures else None,
-            skill_reapply_results=skill_reapply_results if skill_reapply_results else None,
-        )
     except Exception as err:
         restore_backup()
         clear_backup()
@@ -341,4 +400,20 @@ def apply_update(new_core_path: str | Path) -> UpdateResult:
             error=str(err),
         )
     finally:
+        # Installed scratch copies were renamed away; drop any a failure left behind
+        for job in pending:
+            job.tmp_current.unlink(missing_ok=True)
         release_lock()
+
+    # --- Run tests for each applied skill ---
+    # The update is committed and test results are only reported, never rolled back,
+    # so tests run after the lock is released
+    skill_reapply_results = run_skill_tests(skill_tests, project_root)
+
+    return UpdateResult(
+        success=True,
+        previous_version=preview.current_version,
+        new_version=preview.new_version,
+        custom_patch_failures=custom_patch_failures if custom_patch_failures else None,
+        skill_reapply_results=skill_reapply_results if skill_reapply_results else None,
+    )
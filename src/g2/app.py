@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import os
 import signal
-from pathlib import Path
+import time
 
 from g2.execution.agent_executor import AgentExecutor
 from g2.execution.container_runner import ContainerRunner
@@ -13,6 +13,7 @@ from g2.execution.execution_queue import GroupQueue
 from g2.groups.types import RegisteredGroup
 from g2.infrastructure.config import (
     DATA_DIR,
+    GMAIL_CONFIG_DIR,
     GMAIL_GROUP_FOLDER,
     GMAIL_POLL_INTERVAL,
     GMAIL_TRIGGER_ADDRESS,
@@ -24,6 +25,7 @@ from g2.infrastructure.logger import logger
 from g2.ipc.transport import IpcTransport
 from g2.ipc.watcher import IpcDeps, IpcWatcher
 from g2.messaging.channel_registry import ChannelRegistry
+from g2.messaging.gmail.channel import GmailChannel
 from g2.messaging.poller import MessageProcessor
 from g2.messaging.repository import MessageRepository
 from g2.messaging.types import NewMessage
@@ -32,6 +34,9 @@ from g2.scheduling.snapshot_writer import AvailableGroup, SnapshotWriter
 from g2.scheduling.task_service import TaskManager
 from g2.sessions.manager import SessionManager
 
+# How long a built available-groups list is reused before SQLite is queried again
+AVAILABLE_GROUPS_TTL_S = 2.0
+
 
 class Orchestrator:
     """Composes all services and manages the application lifecycle."""
@@ -44,8 +49,11 @@ class Orchestrator:
         self._ipc_watcher = IpcWatcher()
         self._running = False
         self._registered_groups: dict[str, RegisteredGroup] = {}
+        # Reverse index of _registered_groups (folders are unique per group)
+        self._folder_to_jid: dict[str, str] = {}
         self._poll_handle = None
         self._scheduler_handle = None
+        self._available_groups_cache: tuple[float, list[AvailableGroup]] | None = None
 
     async def start(self) -> None:
         """Initialize all services and start the event loop."""
@@ -56,6 +64,7 @@ class Orchestrator:
 
         # Load registered groups
         self._registered_groups = self._db.group_repo.get_all_registered_groups()
+        self._folder_to_jid = {group.folder: jid for jid, group in self._registered_groups.items()}
         logger.info("Loaded registered groups", count=len(self._registered_groups))
 
         # Initialize session manager
@@ -100,12 +109,14 @@ class Orchestrator:
             send_media=self._send_media,
             registered_groups=lambda: self._registered_groups,
             register_group=self._register_group,
-            sync_group_metadata=self._channel_registry.sync_all_metadata,
+            sync_group_metadata=self._sync_group_metadata,
             get_available_groups=self._get_available_groups,
             write_groups_snapshot=snapshot_writer.write_groups,
             session_manager=session_manager,
             close_stdin=self._queue.close_stdin,
             task_manager=task_manager,
+            jid_for_folder=self._jid_for_folder,
+            wake_scheduler=self._wake_scheduler,
         )
         self._ipc_watcher.start(ipc_deps)
 
@@ -135,9 +146,13 @@ class Orchestrator:
 
         def on_message(chat_jid: str, msg: NewMessage) -> None:
             self._db.message_repo.store_message(msg)
+            # Poll now instead of at the next interval
+            if self._poll_handle:
+                self._poll_handle.wake()
 
         def on_chat_metadata(jid: str, timestamp: str, name: str | None, channel: str | None, is_group: bool | None) -> None:
             self._db.message_repo.upsert_chat(jid, timestamp, name, channel, is_group)
+            self._available_groups_cache = None
 
         # WhatsApp channel
         try:
@@ -156,11 +171,10 @@ class Orchestrator:
             logger.exception("Failed to set up WhatsApp channel")
 
         # Gmail channel (optional)
-        gmail_creds = Path.home() / ".gmail-mcp" / "credentials.json"
+        # GmailChannel imports the Google client libraries only when it connects
+        gmail_creds = GMAIL_CONFIG_DIR / "credentials.json"
         if gmail_creds.exists():
             try:
-                from g2.messaging.gmail.channel import GmailChannel
-
                 gmail_channel = GmailChannel(
                     on_message=on_message,
                     on_chat_metadata=on_chat_metadata,
@@ -191,25 +205,53 @@ class Orchestrator:
         else:
             logger.warning("No connected channel for media", jid=jid)
 
+    def _wake_scheduler(self) -> None:
+        if self._scheduler_handle:
+            self._scheduler_handle.wake()
+
     def _register_group(self, jid: str, group: RegisteredGroup) -> None:
+        previous = self._registered_groups.get(jid)
+        if previous is not None and self._folder_to_jid.get(previous.folder) == jid:
+            del self._folder_to_jid[previous.folder]
         self._registered_groups[jid] = group
+        self._folder_to_jid[group.folder] = jid
         self._db.group_repo.set_registered_group(jid, group)
+        self._available_groups_cache = None
         # Ensure group directory exists
         (GROUPS_DIR / group.folder).mkdir(parents=True, exist_ok=True)
 
+    def _jid_for_folder(self, folder: str) -> str | None:
+        return self._folder_to_jid.get(folder)
+
+    async def _sync_group_metadata(self, force: bool = False) -> None:
+        await self._channel_registry.sync_all_metadata(force)
+        self._available_groups_cache = None
+
     def _get_available_groups(self) -> list[AvailableGroup]:
-        """Get all known chats as available groups."""
+        """Get all known chats as available groups.
+
+        The list is reused for AVAILABLE_GROUPS_TTL_S, and rebuilt sooner after
+        chat metadata changes or a group is registered.
+        """
+        now = time.monotonic()
+        cached = self._available_groups_cache
+        if cached is not None and now - cached[0] < AVAILABLE_GROUPS_TTL_S:
+            return list(cached[1])
+
         chats = self._db.message_repo.get_all_chats()
-        return [
+        registered_jids = self._registered_groups.keys()
+        groups = [
             AvailableGroup(
                 jid=chat["jid"],
                 name=chat.get("name", ""),
                 last_activity=chat.get("last_message_time", ""),
-                is_registered=chat["jid"] in self._registered_groups,
+                is_registered=chat["jid"] in registered_jids,
             )
             for chat in chats
             if chat.get("is_group")
         ]
+        self._available_groups_cache = (now, groups)
+        return list(groups)
 
     async def shutdown(self) -> None:
         """Gracefully shut down all services."""
@@ -224,5 +266,8 @@ class Orchestrator:
         self._ipc_watcher.stop()
         await self._queue.shutdown()
         await self._channel_registry.disconnect_all()
+        # Commit router state writes still inside their debounce window
+        if self._db.state_repo:
+            self._db.state_repo.flush()
 
         logger.info("G2 shut down complete")
@@ -46,7 +46,7 @@ class AgentExecutor:
         # Write all snapshots for the container to read
         available_groups = self._get_available_groups()
         archives = self._session_manager.get_archives(group.folder)
-        self._snapshot_writer.prepare_for_execution(
+        await self._snapshot_writer.prepare_for_execution(
             group.folder,
             is_main,
             available_groups,
@@ -54,10 +54,18 @@ class AgentExecutor:
             [{"id": s["id"], "name": s["name"], "session_id": s["session_id"], "archived_at": s["archived_at"]} for s in archives],
         )
 
+        # Each set() commits to SQLite, so only record a session ID when it actually changes
+        recorded_session_id = session_id
+
+        def record_session(new_session_id: str | None) -> None:
+            nonlocal recorded_session_id
+            if new_session_id and new_session_id != recorded_session_id:
+                self._session_manager.set(group.folder, new_session_id)
+                recorded_session_id = new_session_id
+
         # Wrap onOutput to track session ID from streamed results
         async def wrapped_on_output(output: ContainerOutput) -> None:
-            if output.new_session_id:
-                self._session_manager.set(group.folder, output.new_session_id)
+            record_session(output.new_session_id)
             if on_output:
                 await on_output(output)
 
@@ -75,8 +83,7 @@ class AgentExecutor:
                 on_output=wrapped_on_output,
             )
 
-            if output.new_session_id:
-                self._session_manager.set(group.folder, output.new_session_id)
+            record_session(output.new_session_id)
 
             if output.status == "error":
                 logger.error("Container agent error", group=group.name, error=output.error)
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
+import logging
 import os
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
-from typing import Callable, Awaitable
+from pathlib import Path
 
 from g2.execution.container_runtime import ContainerRuntime, DockerRuntime
 from g2.execution.mount_builder import DefaultMountFactory, MountFactory
@@ -36,6 +39,37 @@ class ContainerInput:
 OnProcess = Callable[[asyncio.subprocess.Process, str], None]
 OnOutput = Callable[[ContainerOutput], Awaitable[None]]
 
+READ_CHUNK_SIZE = 65536
+SECRET_KEYS = ["ANTHROPIC_API_KEY", "CLAUDE_CODE_OAUTH_TOKEN"]
+
+
+async def read_line_batches(stream: asyncio.StreamReader) -> AsyncIterator[list[bytes]]:
+    """Yield the complete lines (without newlines) that arrive with each chunk read.
+
+    Reads up to READ_CHUNK_SIZE bytes per wakeup instead of awaiting line by line,
+    and has no line-length limit. A trailing partial line is yielded at EOF.
+    """
+    # Appending to a bytearray is amortized O(1); bytes concatenation would copy a long unterminated line per chunk
+    pending = bytearray()
+    while chunk := await stream.read(READ_CHUNK_SIZE):
+        pending += chunk
+        last_newline = chunk.rfind(b"\n")
+        if last_newline < 0:
+            continue
+        end = len(pending) - len(chunk) + last_newline
+        lines = bytes(pending[:end]).split(b"\n")
+        del pending[: end + 1]
+        yield lines
+    if pending:
+        yield [bytes(pending)]
+
+
+def _kill(proc: asyncio.subprocess.Process) -> None:
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass
+
 
 class ContainerRunner:
     """Runs agent containers and streams output."""
@@ -49,6 +83,39 @@ class ContainerRunner:
         self._runtime = runtime or DockerRuntime()
         self._mount_factory = mount_factory or DefaultMountFactory()
         self._timeout = timeout_config or TimeoutConfig()
+        self._env_file = Path.cwd() / ".env"
+        self._name_seq = itertools.count()
+        # (.env stat identity, secrets, "-e KEY=value" args) from the last read
+        self._secrets_cache: tuple[tuple[int, int, int] | None, dict[str, str], tuple[str, ...]] | None = None
+        # Hard timeout (seconds) per group timeout override; None means the runner default
+        self._hard_timeouts: dict[int | None, float] = {}
+
+    def _load_secrets(self) -> tuple[dict[str, str], tuple[str, ...]]:
+        """Return secrets from .env and their docker env args, re-reading only when the file changes."""
+        try:
+            st = os.stat(self._env_file)
+            key: tuple[int, int, int] | None = (st.st_ino, st.st_size, st.st_mtime_ns)
+        except OSError:
+            key = None
+
+        cached = self._secrets_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        secrets = read_env_file(SECRET_KEYS)
+        env_args = tuple(arg for name, value in secrets.items() for arg in ("-e", f"{name}={value}"))
+        self._secrets_cache = (key, secrets, env_args)
+        return secrets, env_args
+
+    def _hard_timeout_s(self, group: RegisteredGroup) -> float:
+        """Return the group's hard timeout in seconds, computed once per distinct timeout override."""
+        container_config = group.container_config
+        override = container_config.timeout if container_config else None
+        hard_timeout_s = self._hard_timeouts.get(override)
+        if hard_timeout_s is None:
+            hard_timeout_s = self._timeout.for_group(group).get_hard_timeout() / 1000
+            self._hard_timeouts[override] = hard_timeout_s
+        return hard_timeout_s
 
     async def run(
         self,
@@ -58,51 +125,46 @@ class ContainerRunner:
         on_output: OnOutput | None = None,
     ) -> ContainerOutput:
         """Run a container and return the final output."""
-        container_name = f"g2-{group.folder}-{int(time.time())}"
+        # Monotonic stamp plus a per-runner sequence: unique even for same-second launches
+        started_ns = time.monotonic_ns()
+        container_name = f"g2-{group.folder}-{started_ns:x}-{next(self._name_seq)}"
         is_main = input_data.is_main
 
         mount_args = self._mount_factory.build_mounts(group, is_main)
-        timeout = self._timeout.for_group(group)
-
-        # Read secrets from .env
-        secret_keys = ["ANTHROPIC_API_KEY", "CLAUDE_CODE_OAUTH_TOKEN"]
-        secrets = read_env_file(secret_keys)
-
-        env_args: list[str] = []
-        for key, value in secrets.items():
-            env_args.extend(["-e", f"{key}={value}"])
+        hard_timeout_s = self._hard_timeout_s(group)
 
-        # Group-specific env vars
-        env_args.extend(["-e", f"G2_GROUP_FOLDER={group.folder}"])
-        env_args.extend(["-e", f"G2_IS_MAIN={'1' if is_main else '0'}"])
-        env_args.extend(["-e", f"G2_CHAT_JID={input_data.chat_jid}"])
+        # Read secrets from .env (cached until the file changes; keys with empty values are skipped)
+        secrets, secret_env_args = self._load_secrets()
 
-        container_args = [
+        # Built in one pass: secrets, then group-specific env vars
+        container_args = (
             "run", "-i", "--rm",
             "--name", container_name,
             *mount_args,
-            *env_args,
+            *secret_env_args,
+            "-e", f"G2_GROUP_FOLDER={group.folder}",
+            "-e", f"G2_IS_MAIN={'1' if is_main else '0'}",
+            "-e", f"G2_CHAT_JID={input_data.chat_jid}",
             CONTAINER_IMAGE,
-        ]
-
-        logger.info(
-            "Starting container",
-            name=container_name,
-            group=group.name,
-            image=CONTAINER_IMAGE,
         )
 
+        # The bound logger does not filter by level itself, so check the root level before debug records.
+        # Stderr is only ever logged at debug level; otherwise discard it without a pipe or reader task.
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Starting container", name=container_name, group=group.name, image=CONTAINER_IMAGE)
+
         proc = await asyncio.create_subprocess_exec(
             self._runtime.bin, *container_args,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE if debug_enabled else asyncio.subprocess.DEVNULL,
         )
 
         if on_process:
             on_process(proc, container_name)
 
-        # Write input JSON to stdin
+        # Write input JSON to stdin: compact, with non-ASCII prompt text as raw UTF-8 rather than \u escapes
         stdin_data = json.dumps({
             "prompt": input_data.prompt,
             "sessionId": input_data.session_id,
@@ -111,7 +173,7 @@ class ContainerRunner:
             "isMain": input_data.is_main,
             "isScheduledTask": input_data.is_scheduled_task,
             "secrets": secrets,
-        }).encode()
+        }, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
         assert proc.stdin is not None
         proc.stdin.write(stdin_data)
@@ -121,43 +183,61 @@ class ContainerRunner:
         parser = ContainerOutputParser()
         last_output = ContainerOutput(status="success", result=None)
 
-        async def read_stdout() -> None:
+        async def handle_outputs(outputs: list[ContainerOutput]) -> None:
             nonlocal last_output
+            for output in outputs:
+                last_output = output
+                if on_output:
+                    await on_output(output)
+
+        async def read_stdout() -> None:
             assert proc.stdout is not None
-            async for raw_line in proc.stdout:
-                line = raw_line.decode(errors="replace")
-                output = parser.feed(line)
-                if output:
-                    last_output = output
-                    if on_output:
-                        await on_output(output)
+            # The parser scans raw chunks for marker lines; stdout is never split into lines here
+            while chunk := await proc.stdout.read(READ_CHUNK_SIZE):
+                await handle_outputs(parser.feed_chunk(chunk))
+            await handle_outputs(parser.finish())
 
         async def read_stderr() -> None:
             assert proc.stderr is not None
-            async for raw_line in proc.stderr:
-                line = raw_line.decode(errors="replace").rstrip()
-                if line:
-                    logger.debug("Container stderr", name=container_name, line=line)
+            async for raw_lines in read_line_batches(proc.stderr):
+                # One decode and one log record per read rather than per line
+                text = b"\n".join(raw_lines).decode(errors="replace").rstrip()
+                if text:
+                    logger.debug("Container stderr", name=container_name, line=text)
 
         # Run stdout/stderr readers and wait for process to finish
-        hard_timeout_s = timeout.get_hard_timeout() / 1000
 
         try:
-            await asyncio.wait_for(
-                asyncio.gather(read_stdout(), read_stderr(), proc.wait()),
-                timeout=hard_timeout_s,
-            )
-        except asyncio.TimeoutError:
+            # On timeout (or a reader failing) the task group cancels the remaining readers
+            async with asyncio.timeout(hard_timeout_s):
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(read_stdout())
+                    if debug_enabled:
+                        tg.create_task(read_stderr())
+                    tg.create_task(proc.wait())
+        except TimeoutError:
             logger.warning("Container hard timeout, killing", name=container_name)
-            try:
-                proc.kill()
-            except ProcessLookupError:
-                pass
+            _kill(proc)
             last_output = ContainerOutput(status="error", error="Container timeout")
+        except BaseException as err:
+            # Any other failure (e.g. an on_output callback raising) must not leave the container running
+            _kill(proc)
+            # Callers expect the original error, not the task group's wrapper around it
+            if isinstance(err, BaseExceptionGroup) and len(err.exceptions) == 1:
+                raise err.exceptions[0] from None
+            raise
 
         return_code = proc.returncode
         if return_code and return_code != 0 and last_output.status != "error":
             logger.warning("Container exited with error", name=container_name, code=return_code)
 
-        logger.info("Container finished", name=container_name, status=last_output.status)
+        # One lifecycle record per launch, emitted at the end with everything the start record carried
+        logger.info(
+            "Container finished",
+            name=container_name,
+            group=group.name,
+            image=CONTAINER_IMAGE,
+            status=last_output.status,
+            duration_ms=(time.monotonic_ns() - started_ns) // 1_000_000,
+        )
         return last_output
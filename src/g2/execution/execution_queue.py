@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import math
+import os
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Callable, Awaitable
 
@@ -13,6 +14,17 @@ from g2.ipc.transport import IpcTransport
 
 MAX_RETRIES = 5
 BASE_RETRY_S = 5.0
+MAX_BACKOFF_SHIFT = 10  # Caps the backoff at BASE_RETRY_S * 1024 should MAX_RETRIES grow
+CONTAINERS_PER_CPU = 2
+
+
+def default_concurrency_limit() -> int:
+    """MAX_CONCURRENT_CONTAINERS, capped by the CPUs this process may run on."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS
+        cpus = os.cpu_count() or 1
+    return max(1, min(MAX_CONCURRENT_CONTAINERS, cpus * CONTAINERS_PER_CPU))
 
 
 @dataclass
@@ -26,24 +38,45 @@ class QueuedTask:
 class GroupState:
     active: bool = False
     pending_messages: bool = False
-    pending_tasks: list[QueuedTask] = field(default_factory=list)
+    pending_tasks: deque[QueuedTask] = field(default_factory=deque)
+    pending_task_ids: set[str] = field(default_factory=set)
     process: asyncio.subprocess.Process | None = None
     container_name: str | None = None
     group_folder: str | None = None
     retry_count: int = 0
+    # A message run has been created but has not started yet
+    run_scheduled: bool = False
 
 
 class GroupQueue:
     """Per-group execution queue with global concurrency limiting."""
 
-    def __init__(self, transport: IpcTransport | None = None) -> None:
+    def __init__(self, transport: IpcTransport | None = None, max_concurrent: int | None = None) -> None:
         self._groups: dict[str, GroupState] = {}
         self._active_count = 0
-        self._waiting_groups: set[str] = set()
+        self._max_concurrent = max_concurrent if max_concurrent is not None else default_concurrency_limit()
+        # Groups held back by the concurrency limit, drained in arrival order
+        self._waiting_order: deque[str] = deque()
+        self._waiting_set: set[str] = set()
         self._process_messages_fn: Callable[[str], Awaitable[bool]] | None = None
-        self._shutting_down = False
+        self._shutdown_evt = asyncio.Event()
         self._transport = transport or IpcTransport()
 
+    @property
+    def _shutting_down(self) -> bool:
+        return self._shutdown_evt.is_set()
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    def set_max_concurrent(self, limit: int) -> None:
+        """Change the global container limit at runtime. Raising it starts waiting groups right away."""
+        self._max_concurrent = max(1, limit)
+        logger.info("Concurrency limit changed", max_concurrent=self._max_concurrent)
+        if not self._shutting_down:
+            self._drain_waiting()
+
     def _get_group(self, group_jid: str) -> GroupState:
         state = self._groups.get(group_jid)
         if not state:
@@ -60,18 +93,23 @@ class GroupQueue:
 
         state = self._get_group(group_jid)
 
+        # Coalesce bursts: a run about to start reads every new message anyway,
+        # and an already-flagged group needs nothing more
+        if state.run_scheduled or (state.pending_messages and (state.active or group_jid in self._waiting_set)):
+            return
+
         if state.active:
             state.pending_messages = True
             logger.debug("Container active, message queued", group_jid=group_jid)
             return
 
-        if self._active_count >= MAX_CONCURRENT_CONTAINERS:
+        if self._active_count >= self._max_concurrent:
             state.pending_messages = True
-            self._waiting_groups.add(group_jid)
+            self._add_waiting(group_jid)
             logger.debug("At concurrency limit, message queued", group_jid=group_jid, active=self._active_count)
             return
 
-        asyncio.create_task(self._run_for_group(group_jid, "messages"))
+        self._schedule_message_run(group_jid, state, "messages")
 
     def enqueue_task(self, group_jid: str, task_id: str, fn: Callable[[], Awaitable[None]]) -> None:
         if self._shutting_down:
@@ -79,23 +117,50 @@ class GroupQueue:
 
         state = self._get_group(group_jid)
 
-        if any(t.id == task_id for t in state.pending_tasks):
+        if task_id in state.pending_task_ids:
             logger.debug("Task already queued, skipping", group_jid=group_jid, task_id=task_id)
             return
 
         if state.active:
-            state.pending_tasks.append(QueuedTask(id=task_id, group_jid=group_jid, fn=fn))
+            self._queue_task(state, QueuedTask(id=task_id, group_jid=group_jid, fn=fn))
             self.close_stdin(group_jid)
             logger.debug("Container active, task queued — closing idle container", group_jid=group_jid, task_id=task_id)
             return
 
-        if self._active_count >= MAX_CONCURRENT_CONTAINERS:
-            state.pending_tasks.append(QueuedTask(id=task_id, group_jid=group_jid, fn=fn))
-            self._waiting_groups.add(group_jid)
+        if self._active_count >= self._max_concurrent:
+            self._queue_task(state, QueuedTask(id=task_id, group_jid=group_jid, fn=fn))
+            self._add_waiting(group_jid)
             logger.debug("At concurrency limit, task queued", group_jid=group_jid, task_id=task_id)
             return
 
-        asyncio.create_task(self._run_task(group_jid, QueuedTask(id=task_id, group_jid=group_jid, fn=fn)))
+        self._schedule_task_run(group_jid, QueuedTask(id=task_id, group_jid=group_jid, fn=fn))
+
+    # Runs count against the limit from the moment they are scheduled, not when their
+    # coroutine first runs, so draining several waiters in one pass stops at the limit
+    def _schedule_message_run(self, group_jid: str, state: GroupState, reason: str) -> None:
+        state.run_scheduled = True
+        self._active_count += 1
+        asyncio.create_task(self._run_for_group(group_jid, reason))
+
+    def _schedule_task_run(self, group_jid: str, task: QueuedTask) -> None:
+        self._active_count += 1
+        asyncio.create_task(self._run_task(group_jid, task))
+
+    def _add_waiting(self, group_jid: str) -> None:
+        if group_jid not in self._waiting_set:
+            self._waiting_set.add(group_jid)
+            self._waiting_order.append(group_jid)
+
+    @staticmethod
+    def _queue_task(state: GroupState, task: QueuedTask) -> None:
+        state.pending_tasks.append(task)
+        state.pending_task_ids.add(task.id)
+
+    @staticmethod
+    def _dequeue_task(state: GroupState) -> QueuedTask:
+        task = state.pending_tasks.popleft()
+        state.pending_task_ids.discard(task.id)
+        return task
 
     def register_process(
         self,
@@ -125,8 +190,8 @@ class GroupQueue:
     async def _run_for_group(self, group_jid: str, reason: str) -> None:
         state = self._get_group(group_jid)
         state.active = True
+        state.run_scheduled = False
         state.pending_messages = False
-        self._active_count += 1
 
         logger.debug("Starting container for group", group_jid=group_jid, reason=reason, active=self._active_count)
 
@@ -151,7 +216,6 @@ class GroupQueue:
     async def _run_task(self, group_jid: str, task: QueuedTask) -> None:
         state = self._get_group(group_jid)
         state.active = True
-        self._active_count += 1
 
         logger.debug("Running queued task", group_jid=group_jid, task_id=task.id, active=self._active_count)
 
@@ -178,12 +242,14 @@ class GroupQueue:
             state.retry_count = 0
             return
 
-        delay_s = BASE_RETRY_S * math.pow(2, state.retry_count - 1)
+        delay_s = BASE_RETRY_S * (1 << min(state.retry_count - 1, MAX_BACKOFF_SHIFT))
         logger.info("Scheduling retry with backoff", group_jid=group_jid, retry_count=state.retry_count, delay_s=delay_s)
 
         async def retry_later() -> None:
-            await asyncio.sleep(delay_s)
-            if not self._shutting_down:
+            # Wake early and give up if shutdown starts during the backoff
+            try:
+                await asyncio.wait_for(self._shutdown_evt.wait(), timeout=delay_s)
+            except TimeoutError:
                 self.enqueue_message_check(group_jid)
 
         asyncio.create_task(retry_later())
@@ -196,32 +262,28 @@ class GroupQueue:
 
         # Tasks first (they won't be re-discovered from SQLite like messages)
         if state.pending_tasks:
-            task = state.pending_tasks.pop(0)
-            asyncio.create_task(self._run_task(group_jid, task))
+            self._schedule_task_run(group_jid, self._dequeue_task(state))
             return
 
         if state.pending_messages:
-            asyncio.create_task(self._run_for_group(group_jid, "drain"))
+            self._schedule_message_run(group_jid, state, "drain")
             return
 
         self._drain_waiting()
 
     def _drain_waiting(self) -> None:
-        for next_jid in list(self._waiting_groups):
-            if self._active_count >= MAX_CONCURRENT_CONTAINERS:
-                break
-
-            self._waiting_groups.discard(next_jid)
+        while self._waiting_order and self._active_count < self._max_concurrent:
+            next_jid = self._waiting_order.popleft()
+            self._waiting_set.discard(next_jid)
             state = self._get_group(next_jid)
 
             if state.pending_tasks:
-                task = state.pending_tasks.pop(0)
-                asyncio.create_task(self._run_task(next_jid, task))
+                self._schedule_task_run(next_jid, self._dequeue_task(state))
             elif state.pending_messages:
-                asyncio.create_task(self._run_for_group(next_jid, "drain"))
+                self._schedule_message_run(next_jid, state, "drain")
 
     async def shutdown(self, grace_period_s: float = 5.0) -> None:
-        self._shutting_down = True
+        self._shutdown_evt.set()
 
         active_containers: list[str] = []
         for _jid, state in self._groups.items():
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import Protocol
 
-from g2.execution.mount_security import MountAllowlist, load_mount_allowlist, validate_mount
+from g2.execution.mount_security import ResolvedAllowlist, get_resolved_allowlist, validate_resolved_mount
 from g2.groups.paths import GroupPaths
 from g2.groups.types import AdditionalMount, RegisteredGroup
 from g2.infrastructure.config import CONTAINER_IMAGE, DATA_DIR, GROUPS_DIR, MAIN_GROUP_FOLDER
 from g2.infrastructure.logger import logger
 
+MAIN_CLAUDE_MD_TTL_S = 5.0
+# How long a resolved additional-mount host path is reused before symlinks are walked again
+HOST_PATH_TTL_S = 5.0
+
 
 class MountFactory(Protocol):
     """Interface for building container mount arguments."""
@@ -19,48 +24,97 @@ class MountFactory(Protocol):
 
 
 class DefaultMountFactory:
-    """Builds Docker -v mount arguments for container execution."""
+    """Builds Docker -v mount arguments for container execution.
 
-    def __init__(self) -> None:
-        self._allowlist = load_mount_allowlist()
+    The mount allowlist is not read here: build_mounts fetches the mtime-cached resolved allowlist only when a group
+    has additional mounts.
+    """
 
-    def build_mounts(self, group: RegisteredGroup, is_main: bool) -> list[str]:
-        mounts: list[str] = []
-        group_dir = GroupPaths.group_dir(group.folder)
-        group_dir.mkdir(parents=True, exist_ok=True)
+    __slots__ = (
+        "_main_claude_md_exists",
+        "_main_claude_md_checked_at",
+        "_known_dirs",
+        "_static_mounts",
+        "_resolved_hosts",
+    )
 
-        # Mount group's directory as /workspace/group
-        mounts.extend(["-v", f"{group_dir}:/workspace/group"])
+    def __init__(self) -> None:
+        # Whether the main group's CLAUDE.md exists, and when that was last checked
+        self._main_claude_md_exists = False
+        self._main_claude_md_checked_at: float | None = None
+        # Directories this factory has already created (or found existing)
+        self._known_dirs: set[Path] = set()
+        # Folder -> its fixed mount args, see _folder_mounts
+        self._static_mounts: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+        # Configured host path -> (expanded and resolved path, when it was resolved)
+        self._resolved_hosts: dict[str, tuple[str, float]] = {}
+
+    def _ensure_dir(self, path: Path) -> None:
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+
+    def _resolve_host(self, host_path: str) -> str:
+        now = time.monotonic()
+        cached = self._resolved_hosts.get(host_path)
+        if cached is not None and now - cached[1] < HOST_PATH_TTL_S:
+            return cached[0]
+        resolved = str(Path(host_path).expanduser().resolve())
+        self._resolved_hosts[host_path] = (resolved, now)
+        return resolved
+
+    def _has_main_claude_md(self, path: Path) -> bool:
+        now = time.monotonic()
+        checked_at = self._main_claude_md_checked_at
+        if checked_at is None or now - checked_at >= MAIN_CLAUDE_MD_TTL_S:
+            self._main_claude_md_exists = path.exists()
+            self._main_claude_md_checked_at = now
+        return self._main_claude_md_exists
+
+    def _folder_mounts(self, folder: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Mount args that depend only on the folder: (group and IPC pairs, sessions pair), built once per folder."""
+        cached = self._static_mounts.get(folder)
+        if cached is None:
+            group_dir = GroupPaths.group_dir(folder)
+            ipc_dir = GroupPaths.ipc_dir(folder)
+            sessions_dir = GroupPaths.sessions_dir(folder)
+            for path in (group_dir, ipc_dir, sessions_dir):
+                self._ensure_dir(path)
+            cached = (
+                # Group's directory as /workspace/group, then its IPC directory
+                ("-v", f"{group_dir}:/workspace/group", "-v", f"{ipc_dir}:/workspace/ipc"),
+                # Sessions directory
+                ("-v", f"{sessions_dir}:/home/node/.claude"),
+            )
+            self._static_mounts[folder] = cached
+        return cached
 
-        # Mount IPC directories
-        ipc_dir = GroupPaths.ipc_dir(group.folder)
-        ipc_dir.mkdir(parents=True, exist_ok=True)
-        mounts.extend(["-v", f"{ipc_dir}:/workspace/ipc"])
+    def build_mounts(self, group: RegisteredGroup, is_main: bool) -> list[str]:
+        head, sessions = self._folder_mounts(group.folder)
+        mounts = list(head)
 
         # Mount main group's CLAUDE.md as global context (for non-main groups)
         if not is_main:
             main_claude_md = GROUPS_DIR / MAIN_GROUP_FOLDER / "CLAUDE.md"
-            if main_claude_md.exists():
+            if self._has_main_claude_md(main_claude_md):
                 mounts.extend(["-v", f"{main_claude_md}:/workspace/global/CLAUDE.md:ro"])
 
-        # Mount sessions directory
-        sessions_dir = GroupPaths.sessions_dir(group.folder)
-        sessions_dir.mkdir(parents=True, exist_ok=True)
-        mounts.extend(["-v", f"{sessions_dir}:/home/node/.claude"])
+        mounts.extend(sessions)
 
         # Process additional mounts from container config
         if group.container_config and group.container_config.additional_mounts:
+            allowlist = get_resolved_allowlist()
             for mount in group.container_config.additional_mounts:
-                self._add_validated_mount(mounts, mount, is_main)
+                self._add_validated_mount(mounts, mount, allowlist, is_main)
 
         return mounts
 
     def _add_validated_mount(
-        self, mounts: list[str], mount: AdditionalMount, is_main: bool
+        self, mounts: list[str], mount: AdditionalMount, allowlist: ResolvedAllowlist | None, is_main: bool
     ) -> None:
-        host_path = str(Path(mount.host_path).expanduser().resolve())
+        host_path = self._resolve_host(mount.host_path)
 
-        allowed, force_ro = validate_mount(host_path, self._allowlist, is_main)
+        allowed, force_ro = validate_resolved_mount(host_path, allowlist, is_main)
         if not allowed:
             logger.warning("Mount blocked by allowlist", host_path=host_path)
             return
@@ -2,26 +2,122 @@
 
 from __future__ import annotations
 
-import json
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
 
 from g2.groups.types import AllowedRoot, MountAllowlist
 from g2.infrastructure.config import MOUNT_ALLOWLIST_PATH
 from g2.infrastructure.logger import logger
 
+# Path-segment trie of allowed roots: segment -> child node, with allow_read_write under the None key at a root
+RootTrie = dict[str | None, Any]
+
+
+@dataclass(frozen=True)
+class ResolvedAllowlist:
+    """Mount allowlist with paths expanded and resolved up front, so validation does no filesystem work."""
+
+    root_trie: RootTrie
+    blocked: frozenset[str]  # home-expanded blocked patterns
+    blocked_lengths: tuple[int, ...]  # distinct lengths of the blocked patterns
+    non_main_read_only: bool
+
+
+def _path_segments(path: str) -> list[str]:
+    return path.split("/")[1:]
+
+
+def _build_root_trie(roots: list[tuple[str, bool]]) -> RootTrie:
+    """Insert roots in allowlist order. A root under an earlier root is dropped: the earlier one always matches first."""
+    trie: RootTrie = {}
+    for path, allow_read_write in roots:
+        node = trie
+        for segment in _path_segments(path):
+            if None in node:
+                break
+            node = node.setdefault(segment, {})
+        else:
+            node.setdefault(None, allow_read_write)
+    return trie
+
+
+def _match_root(trie: RootTrie, path: str) -> bool | None:
+    """Return allow_read_write for the root covering path, or None. The deepest root on the path was listed first."""
+    node = trie
+    match: bool | None = None
+    for segment in _path_segments(path):
+        node = node.get(segment)
+        if node is None:
+            break
+        if None in node:
+            match = node[None]
+    return match
+
+
+# (allowlist file stat identity, parsed allowlist, resolved allowlist) from the last load; None identity means no file
+_allowlist_cache: tuple[tuple[int, int, int] | None, MountAllowlist | None, ResolvedAllowlist | None] | None = None
+
 
 def load_mount_allowlist() -> MountAllowlist | None:
     """Load mount allowlist from config file. Returns None if not found."""
-    if not MOUNT_ALLOWLIST_PATH.exists():
+    try:
+        raw = MOUNT_ALLOWLIST_PATH.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError:
+        logger.warning("Failed to read mount allowlist", path=str(MOUNT_ALLOWLIST_PATH))
         return None
     try:
-        data = json.loads(MOUNT_ALLOWLIST_PATH.read_text())
-        return MountAllowlist(**data)
-    except Exception:
+        return MountAllowlist.model_validate_json(raw)
+    except ValidationError:
         logger.warning("Failed to load mount allowlist", path=str(MOUNT_ALLOWLIST_PATH))
         return None
 
 
+def _cached_allowlist() -> tuple[MountAllowlist | None, ResolvedAllowlist | None]:
+    """Return the parsed and resolved allowlist, re-reading the file only when it changes."""
+    global _allowlist_cache
+    try:
+        st = MOUNT_ALLOWLIST_PATH.stat()
+        key: tuple[int, int, int] | None = (st.st_ino, st.st_size, st.st_mtime_ns)
+    except OSError:
+        key = None
+
+    cached = _allowlist_cache
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    allowlist = load_mount_allowlist() if key is not None else None
+    resolved = resolve_allowlist(allowlist) if allowlist is not None else None
+    _allowlist_cache = (key, allowlist, resolved)
+    return allowlist, resolved
+
+
+def get_mount_allowlist() -> MountAllowlist | None:
+    """Return the mount allowlist, re-reading and re-parsing the file only when it changes."""
+    return _cached_allowlist()[0]
+
+
+def get_resolved_allowlist() -> ResolvedAllowlist | None:
+    """Return the mount allowlist in resolved form, rebuilt only when the file changes."""
+    return _cached_allowlist()[1]
+
+
+def resolve_allowlist(allowlist: MountAllowlist) -> ResolvedAllowlist:
+    """Expand and resolve allowlist paths once, so each mount check does no filesystem work for them."""
+    roots = [(str(Path(_expand_home(root.path)).resolve()), root.allow_read_write) for root in allowlist.allowed_roots]
+    blocked = frozenset(_expand_home(pattern) for pattern in allowlist.blocked_patterns)
+    return ResolvedAllowlist(
+        root_trie=_build_root_trie(roots),
+        blocked=blocked,
+        blocked_lengths=tuple(sorted({len(pattern) for pattern in blocked})),
+        non_main_read_only=allowlist.non_main_read_only,
+    )
+
+
 def _expand_home(p: str) -> str:
     """Expand ~ to home directory."""
     if p.startswith("~"):
@@ -31,7 +127,7 @@ def _expand_home(p: str) -> str:
 
 def validate_mount(
     host_path: str,
-    allowlist: MountAllowlist | None,
+    allowlist: MountAllowlist | ResolvedAllowlist | None,
     is_main: bool,
 ) -> tuple[bool, bool]:
     """Validate a mount path against the allowlist.
@@ -40,24 +136,26 @@ def validate_mount(
         allowed: True if the mount is permitted.
         read_only: True if the mount should be read-only.
     """
+    if isinstance(allowlist, MountAllowlist):
+        allowlist = resolve_allowlist(allowlist)
+    return validate_resolved_mount(str(Path(_expand_home(host_path)).resolve()), allowlist, is_main)
+
+
+def validate_resolved_mount(resolved: str, allowlist: ResolvedAllowlist | None, is_main: bool) -> tuple[bool, bool]:
+    """validate_mount for a host path that is already absolute and resolved."""
     if allowlist is None:
         return True, True  # No allowlist = allow but read-only
 
-    resolved = str(Path(_expand_home(host_path)).resolve())
-
-    # Check blocked patterns
-    for pattern in allowlist.blocked_patterns:
-        expanded = _expand_home(pattern)
-        if resolved.startswith(expanded) or resolved == expanded:
-            return False, True
+    # Check blocked patterns (plain string prefixes): one set lookup per distinct pattern length
+    if any(resolved[:length] in allowlist.blocked for length in allowlist.blocked_lengths):
+        return False, True
 
-    # Check allowed roots
-    for root in allowlist.allowed_roots:
-        root_path = str(Path(_expand_home(root.path)).resolve())
-        if resolved.startswith(root_path + "/") or resolved == root_path:
-            read_only = not root.allow_read_write
-            if not is_main and allowlist.non_main_read_only:
-                read_only = True
-            return True, read_only
+    # Check allowed roots: a single descent of the root trie
+    allow_read_write = _match_root(allowlist.root_trie, resolved)
+    if allow_read_write is None:
+        return False, True
 
-    return False, True
+    read_only = not allow_read_write
+    if not is_main and allowlist.non_main_read_only:
+        read_only = True
+    return True, read_only
@@ -8,6 +8,32 @@ from typing import Any
 
 OUTPUT_START_MARKER = "---G2_OUTPUT_START---"
 OUTPUT_END_MARKER = "---G2_OUTPUT_END---"
+# Marker lines as found in the raw stream: the newline ending the previous line, then the marker
+_START_LINE = b"\n" + OUTPUT_START_MARKER.encode()
+_END_LINE = b"\n" + OUTPUT_END_MARKER.encode()
+_CR = ord("\r")
+_LF = ord("\n")
+
+
+def _find_marker_line(buf: bytearray, needle: bytes, start: int) -> tuple[int, int]:
+    """Find a marker line in buf. Returns (index of needle, index of the newline closing the line).
+
+    The index is -1 if there is no match. The closing index is -1 if the match runs to the end of buf,
+    so it is not yet known whether the line holds only the marker.
+    """
+    size = len(buf)
+    while True:
+        at = buf.find(needle, start)
+        if at < 0:
+            return -1, -1
+        eol = at + len(needle)
+        while eol < size and buf[eol] == _CR:
+            eol += 1
+        if eol == size:
+            return at, -1
+        if buf[eol] == _LF:
+            return at, eol
+        start = at + 1
 
 
 @dataclass
@@ -19,36 +45,83 @@ class ContainerOutput:
 
 
 class ContainerOutputParser:
-    """Stateful parser that accumulates lines between OUTPUT_START and OUTPUT_END markers.
+    """Stateful parser that extracts the JSON blocks between OUTPUT_START and OUTPUT_END marker lines.
 
-    Calls the callback with each complete ContainerOutput.
+    Works on the raw stdout byte stream: marker lines are located with bytes.find over a rolling buffer,
+    so lines outside output blocks are never split out or decoded.
     """
 
     def __init__(self) -> None:
         self._collecting = False
-        self._buffer: list[str] = []
+        # Starts with a newline so a marker on the very first line is found like any other
+        self._stream = bytearray(b"\n")
+        # While collecting, where to resume the search for the end marker
+        self._scan_from = 0
 
     def feed(self, line: str) -> ContainerOutput | None:
         """Feed a line of stdout. Returns a ContainerOutput if a complete block was parsed."""
-        stripped = line.rstrip("\n").rstrip("\r")
+        data = line.encode()
+        if not data.endswith(b"\n"):
+            data += b"\n"
+        outputs = self.feed_chunk(data)
+        return outputs[-1] if outputs else None
 
-        if stripped == OUTPUT_START_MARKER:
-            self._collecting = True
-            self._buffer = []
-            return None
+    def feed_chunk(self, chunk: bytes) -> list[ContainerOutput]:
+        """Feed raw stdout bytes, split at any point. Returns the outputs completed by this chunk."""
+        buf = self._stream
+        buf += chunk
+        outputs: list[ContainerOutput] = []
+        while True:
+            if not self._collecting:
+                at, eol = _find_marker_line(buf, _START_LINE, 0)
+                end_at, end_eol = _find_marker_line(buf, _END_LINE, 0)
+                if end_at >= 0 and (at < 0 or end_at < at):
+                    # A stray end marker closes an empty block, which reports a parse error as the line parser did
+                    if end_eol < 0:
+                        del buf[:end_at]
+                        return outputs
+                    outputs.append(self._parse_output(b""))
+                    del buf[:end_eol]
+                    continue
+                if at < 0:
+                    # Only a marker line split across chunks needs the buffered bytes
+                    del buf[: -(len(_START_LINE) - 1)]
+                    return outputs
+                if eol < 0:
+                    del buf[:at]
+                    return outputs
+                del buf[:eol]  # keep the newline: the block's content starts after it
+                self._collecting = True
+                self._scan_from = 0
+                continue
 
-        if stripped == OUTPUT_END_MARKER:
+            at, eol = _find_marker_line(buf, _END_LINE, self._scan_from)
+            if eol < 0:
+                self._scan_from = at if at >= 0 else max(0, len(buf) - len(_END_LINE) + 1)
+                return outputs
+            # json.loads takes the bytearray slice as-is: one copy of the block, no join or decode first
+            outputs.append(self._parse_output(buf[self._block_start(buf, at) : at]))
+            del buf[:eol]
             self._collecting = False
-            raw = "\n".join(self._buffer)
-            self._buffer = []
-            return self._parse_output(raw)
 
-        if self._collecting:
-            self._buffer.append(stripped)
+    def finish(self) -> list[ContainerOutput]:
+        """Signal end of stream, completing a marker line left without a trailing newline."""
+        return self.feed_chunk(b"\n")
 
-        return None
+    @staticmethod
+    def _block_start(buf: bytearray, end_at: int) -> int:
+        """Offset of a block's content in buf. A start marker repeated inside the block restarts it."""
+        at = buf.rfind(_START_LINE, 0, end_at)
+        while at >= 0:
+            eol = at + len(_START_LINE)
+            while buf[eol] == _CR:
+                eol += 1
+            if buf[eol] == _LF:
+                return eol + 1
+            at = buf.rfind(_START_LINE, 0, at)
+        return 1
 
-    def _parse_output(self, raw: str) -> ContainerOutput:
+    def _parse_output(self, raw: bytes | bytearray) -> ContainerOutput:
         try:
             data = json.loads(raw)
             return ContainerOutput(
@@ -57,5 +130,7 @@ class ContainerOutputParser:
                 new_session_id=data.get("newSessionId"),
                 error=data.get("error"),
             )
-        except (json.JSONDecodeError, TypeError):
-            return ContainerOutput(status="error", error=f"Failed to parse output: {raw[:200]}")
+        except (ValueError, TypeError):  # JSONDecodeError, or UnicodeDecodeError on invalid UTF-8
+            return ContainerOutput(
+                status="error", error=f"Failed to parse output: {raw[:200].decode(errors='replace')}"
+            )
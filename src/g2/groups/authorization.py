@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthContext:
     source_group: str
     is_main: bool
@@ -14,37 +15,50 @@ class AuthContext:
 class AuthorizationPolicy:
     """Encapsulates authorization checks for a single source context."""
 
+    __slots__ = ("_is_main", "_source_group")
+
     def __init__(self, ctx: AuthContext) -> None:
-        self._ctx = ctx
+        # Copied out of the context so each check reads one attribute
+        self._is_main = ctx.is_main
+        self._source_group = ctx.source_group
 
     @property
     def source_group(self) -> str:
-        return self._ctx.source_group
+        return self._source_group
 
     @property
     def is_main(self) -> bool:
-        return self._ctx.is_main
+        return self._is_main
+
+    def _same_or_main(self, target_group_folder: str) -> bool:
+        return self._is_main or target_group_folder == self._source_group
 
     def can_send_message(self, target_group_folder: str) -> bool:
         """Non-main groups can only send messages to their own group."""
-        return self._ctx.is_main or target_group_folder == self._ctx.source_group
+        return self._same_or_main(target_group_folder)
 
     def can_schedule_task(self, target_group_folder: str) -> bool:
         """Non-main groups can only schedule tasks for their own group."""
-        return self._ctx.is_main or target_group_folder == self._ctx.source_group
+        return self._same_or_main(target_group_folder)
 
     def can_manage_task(self, task_group_folder: str) -> bool:
         """Non-main groups can only manage their own tasks."""
-        return self._ctx.is_main or task_group_folder == self._ctx.source_group
+        return self._same_or_main(task_group_folder)
 
     def can_register_group(self) -> bool:
         """Only main group can register new groups."""
-        return self._ctx.is_main
+        return self._is_main
 
     def can_refresh_groups(self) -> bool:
         """Only main group can refresh/sync groups."""
-        return self._ctx.is_main
+        return self._is_main
 
     def can_manage_session(self, target_group_folder: str) -> bool:
         """Non-main groups can only manage their own sessions."""
-        return self._ctx.is_main or target_group_folder == self._ctx.source_group
+        return self._same_or_main(target_group_folder)
+
+
+@lru_cache(maxsize=256)
+def policy_for(source_group: str, is_main: bool) -> AuthorizationPolicy:
+    """Shared, immutable policy for a source context, so IPC handlers don't build one per message."""
+    return AuthorizationPolicy(AuthContext(source_group=source_group, is_main=is_main))
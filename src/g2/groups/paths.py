@@ -2,55 +2,106 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
+from typing import NamedTuple
 
 from g2.infrastructure.config import DATA_DIR, GROUPS_DIR
 
 
+class _FolderPaths(NamedTuple):
+    group_dir: Path
+    logs_dir: Path
+    ipc_dir: Path
+    ipc_input_dir: Path
+    ipc_messages_dir: Path
+    ipc_tasks_dir: Path
+    ipc_responses_dir: Path
+    sessions_dir: Path
+
+
+@functools.lru_cache(maxsize=256)
+def _build(groups_dir: Path, data_dir: Path, folder: str) -> _FolderPaths:
+    group_dir = groups_dir / folder
+    ipc_dir = data_dir / "ipc" / folder
+    return _FolderPaths(
+        group_dir=group_dir,
+        logs_dir=group_dir / "logs",
+        ipc_dir=ipc_dir,
+        ipc_input_dir=ipc_dir / "input",
+        ipc_messages_dir=ipc_dir / "messages",
+        ipc_tasks_dir=ipc_dir / "tasks",
+        ipc_responses_dir=ipc_dir / "responses",
+        sessions_dir=data_dir / "sessions" / folder / ".claude",
+    )
+
+
+def _paths(folder: str) -> _FolderPaths:
+    # The base directories are part of the key so the cache follows them if they are reassigned
+    return _build(GROUPS_DIR, DATA_DIR, folder)
+
+
+@functools.lru_cache(maxsize=512)
+def _ensure_dir(path: Path) -> Path:
+    # Cached per path, so each directory costs one mkdir per process; a failed mkdir is not cached
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 class GroupPaths:
     """Centralized path construction for group-related directories."""
 
     @staticmethod
     def group_dir(folder: str) -> Path:
         """Root directory for a group: groups/{folder}"""
-        return GROUPS_DIR / folder
+        return _paths(folder).group_dir
 
     @staticmethod
     def logs_dir(folder: str) -> Path:
         """Logs directory: groups/{folder}/logs"""
-        return GROUPS_DIR / folder / "logs"
+        return _paths(folder).logs_dir
 
     @staticmethod
     def ipc_dir(folder: str) -> Path:
         """IPC root directory: data/ipc/{folder}"""
-        return DATA_DIR / "ipc" / folder
+        return _paths(folder).ipc_dir
 
     @staticmethod
     def ipc_input_dir(folder: str) -> Path:
         """IPC input directory: data/ipc/{folder}/input"""
-        return DATA_DIR / "ipc" / folder / "input"
+        return _paths(folder).ipc_input_dir
+
+    @staticmethod
+    def ensure_ipc_input_dir(folder: str) -> Path:
+        """IPC input directory, created on first use."""
+        return _ensure_dir(_paths(folder).ipc_input_dir)
 
     @staticmethod
     def ipc_messages_dir(folder: str) -> Path:
         """IPC messages directory: data/ipc/{folder}/messages"""
-        return DATA_DIR / "ipc" / folder / "messages"
+        return _paths(folder).ipc_messages_dir
 
     @staticmethod
     def ipc_tasks_dir(folder: str) -> Path:
         """IPC tasks directory: data/ipc/{folder}/tasks"""
-        return DATA_DIR / "ipc" / folder / "tasks"
+        return _paths(folder).ipc_tasks_dir
 
     @staticmethod
     def ipc_responses_dir(folder: str) -> Path:
         """IPC responses directory: data/ipc/{folder}/responses"""
-        return DATA_DIR / "ipc" / folder / "responses"
+        return _paths(folder).ipc_responses_dir
+
+    @staticmethod
+    def ensure_ipc_responses_dir(folder: str) -> Path:
+        """IPC responses directory, created on first use."""
+        return _ensure_dir(_paths(folder).ipc_responses_dir)
 
     @staticmethod
     def sessions_dir(folder: str) -> Path:
         """Sessions directory: data/sessions/{folder}/.claude"""
-        return DATA_DIR / "sessions" / folder / ".claude"
+        return _paths(folder).sessions_dir
 
     @staticmethod
     def session_transcript(folder: str, session_id: str) -> Path:
         """Session transcript path."""
-        return DATA_DIR / "sessions" / folder / ".claude" / "projects" / "-workspace-group" / f"{session_id}.jsonl"
+        return _paths(folder).sessions_dir / "projects" / "-workspace-group" / f"{session_id}.jsonl"
@@ -5,89 +5,95 @@ from __future__ import annotations
 import json
 import sqlite3
 
+from pydantic import ValidationError
+
 from g2.groups.types import ContainerConfig, RegisteredGroup
 
 
-def _safe_parse(raw: str) -> dict | None:
+def _parse_container_config(raw: str) -> ContainerConfig | None:
+    """Validate stored JSON straight into the model. Unparseable or empty configs read as None."""
     try:
-        return json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
+        config = ContainerConfig.model_validate_json(raw)
+    except ValidationError:
         return None
+    return config if config.model_fields_set else None
+
+
+# Shared statement texts: sqlite3 keeps prepared statements in a per-connection cache keyed by SQL text
+# Explicit column order: rows are read as plain tuples and unpacked by position in _row_to_group
+_GROUP_COLUMNS = "jid, name, folder, trigger_pattern, added_at, container_config, requires_trigger, channel"
+_SELECT_ALL_GROUPS_SQL = f"SELECT {_GROUP_COLUMNS} FROM registered_groups"
+_SELECT_GROUP_SQL = f"{_SELECT_ALL_GROUPS_SQL} WHERE jid = ?"
+_UPSERT_GROUP_SQL = """INSERT OR REPLACE INTO registered_groups
+    (jid, name, folder, trigger_pattern, added_at, container_config, requires_trigger, channel)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _group_params(jid: str, group: RegisteredGroup | dict) -> tuple:
+    if isinstance(group, dict):
+        # Support dict input for migrations
+        g = group
+        return (
+            jid,
+            g.get("name", ""),
+            g.get("folder", ""),
+            g.get("trigger", ""),
+            g.get("added_at", ""),
+            json.dumps(g["containerConfig"]) if g.get("containerConfig") else None,
+            1 if g.get("requiresTrigger", True) else 0,
+            g.get("channel", "whatsapp"),
+        )
+    return (
+        jid,
+        group.name,
+        group.folder,
+        group.trigger,
+        group.added_at,
+        group.container_config.model_dump_json() if group.container_config else None,
+        1 if group.requires_trigger is None or group.requires_trigger else 0,
+        group.channel or "whatsapp",
+    )
+
+
+def _row_to_group(row: tuple) -> tuple[str, RegisteredGroup]:
+    jid, name, folder, trigger, added_at, raw_config, rt_val, channel = row
+    container_config = _parse_container_config(raw_config) if raw_config else None
+    return jid, RegisteredGroup(
+        name=name,
+        folder=folder,
+        trigger=trigger,
+        added_at=added_at,
+        channel=channel or "whatsapp",
+        container_config=container_config,
+        requires_trigger=None if rt_val is None else rt_val == 1,
+    )
 
 
 class GroupRepository:
     def __init__(self, db: sqlite3.Connection) -> None:
         self._db = db
 
+    def _tuple_cursor(self) -> sqlite3.Cursor:
+        # The connection's row factory builds sqlite3.Row objects; positional tuples are cheaper to unpack
+        cursor = self._db.cursor()
+        cursor.row_factory = None
+        return cursor
+
     def get_registered_group(self, jid: str) -> RegisteredGroup | None:
-        row = self._db.execute("SELECT * FROM registered_groups WHERE jid = ?", (jid,)).fetchone()
+        row = self._tuple_cursor().execute(_SELECT_GROUP_SQL, (jid,)).fetchone()
         if not row:
             return None
-        return self._row_to_group(row)
+        return _row_to_group(row)[1]
 
     def set_registered_group(self, jid: str, group: RegisteredGroup | dict) -> None:
-        if isinstance(group, dict):
-            # Support dict input for migrations
-            g = group
-            self._db.execute(
-                """INSERT OR REPLACE INTO registered_groups
-                   (jid, name, folder, trigger_pattern, added_at, container_config, requires_trigger, channel)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    jid,
-                    g.get("name", ""),
-                    g.get("folder", ""),
-                    g.get("trigger", ""),
-                    g.get("added_at", ""),
-                    json.dumps(g["containerConfig"]) if g.get("containerConfig") else None,
-                    1 if g.get("requiresTrigger", True) else 0,
-                    g.get("channel", "whatsapp"),
-                ),
-            )
-        else:
-            self._db.execute(
-                """INSERT OR REPLACE INTO registered_groups
-                   (jid, name, folder, trigger_pattern, added_at, container_config, requires_trigger, channel)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    jid,
-                    group.name,
-                    group.folder,
-                    group.trigger,
-                    group.added_at,
-                    group.container_config.model_dump_json() if group.container_config else None,
-                    1 if group.requires_trigger is None or group.requires_trigger else 0,
-                    group.channel or "whatsapp",
-                ),
-            )
+        self._db.execute(_UPSERT_GROUP_SQL, _group_params(jid, group))
+        self._db.commit()
+
+    def set_registered_groups(self, groups: dict[str, RegisteredGroup | dict]) -> None:
+        """Upsert many groups in a single transaction."""
+        self._db.executemany(_UPSERT_GROUP_SQL, [_group_params(jid, group) for jid, group in groups.items()])
         self._db.commit()
 
     def get_all_registered_groups(self) -> dict[str, RegisteredGroup]:
-        rows = self._db.execute("SELECT * FROM registered_groups").fetchall()
-        result: dict[str, RegisteredGroup] = {}
-        for row in rows:
-            jid = row["jid"]
-            result[jid] = self._row_to_group(row)
-        return result
-
-    def _row_to_group(self, row: sqlite3.Row) -> RegisteredGroup:
-        container_config = None
-        if row["container_config"]:
-            parsed = _safe_parse(row["container_config"])
-            if parsed:
-                container_config = ContainerConfig(**parsed)
-
-        requires_trigger: bool | None = None
-        rt_val = row["requires_trigger"]
-        if rt_val is not None:
-            requires_trigger = rt_val == 1
-
-        return RegisteredGroup(
-            name=row["name"],
-            folder=row["folder"],
-            trigger=row["trigger_pattern"],
-            added_at=row["added_at"],
-            channel=row["channel"] or "whatsapp",
-            container_config=container_config,
-            requires_trigger=requires_trigger,
-        )
+        # Iterate the cursor directly rather than materialising every row first
+        return dict(map(_row_to_group, self._tuple_cursor().execute(_SELECT_ALL_GROUPS_SQL)))
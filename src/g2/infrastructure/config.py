@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
 import re
 from pathlib import Path
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+# One KEY=value line: surrounding whitespace ignored, comment lines skipped, one matching pair of quotes removed
+# (a lone quote character counts as an empty quoted value)
+_ENV_LINE_RE = re.compile(
+    r"""^[^\S\n]*(?!#)([^=\n]*?)[^\S\n]*=[^\S\n]*(?:"(.*)"|'(.*)'|["']|(.*?))[^\S\n]*$""",
+    re.MULTILINE,
+)
+
 
 def read_env_file(keys: list[str]) -> dict[str, str]:
     """Parse .env file and return values for requested keys.
@@ -24,37 +32,42 @@ def read_env_file(keys: list[str]) -> dict[str, str]:
     result: dict[str, str] = {}
     wanted = set(keys)
 
-    for line in content.splitlines():
-        trimmed = line.strip()
-        if not trimmed or trimmed.startswith("#"):
-            continue
-        eq_idx = trimmed.find("=")
-        if eq_idx == -1:
-            continue
-        key = trimmed[:eq_idx].strip()
+    for match in _ENV_LINE_RE.finditer(content):
+        key, double_quoted, single_quoted, bare = match.groups()
         if key not in wanted:
             continue
-        value = trimmed[eq_idx + 1 :].strip()
-        if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-            value = value[1:-1]
+        value = double_quoted if double_quoted is not None else single_quoted if single_quoted is not None else bare
         if value:
             result[key] = value
 
     return result
 
 
-# Read config values from .env (falls back to os.environ).
-_env_config = read_env_file(["ASSISTANT_NAME", "ASSISTANT_HAS_OWN_NUMBER"])
+# Read every config key from .env in one pass; the process environment takes precedence.
+_CONFIG_KEYS = [
+    "ASSISTANT_NAME",
+    "ASSISTANT_HAS_OWN_NUMBER",
+    "GMAIL_TRIGGER_ADDRESS",
+    "CONTAINER_IMAGE",
+    "CONTAINER_TIMEOUT",
+    "CONTAINER_MAX_OUTPUT_SIZE",
+    "IDLE_TIMEOUT",
+    "MAX_CONCURRENT_CONTAINERS",
+]
+_env_config = read_env_file(_CONFIG_KEYS)
+
 
-ASSISTANT_NAME: str = os.environ.get("ASSISTANT_NAME") or _env_config.get("ASSISTANT_NAME", "G2")
-ASSISTANT_HAS_OWN_NUMBER: bool = (
-    os.environ.get("ASSISTANT_HAS_OWN_NUMBER") or _env_config.get("ASSISTANT_HAS_OWN_NUMBER", "")
-) == "true"
+def _get(key: str, default: str) -> str:
+    return os.environ.get(key) or _env_config.get(key, default)
+
+
+ASSISTANT_NAME: str = _get("ASSISTANT_NAME", "G2")
+ASSISTANT_HAS_OWN_NUMBER: bool = _get("ASSISTANT_HAS_OWN_NUMBER", "") == "true"
 
 POLL_INTERVAL: float = 2.0  # seconds
 SCHEDULER_POLL_INTERVAL: float = 60.0
 GMAIL_POLL_INTERVAL: float = 60.0
-GMAIL_TRIGGER_ADDRESS: str = os.environ.get("GMAIL_TRIGGER_ADDRESS", "vijaywargiag+2@gmail.com")
+GMAIL_TRIGGER_ADDRESS: str = _get("GMAIL_TRIGGER_ADDRESS", "vijaywargiag+2@gmail.com")
 GMAIL_GROUP_FOLDER: str = "email"
 
 # Absolute paths
@@ -62,17 +75,18 @@ PROJECT_ROOT: Path = Path.cwd()
 HOME_DIR: Path = Path.home()
 
 MOUNT_ALLOWLIST_PATH: Path = HOME_DIR / ".config" / "g2" / "mount-allowlist.json"
+GMAIL_CONFIG_DIR: Path = HOME_DIR / ".gmail-mcp"
 STORE_DIR: Path = (PROJECT_ROOT / "store").resolve()
 GROUPS_DIR: Path = (PROJECT_ROOT / "groups").resolve()
 DATA_DIR: Path = (PROJECT_ROOT / "data").resolve()
 MAIN_GROUP_FOLDER: str = "main"
 
-CONTAINER_IMAGE: str = os.environ.get("CONTAINER_IMAGE", "g2-agent:latest")
-CONTAINER_TIMEOUT: int = int(os.environ.get("CONTAINER_TIMEOUT", "1800000"))
-CONTAINER_MAX_OUTPUT_SIZE: int = int(os.environ.get("CONTAINER_MAX_OUTPUT_SIZE", "10485760"))  # 10MB
+CONTAINER_IMAGE: str = _get("CONTAINER_IMAGE", "g2-agent:latest")
+CONTAINER_TIMEOUT: int = int(_get("CONTAINER_TIMEOUT", "1800000"))
+CONTAINER_MAX_OUTPUT_SIZE: int = int(_get("CONTAINER_MAX_OUTPUT_SIZE", "10485760"))  # 10MB
 IPC_POLL_INTERVAL: float = 1.0
-IDLE_TIMEOUT: int = int(os.environ.get("IDLE_TIMEOUT", "1800000"))  # 30min
-MAX_CONCURRENT_CONTAINERS: int = max(1, int(os.environ.get("MAX_CONCURRENT_CONTAINERS", "5")))
+IDLE_TIMEOUT: int = int(_get("IDLE_TIMEOUT", "1800000"))  # 30min
+MAX_CONCURRENT_CONTAINERS: int = max(1, int(_get("MAX_CONCURRENT_CONTAINERS", "5")))
 
 
 def _escape_regex(s: str) -> str:
@@ -81,6 +95,28 @@ def _escape_regex(s: str) -> str:
 
 TRIGGER_PATTERN: re.Pattern[str] = re.compile(rf"^@{_escape_regex(ASSISTANT_NAME)}\b", re.IGNORECASE)
 
+_AT_NAME_LOWER = f"@{ASSISTANT_NAME}".lower()
+_AT_NAME_LEN = len(ASSISTANT_NAME) + 1
+# Whether the \b in TRIGGER_PATTERN sits after a word character (the usual case) or after punctuation
+_NAME_ENDS_IN_WORD = bool(re.match(r"\w", ASSISTANT_NAME[-1:]))
+
+
+def is_trigger(text: str) -> bool:
+    """Same result as TRIGGER_PATTERN.match(text), as a case-insensitive prefix test plus a boundary check."""
+    if text[:_AT_NAME_LEN].lower() != _AT_NAME_LOWER:
+        return False
+    if len(text) == _AT_NAME_LEN:
+        return _NAME_ENDS_IN_WORD
+    next_char = text[_AT_NAME_LEN]
+    next_is_word = next_char.isalnum() or next_char == "_"
+    return next_is_word != _NAME_ENDS_IN_WORD
+
+
+def _zoneinfo_name(link: str) -> str:
+    # Extract IANA name from a path like /usr/share/zoneinfo/America/New_York
+    _, sep, name = link.partition("zoneinfo/")
+    return name if sep else ""
+
 
 def _resolve_timezone() -> str:
     tz = os.environ.get("TZ", "")
@@ -89,23 +125,17 @@ def _resolve_timezone() -> str:
             import time
 
             tz = time.tzname[0] or "UTC"
-            # Try to get the proper IANA timezone
-            import locale
-
-            try:
-                # On Linux, read /etc/timezone or use the TZ symlink
-                tz_file = Path("/etc/timezone")
-                if tz_file.exists():
-                    tz = tz_file.read_text().strip()
-                else:
-                    local_tz = Path("/etc/localtime").resolve()
-                    # Extract IANA name from path like /usr/share/zoneinfo/America/New_York
-                    parts = local_tz.parts
-                    zi_idx = parts.index("zoneinfo") if "zoneinfo" in parts else -1
-                    if zi_idx >= 0:
-                        tz = "/".join(parts[zi_idx + 1 :])
-            except Exception:
-                pass
+            # On Linux, read the /etc/localtime symlink target (one syscall) or fall back to /etc/timezone
+            name = ""
+            with contextlib.suppress(OSError):
+                link = os.readlink("/etc/localtime")
+                if not link.startswith("/"):
+                    link = "/etc/" + link
+                name = _zoneinfo_name(link)
+            if not name:
+                with contextlib.suppress(OSError, UnicodeDecodeError):
+                    name = Path("/etc/timezone").read_bytes().strip().decode()
+            tz = name or tz
         except Exception:
             tz = "UTC"
 
@@ -115,11 +145,22 @@ def _resolve_timezone() -> str:
     try:
         ZoneInfo(tz)
         return tz
-    except (ZoneInfoNotFoundError, KeyError):
+    except (ZoneInfoNotFoundError, KeyError, ValueError):
         return "UTC"
 
 
-TIMEZONE: str = _resolve_timezone()
+_timezone: str | None = None
+
+
+def get_timezone() -> str:
+    """Resolve the IANA timezone on first call and return the cached name afterwards."""
+    global _timezone
+    if _timezone is None:
+        _timezone = _resolve_timezone()
+    return _timezone
+
+
+TIMEZONE: str = get_timezone()
 
 
 class TimeoutConfig:
@@ -136,5 +177,6 @@ class TimeoutConfig:
     def for_group(self, group: object) -> TimeoutConfig:
         """Create a TimeoutConfig for a specific group, using group's custom timeout if set."""
         container_config = getattr(group, "container_config", None)
-        group_timeout = (container_config.timeout if container_config and container_config.timeout else self.container_timeout)
-        return TimeoutConfig(group_timeout, self.idle_timeout)
+        if not (container_config and container_config.timeout):
+            return self  # Nothing to override
+        return TimeoutConfig(container_config.timeout, self.idle_timeout)
@@ -9,6 +9,9 @@ from pathlib import Path
 from g2.infrastructure.config import ASSISTANT_NAME, DATA_DIR, STORE_DIR
 from g2.infrastructure.logger import logger
 
+# Bumped whenever a step is added to _run_schema_migrations
+SCHEMA_VERSION = 6
+
 
 def create_schema(db: sqlite3.Connection) -> None:
     """Create all tables and indexes. Safe to call multiple times (IF NOT EXISTS)."""
@@ -94,11 +97,27 @@ def create_schema(db: sqlite3.Connection) -> None:
     _run_schema_migrations(db)
 
 
+def _table_columns(db: sqlite3.Connection, table: str) -> set[str]:
+    return {row[1] for row in db.execute(f"PRAGMA table_info({table})")}
+
+
 def _run_schema_migrations(db: sqlite3.Connection) -> None:
-    """Run ALTER TABLE migrations. Each is wrapped in try/except for idempotency."""
+    """Bring an older database up to SCHEMA_VERSION in a single transaction.
+
+    Existing columns are detected with PRAGMA table_info rather than by catching failed ALTERs. Once
+    PRAGMA user_version records SCHEMA_VERSION this returns immediately.
+    """
+    if db.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+
+    task_columns = _table_columns(db, "scheduled_tasks")
+    message_columns = _table_columns(db, "messages")
+    chat_columns = _table_columns(db, "chats")
+    group_columns = _table_columns(db, "registered_groups")
 
-    # Migrate session_history -> conversation_archives
+    db.execute("BEGIN")
     try:
+        # Migrate session_history -> conversation_archives
         row = db.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='session_history'").fetchone()
         if row:
             db.execute("""
@@ -106,68 +125,56 @@ def _run_schema_migrations(db: sqlite3.Connection) -> None:
                 SELECT group_folder, session_id, name, '', archived_at FROM session_history
             """)
             db.execute("DROP TABLE session_history")
-            db.commit()
-    except sqlite3.Error:
-        pass
 
-    # Add context_mode column
-    try:
-        db.execute("ALTER TABLE scheduled_tasks ADD COLUMN context_mode TEXT DEFAULT 'isolated'")
+        # Add context_mode column
+        if "context_mode" not in task_columns:
+            db.execute("ALTER TABLE scheduled_tasks ADD COLUMN context_mode TEXT DEFAULT 'isolated'")
+
+        # Add is_bot_message column
+        if "is_bot_message" not in message_columns:
+            db.execute("ALTER TABLE messages ADD COLUMN is_bot_message INTEGER DEFAULT 0")
+            db.execute("UPDATE messages SET is_bot_message = 1 WHERE content LIKE ?", (f"{ASSISTANT_NAME}:%",))
+
+        # Add channel and is_group columns
+        if "channel" not in chat_columns:
+            db.execute("ALTER TABLE chats ADD COLUMN channel TEXT")
+            if "is_group" not in chat_columns:
+                db.execute("ALTER TABLE chats ADD COLUMN is_group INTEGER DEFAULT 0")
+            db.execute("UPDATE chats SET channel = 'whatsapp', is_group = 1 WHERE jid LIKE '%@g.us'")
+            db.execute("UPDATE chats SET channel = 'whatsapp', is_group = 0 WHERE jid LIKE '%@s.whatsapp.net'")
+            db.execute("UPDATE chats SET channel = 'discord', is_group = 1 WHERE jid LIKE 'dc:%'")
+            db.execute("UPDATE chats SET channel = 'telegram', is_group = 1 WHERE jid LIKE 'tg:%'")
+
+        # Add channel column to registered_groups
+        if "channel" not in group_columns:
+            db.execute("ALTER TABLE registered_groups ADD COLUMN channel TEXT DEFAULT 'whatsapp'")
+
+        # Add media columns to messages
+        for column in ("media_type", "media_mimetype", "media_path"):
+            if column not in message_columns:
+                db.execute(f"ALTER TABLE messages ADD COLUMN {column} TEXT")
+
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         db.commit()
-    except sqlite3.OperationalError:
-        pass
-
-    # Add is_bot_message column
-    try:
-        db.execute("ALTER TABLE messages ADD COLUMN is_bot_message INTEGER DEFAULT 0")
-        db.execute("UPDATE messages SET is_bot_message = 1 WHERE content LIKE ?", (f"{ASSISTANT_NAME}:%",))
-        db.commit()
-    except sqlite3.OperationalError:
-        pass
-
-    # Add channel and is_group columns
-    try:
-        db.execute("ALTER TABLE chats ADD COLUMN channel TEXT")
-        db.execute("ALTER TABLE chats ADD COLUMN is_group INTEGER DEFAULT 0")
-        db.execute("UPDATE chats SET channel = 'whatsapp', is_group = 1 WHERE jid LIKE '%@g.us'")
-        db.execute("UPDATE chats SET channel = 'whatsapp', is_group = 0 WHERE jid LIKE '%@s.whatsapp.net'")
-        db.execute("UPDATE chats SET channel = 'discord', is_group = 1 WHERE jid LIKE 'dc:%'")
-        db.execute("UPDATE chats SET channel = 'telegram', is_group = 1 WHERE jid LIKE 'tg:%'")
-        db.commit()
-    except sqlite3.OperationalError:
-        pass
-
-    # Add channel column to registered_groups
-    try:
-        db.execute("ALTER TABLE registered_groups ADD COLUMN channel TEXT DEFAULT 'whatsapp'")
-        db.commit()
-    except sqlite3.OperationalError:
-        pass
-
-    # Add media columns to messages
-    try:
-        db.execute("ALTER TABLE messages ADD COLUMN media_type TEXT")
-        db.execute("ALTER TABLE messages ADD COLUMN media_mimetype TEXT")
-        db.execute("ALTER TABLE messages ADD COLUMN media_path TEXT")
-        db.commit()
-    except sqlite3.OperationalError:
-        pass
+    except sqlite3.Error as err:
+        # Leave user_version untouched so the next start retries
+        db.rollback()
+        logger.warning("Schema migration failed", error=str(err))
 
 
 def run_json_migrations(
     db: sqlite3.Connection,
     set_router_state: callable,
     set_session: callable,
-    set_registered_group: callable,
+    set_registered_groups: callable,
 ) -> None:
     """Migrate legacy JSON state files to the database."""
 
     def migrate_file(filename: str) -> dict | list | None:
         file_path = DATA_DIR / filename
-        if not file_path.exists():
-            return None
         try:
-            data = json.loads(file_path.read_text())
+            # Usually the file is absent: let the read fail instead of stat-ing first, and parse the bytes as-is
+            data = json.loads(file_path.read_bytes())
             file_path.rename(file_path.with_suffix(file_path.suffix + ".migrated"))
             return data
         except Exception:
@@ -187,8 +194,7 @@ def run_json_migrations(
 
     groups = migrate_file("registered_groups.json")
     if groups and isinstance(groups, dict):
-        for jid, group_data in groups.items():
-            set_registered_group(jid, group_data)
+        set_registered_groups(groups)
 
 
 class AppDatabase:
@@ -215,13 +221,16 @@ class AppDatabase:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self._db = sqlite3.connect(str(db_path))
         self._db.row_factory = sqlite3.Row
+        # WAL makes each commit an append to the log; NORMAL syncs at checkpoints rather than on every commit
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
         self._init_repos()
 
         run_json_migrations(
             self._db,
             set_router_state=lambda k, v: self.state_repo.set_router_state(k, v),
             set_session=lambda g, s: self.session_repo.set_session(g, s),
-            set_registered_group=lambda j, g: self.group_repo.set_registered_group(j, g),
+            set_registered_groups=lambda groups: self.group_repo.set_registered_groups(groups),
         )
 
     def _init_test(self) -> None:
@@ -12,22 +12,27 @@ class IdleTimer:
     def __init__(self, callback: Callable[[], Awaitable[None] | None], timeout_s: float) -> None:
         self._callback = callback
         self._timeout = timeout_s
+        # A plain loop timer: no task or coroutine frame per reset
+        self._handle: asyncio.TimerHandle | None = None
+        # Set only while an async callback is running
         self._task: asyncio.Task[None] | None = None
 
     def reset(self) -> None:
         """Reset the timer. Cancels any pending callback and starts a new countdown."""
-        if self._task:
-            self._task.cancel()
-        self._task = asyncio.create_task(self._fire())
+        self.clear()
+        self._handle = asyncio.get_running_loop().call_later(self._timeout, self._fire)
 
-    async def _fire(self) -> None:
-        await asyncio.sleep(self._timeout)
+    def _fire(self) -> None:
+        self._handle = None
         result = self._callback()
         if asyncio.iscoroutine(result):
-            await result
+            self._task = asyncio.ensure_future(result)
 
     def clear(self) -> None:
         """Cancel the timer without firing the callback."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
         if self._task:
             self._task.cancel()
             self._task = None
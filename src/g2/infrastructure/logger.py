@@ -2,29 +2,44 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import sys
+from typing import Any
 
 import structlog
 
 
+def _json_bytes(obj: Any, **kwargs: Any) -> bytes:
+    return json.dumps(obj, **kwargs).encode()
+
+
 def setup_logging() -> structlog.stdlib.BoundLogger:
-    """Configure structlog with console output."""
+    """Configure structlog: readable console output on a terminal, JSON lines written as bytes otherwise."""
     log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
 
+    processors: list[Any] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.StackInfoRenderer(),
+        structlog.dev.set_exc_info,
+        structlog.processors.TimeStamper(fmt="iso"),
+    ]
+    stderr_bytes = getattr(sys.stderr, "buffer", None)
+    if sys.stderr.isatty() or stderr_bytes is None:
+        processors.append(structlog.dev.ConsoleRenderer(colors=sys.stderr.isatty()))
+        logger_factory: Any = structlog.PrintLoggerFactory(file=sys.stderr)
+    else:
+        # One write per record straight to the byte stream, skipping print() and the text layer
+        processors += [structlog.processors.format_exc_info, structlog.processors.JSONRenderer(_json_bytes)]
+        logger_factory = structlog.BytesLoggerFactory(file=stderr_bytes)
+
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(colors=sys.stderr.isatty()),
-        ],
+        processors=processors,
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
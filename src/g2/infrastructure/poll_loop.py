@@ -9,12 +9,20 @@ from g2.infrastructure.logger import logger
 
 
 class PollLoop:
-    """An async polling loop that calls a function at regular intervals."""
+    """An async polling loop that calls a function at regular intervals.
 
-    def __init__(self, name: str, interval_s: float, fn: Callable[[], Awaitable[None]]) -> None:
+    Producers that know new work has arrived can call wake() to run the function early instead of waiting
+    out the interval. Wakeups within min_batch_s of each other are served by a single run.
+    """
+
+    def __init__(
+        self, name: str, interval_s: float, fn: Callable[[], Awaitable[None]], min_batch_s: float = 0.0
+    ) -> None:
         self._name = name
         self._interval = interval_s
         self._fn = fn
+        self._min_batch = min_batch_s
+        self._wake = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
         self._stopped = False
 
@@ -31,6 +39,19 @@ class PollLoop:
             self._task.cancel()
             self._task = None
 
+    def wake(self) -> None:
+        """Run the function as soon as possible. Must be called from the event loop thread."""
+        self._wake.set()
+
+    async def _wait(self) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=self._interval)
+        except TimeoutError:
+            return
+        if self._min_batch:
+            await asyncio.sleep(self._min_batch)
+        self._wake.clear()
+
     async def _loop(self) -> None:
         while not self._stopped:
             try:
@@ -40,11 +61,13 @@ class PollLoop:
             except Exception:
                 logger.exception(f"Error in {self._name} loop")
             if not self._stopped:
-                await asyncio.sleep(self._interval)
+                await self._wait()
 
 
-def start_poll_loop(name: str, interval_s: float, fn: Callable[[], Awaitable[None]]) -> PollLoop:
-    """Create and start a polling loop. Returns a handle to stop it."""
-    loop = PollLoop(name, interval_s, fn)
+def start_poll_loop(
+    name: str, interval_s: float, fn: Callable[[], Awaitable[None]], min_batch_s: float = 0.0
+) -> PollLoop:
+    """Create and start a polling loop. Returns a handle to stop or wake it."""
+    loop = PollLoop(name, interval_s, fn, min_batch_s)
     loop.start()
     return loop
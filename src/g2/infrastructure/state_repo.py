@@ -2,17 +2,48 @@
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
 
+# How long state writes made on the event loop may stay uncommitted, so a burst of them shares one commit
+COMMIT_DELAY_S = 0.2
+
 
 class StateRepository:
     def __init__(self, db: sqlite3.Connection) -> None:
         self._db = db
+        # Writes not yet flushed. They stay out of the shared connection until flush(), so a
+        # rollback by another repository's transaction cannot discard them
+        self._pending: dict[str, str] = {}
+        self._commit_handle: asyncio.TimerHandle | None = None
 
     def get_router_state(self, key: str) -> str | None:
+        if key in self._pending:
+            return self._pending[key]
         row = self._db.execute("SELECT value FROM router_state WHERE key = ?", (key,)).fetchone()
         return row[0] if row else None
 
     def set_router_state(self, key: str, value: str) -> None:
-        self._db.execute("INSERT OR REPLACE INTO router_state (key, value) VALUES (?, ?)", (key, value))
-        self._db.commit()
+        """Write a state value. On the event loop the write is deferred by COMMIT_DELAY_S; see flush()."""
+        self._pending[key] = value
+        if self._commit_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._commit_handle = loop.call_later(COMMIT_DELAY_S, self.flush)
+
+    def flush(self) -> None:
+        """Write and commit pending state values now."""
+        if self._commit_handle is not None:
+            self._commit_handle.cancel()
+            self._commit_handle = None
+        if self._pending:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO router_state (key, value) VALUES (?, ?)", self._pending.items()
+                )
+            # Cleared only once committed: a failed write keeps the values for the next flush
+            self._pending.clear()
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING
 
 from g2.infrastructure.logger import logger
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from g2.ipc.watcher import IpcDeps
 
+# At most this many "Unknown IPC task type" warnings per window; the rest are counted and reported with the next one
+UNKNOWN_LOG_LIMIT = 10
+UNKNOWN_LOG_WINDOW_S = 1.0
+
 
 class IpcHandlerError(Exception):
     """Error raised by IPC handlers for expected failures."""
@@ -50,17 +58,36 @@ class IpcCommandDispatcher:
     """Routes IPC commands to registered handlers."""
 
     def __init__(self, handlers: list[IpcCommandHandler]) -> None:
-        self._handlers: dict[str, IpcCommandHandler] = {h.command: h for h in handlers}
+        # Bound handle methods, resolved once: dispatch is a single dict lookup and call
+        self._handle_fns: dict[str, Callable[[dict[str, Any], str, bool, IpcDeps], Awaitable[None]]] = {
+            h.command: h.handle for h in handlers
+        }
+        # Times of the most recent unknown-command warnings
+        self._unknown_logged: deque[float] = deque(maxlen=UNKNOWN_LOG_LIMIT)
+        self._unknown_suppressed = 0
 
     async def dispatch(self, data: dict[str, Any], source_group: str, is_main: bool, deps: IpcDeps) -> None:
         command_type = data.get("type")
-        handler = self._handlers.get(command_type)  # type: ignore[arg-type]
-        if not handler:
-            logger.warning("Unknown IPC task type", type=command_type)
+        handle = self._handle_fns.get(command_type)  # type: ignore[arg-type]
+        if handle is None:
+            self._warn_unknown(command_type)
             return
         try:
-            await handler.handle(data, source_group, is_main, deps)
+            await handle(data, source_group, is_main, deps)
         except IpcHandlerError as err:
             logger.warning(err.args[0], command=command_type, source_group=source_group, **err.details)
         except Exception:
             raise
+
+    def _warn_unknown(self, command_type: object) -> None:
+        now = time.monotonic()
+        logged = self._unknown_logged
+        if len(logged) == UNKNOWN_LOG_LIMIT and now - logged[0] < UNKNOWN_LOG_WINDOW_S:
+            self._unknown_suppressed += 1
+            return
+        logged.append(now)
+        if self._unknown_suppressed:
+            logger.warning("Unknown IPC task type", type=command_type, suppressed=self._unknown_suppressed)
+            self._unknown_suppressed = 0
+        else:
+            logger.warning("Unknown IPC task type", type=command_type)
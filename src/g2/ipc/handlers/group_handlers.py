@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from g2.groups.authorization import AuthContext, AuthorizationPolicy
+from g2.groups.authorization import policy_for
 from g2.groups.types import ContainerConfig, RegisteredGroup
 from g2.infrastructure.logger import logger
 from g2.ipc.dispatcher import HandlerContext, IpcCommandHandler, IpcHandlerError
@@ -15,6 +15,9 @@ from g2.ipc.dispatcher import HandlerContext, IpcCommandHandler, IpcHandlerError
 # --- RegisterGroupHandler ---
 
 
+_REGISTER_REQUIRED = ("jid", "name", "folder", "trigger")
+
+
 @dataclass
 class RegisterGroupPayload:
     jid: str
@@ -30,8 +33,9 @@ class RegisterGroupHandler(IpcCommandHandler):
     command = "register_group"
 
     async def validate(self, data: dict[str, Any]) -> RegisterGroupPayload:
-        if not data.get("jid") or not data.get("name") or not data.get("folder") or not data.get("trigger"):
-            raise IpcHandlerError("Missing required fields", {"command": self.command})
+        missing = [key for key in _REGISTER_REQUIRED if not data.get(key)]
+        if missing:
+            raise IpcHandlerError("Missing required fields", {"command": self.command, "missing": missing})
         return RegisterGroupPayload(
             jid=data["jid"],
             name=data["name"],
@@ -43,7 +47,7 @@ class RegisterGroupHandler(IpcCommandHandler):
         )
 
     async def execute(self, payload: RegisterGroupPayload, context: HandlerContext) -> None:
-        auth = AuthorizationPolicy(AuthContext(source_group=context.source_group, is_main=context.is_main))
+        auth = policy_for(context.source_group, context.is_main)
         if not auth.can_register_group():
             raise IpcHandlerError("Unauthorized register_group attempt", {"sourceGroup": context.source_group})
 
@@ -77,7 +81,7 @@ class RefreshGroupsHandler(IpcCommandHandler):
         return None
 
     async def execute(self, _payload: None, context: HandlerContext) -> None:
-        auth = AuthorizationPolicy(AuthContext(source_group=context.source_group, is_main=context.is_main))
+        auth = policy_for(context.source_group, context.is_main)
         if not auth.can_refresh_groups():
             raise IpcHandlerError("Unauthorized refresh_groups attempt", {"sourceGroup": context.source_group})
 
@@ -23,11 +23,9 @@ class ClearSessionHandler(IpcCommandHandler):
     async def execute(self, name: str | None, context: HandlerContext) -> None:
         context.deps.session_manager.clear(context.source_group, name)
 
-        groups = context.deps.registered_groups()
-        for jid, g in groups.items():
-            if g.folder == context.source_group:
-                context.deps.close_stdin(jid)
-                break
+        jid = context.deps.jid_for_folder(context.source_group)
+        if jid:
+            context.deps.close_stdin(jid)
 
         logger.info("Session cleared via IPC", source_group=context.source_group)
 
@@ -54,22 +52,23 @@ class ResumeSessionHandler(IpcCommandHandler):
 
     async def execute(self, payload: ResumeSessionPayload, context: HandlerContext) -> None:
         try:
-            restored_session_id = context.deps.session_manager.resume(
-                context.source_group,
-                int(payload.session_history_id),
-                payload.save_name,
-            )
-        except (ValueError, Exception):
+            archive_id: int | None = int(payload.session_history_id)
+        except (TypeError, ValueError):
+            archive_id = None
+        restored_session_id = (
+            context.deps.session_manager.resume(context.source_group, archive_id, payload.save_name)
+            if archive_id is not None
+            else None
+        )
+        if restored_session_id is None:
             raise IpcHandlerError(
                 "Conversation archive entry not found",
                 {"sourceGroup": context.source_group, "id": payload.session_history_id},
             )
 
-        groups = context.deps.registered_groups()
-        for jid, g in groups.items():
-            if g.folder == context.source_group:
-                context.deps.close_stdin(jid)
-                break
+        jid = context.deps.jid_for_folder(context.source_group)
+        if jid:
+            context.deps.close_stdin(jid)
 
         logger.info("Session resumed via IPC", source_group=context.source_group, restored_session_id=restored_session_id)
 
@@ -94,12 +93,12 @@ class SearchSessionsHandler(IpcCommandHandler):
     async def execute(self, payload: SearchSessionsPayload, context: HandlerContext) -> None:
         results = context.deps.session_manager.search(context.source_group, payload.query)
 
-        responses_dir = GroupPaths.ipc_responses_dir(context.source_group)
-        responses_dir.mkdir(parents=True, exist_ok=True)
+        responses_dir = GroupPaths.ensure_ipc_responses_dir(context.source_group)
 
         response_path = responses_dir / f"{payload.request_id}.json"
         tmp_path = response_path.with_suffix(".json.tmp")
-        tmp_path.write_text(json.dumps(results))
+        # Empty searches are common: skip the encoder for them
+        tmp_path.write_bytes(json.dumps(results).encode() if results else b"[]")
         tmp_path.rename(response_path)
 
         logger.info(
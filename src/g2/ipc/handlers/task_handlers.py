@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Literal
 
-from g2.groups.authorization import AuthContext, AuthorizationPolicy
+from g2.groups.authorization import policy_for
 from g2.infrastructure.logger import logger
 from g2.ipc.dispatcher import HandlerContext, IpcCommandHandler, IpcHandlerError
 
@@ -13,6 +13,9 @@ from g2.ipc.dispatcher import HandlerContext, IpcCommandHandler, IpcHandlerError
 # --- ScheduleTaskHandler ---
 
 
+_SCHEDULE_REQUIRED = ("prompt", "schedule_type", "schedule_value", "targetJid")
+
+
 @dataclass
 class ScheduleTaskPayload:
     prompt: str
@@ -26,8 +29,9 @@ class ScheduleTaskHandler(IpcCommandHandler):
     command = "schedule_task"
 
     async def validate(self, data: dict[str, Any]) -> ScheduleTaskPayload:
-        if not data.get("prompt") or not data.get("schedule_type") or not data.get("schedule_value") or not data.get("targetJid"):
-            raise IpcHandlerError("Missing required fields", {"command": self.command})
+        missing = [key for key in _SCHEDULE_REQUIRED if not data.get(key)]
+        if missing:
+            raise IpcHandlerError("Missing required fields", {"command": self.command, "missing": missing})
         context_mode = data.get("context_mode", "isolated")
         if context_mode not in ("group", "isolated"):
             context_mode = "isolated"
@@ -46,7 +50,7 @@ class ScheduleTaskHandler(IpcCommandHandler):
             raise IpcHandlerError("Target group not registered", {"targetJid": payload.target_jid})
 
         target_folder = target_group.folder
-        auth = AuthorizationPolicy(AuthContext(source_group=context.source_group, is_main=context.is_main))
+        auth = policy_for(context.source_group, context.is_main)
         if not auth.can_schedule_task(target_folder):
             raise IpcHandlerError("Unauthorized schedule_task attempt", {"sourceGroup": context.source_group, "targetFolder": target_folder})
 
@@ -62,6 +66,8 @@ class ScheduleTaskHandler(IpcCommandHandler):
             logger.info("Task created via IPC", task_id=task_id, source_group=context.source_group, target_folder=target_folder)
         except Exception as err:
             raise IpcHandlerError(str(err), {"scheduleType": payload.schedule_type, "scheduleValue": payload.schedule_value})
+        # The new task may already be due: let the scheduler check now rather than at its next interval
+        context.deps.wake_scheduler()
 
 
 # --- PauseTaskHandler ---
@@ -101,6 +107,7 @@ class ResumeTaskHandler(IpcCommandHandler):
         except Exception as err:
             raise IpcHandlerError(str(err), {"taskId": task_id, "sourceGroup": context.source_group})
         context.deps.task_manager.resume(task_id)
+        context.deps.wake_scheduler()
         logger.info("Task resumed via IPC", task_id=task_id, source_group=context.source_group)
 
 
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
 import time
-import random
-import string
 
 from g2.groups.paths import GroupPaths
 from g2.infrastructure.logger import logger
 
+# Per-process message sequence: makes filenames unique within a millisecond and keeps them in send order
+_message_seq = itertools.count()
+
 
 class IpcTransport:
     """Handles file-based IPC communication with containers.
@@ -21,11 +23,9 @@ class IpcTransport:
 
     def send_message(self, group_folder: str, text: str) -> bool:
         """Write a message file for the container to read."""
-        input_dir = GroupPaths.ipc_input_dir(group_folder)
         try:
-            input_dir.mkdir(parents=True, exist_ok=True)
-            rand = "".join(random.choices(string.ascii_lowercase + string.digits, k=4))
-            filename = f"{int(time.time() * 1000)}-{rand}.json"
+            input_dir = GroupPaths.ensure_ipc_input_dir(group_folder)
+            filename = f"{time.time_ns() // 1_000_000}-{next(_message_seq):08x}.json"
             filepath = input_dir / filename
             temp_path = filepath.with_suffix(".json.tmp")
             temp_path.write_text(json.dumps({"type": "message", "text": text}))
@@ -37,9 +37,8 @@ class IpcTransport:
 
     def close_stdin(self, group_folder: str) -> None:
         """Write a close sentinel file to signal the container to wind down."""
-        input_dir = GroupPaths.ipc_input_dir(group_folder)
         try:
-            input_dir.mkdir(parents=True, exist_ok=True)
+            input_dir = GroupPaths.ensure_ipc_input_dir(group_folder)
             (input_dir / "_close").write_text("")
         except Exception as err:
             logger.warning("Failed to write close sentinel", error=str(err), group_folder=group_folder)
@@ -7,7 +7,7 @@ import json
 from pathlib import Path
 from typing import Any, Callable, Awaitable
 
-from g2.groups.authorization import AuthContext, AuthorizationPolicy
+from g2.groups.authorization import policy_for
 from g2.groups.paths import GroupPaths
 from g2.groups.types import RegisteredGroup
 from g2.infrastructure.config import DATA_DIR, IPC_POLL_INTERVAL, MAIN_GROUP_FOLDER
@@ -46,6 +46,8 @@ class IpcDeps:
         session_manager: SessionManager,
         close_stdin: Callable[[str], None],
         task_manager: TaskManager,
+        jid_for_folder: Callable[[str], str | None],
+        wake_scheduler: Callable[[], None],
     ) -> None:
         self.send_message = send_message
         self.send_media = send_media
@@ -57,6 +59,8 @@ class IpcDeps:
         self.session_manager = session_manager
         self.close_stdin = close_stdin
         self.task_manager = task_manager
+        self.jid_for_folder = jid_for_folder
+        self.wake_scheduler = wake_scheduler
 
 
 # Fallback poll interval: slower since watchfiles handles the fast path
@@ -189,7 +193,7 @@ class IpcWatcher:
 
                 if data.get("type") == "message" and data.get("chatJid") and data.get("text"):
                     target_group = registered_groups.get(data["chatJid"])
-                    auth = AuthorizationPolicy(AuthContext(source_group=source_group, is_main=is_main))
+                    auth = policy_for(source_group, is_main)
                     if auth.can_send_message(target_group.folder if target_group else ""):
                         await deps.send_message(data["chatJid"], data["text"])
                         logger.info("IPC message sent", chat_jid=data["chatJid"], source_group=source_group)
@@ -201,7 +205,7 @@ class IpcWatcher:
                         logger.warning("sendMedia not available, ignoring media IPC", source_group=source_group)
                     else:
                         target_group = registered_groups.get(data["chatJid"])
-                        auth = AuthorizationPolicy(AuthContext(source_group=source_group, is_main=is_main))
+                        auth = policy_for(source_group, is_main)
                         if auth.can_send_message(target_group.folder if target_group else ""):
                             group_dir = GroupPaths.group_dir(source_group)
                             resolved = (group_dir / data["filePath"]).resolve()
@@ -5,23 +5,38 @@ from __future__ import annotations
 from g2.infrastructure.logger import logger
 from g2.messaging.types import Channel
 
+_OWNER_CACHE_MAX = 4096
+
 
 class ChannelRegistry:
     """Manages registered channels and routes JIDs to the correct channel."""
 
     def __init__(self) -> None:
         self._channels: list[Channel] = []
+        # JID -> channels owning it, in registration order. Ownership is fixed per
+        # channel, so only connection state is checked on each lookup.
+        self._owners: dict[str, tuple[Channel, ...]] = {}
 
     def register(self, channel: Channel) -> None:
         if any(c.name == channel.name for c in self._channels):
             raise ValueError(f'Channel "{channel.name}" is already registered')
         self._channels.append(channel)
+        self._owners.clear()
+
+    def _owners_of(self, jid: str) -> tuple[Channel, ...]:
+        owners = self._owners.get(jid)
+        if owners is None:
+            if len(self._owners) >= _OWNER_CACHE_MAX:
+                self._owners.clear()
+            owners = self._owners[jid] = tuple(c for c in self._channels if c.owns_jid(jid))
+        return owners
 
     def find_by_jid(self, jid: str) -> Channel | None:
-        return next((c for c in self._channels if c.owns_jid(jid)), None)
+        owners = self._owners_of(jid)
+        return owners[0] if owners else None
 
     def find_connected_by_jid(self, jid: str) -> Channel | None:
-        return next((c for c in self._channels if c.owns_jid(jid) and c.is_connected()), None)
+        return next((c for c in self._owners_of(jid) if c.is_connected()), None)
 
     def get_all(self) -> list[Channel]:
         return list(self._channels)
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Callable
 
 from g2.groups.types import RegisteredGroup
+from g2.infrastructure.config import GMAIL_CONFIG_DIR
 from g2.infrastructure.logger import logger
 from g2.infrastructure.poll_loop import PollLoop, start_poll_loop
 from g2.messaging.types import NewMessage, OnChatMetadata, OnInboundMessage
@@ -181,7 +182,7 @@ class GmailChannel:
         self._reply_target: dict | None = None
 
     async def connect(self) -> None:
-        config_dir = str(Path.home() / ".gmail-mcp")
+        config_dir = str(GMAIL_CONFIG_DIR)
         self._client = GmailClient(config_dir)
         self._connected = True
 
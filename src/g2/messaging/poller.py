@@ -20,6 +20,9 @@ from g2.messaging.formatter import format_messages, strip_internal_tags
 from g2.messaging.repository import MessageRepository
 from g2.messaging.types import NewMessage
 
+# After a new-message wakeup, wait this long so a burst of messages is handled by one poll
+MESSAGE_BATCH_S = 0.005
+
 
 def has_trigger(messages: list[NewMessage], group: RegisteredGroup) -> bool:
     """Check if any message matches the group's trigger pattern."""
@@ -116,7 +119,7 @@ class MessageProcessor:
                 else:
                     self._queue.enqueue_message_check(chat_jid)
 
-        return start_poll_loop("Message", POLL_INTERVAL, poll)
+        return start_poll_loop("Message", POLL_INTERVAL, poll, MESSAGE_BATCH_S)
 
     async def process_group_messages(self, chat_jid: str) -> bool:
         """Process accumulated messages for a group. Called by the execution queue."""
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from g2.groups.paths import GroupPaths
+from g2.infrastructure.logger import logger
 from g2.scheduling.task_service import TaskManager
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from pathlib import Path
+
 
 @dataclass
 class AvailableGroup:
@@ -18,36 +26,64 @@ class AvailableGroup:
     is_registered: bool
 
 
+def _log_write_failure(future: Future[None]) -> None:
+    if (err := future.exception()) is not None:
+        logger.warning("Failed to write snapshot", error=str(err))
+
+
 class SnapshotWriter:
     """Writes JSON snapshot files for container-visible state."""
 
     def __init__(self, task_manager: TaskManager) -> None:
         self._task_manager = task_manager
+        # Content last written per snapshot file (minus timestamps), to skip unchanged rewrites
+        # Touched only by the writer thread
+        self._written: dict[Path, str] = {}
+        # Every write goes through this one thread, in the order it was requested, so a
+        # later snapshot is never overwritten by an earlier one and the loop never blocks on disk
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-writer")
+
+    def _write_snapshot(self, path: Path, key: str, content: str, skip_unchanged: bool) -> None:
+        self._executor.submit(self._write_file, path, key, content, skip_unchanged).add_done_callback(
+            _log_write_failure
+        )
+
+    def _write_file(self, path: Path, key: str, content: str, skip_unchanged: bool) -> None:
+        if skip_unchanged and self._written.get(path) == key and path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic write (tmp + rename) so containers never read a partial snapshot
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(content)
+        tmp_path.replace(path)
+        self._written[path] = key
+
+    async def drain(self) -> None:
+        """Wait until every snapshot write requested so far is on disk."""
+        await asyncio.wrap_future(self._executor.submit(lambda: None))
 
     def write_tasks(
         self,
         group_folder: str,
         is_main: bool,
         tasks: list[dict],
+        skip_unchanged: bool = False,
     ) -> None:
         """Write a filtered tasks snapshot for the container."""
-        ipc_dir = GroupPaths.ipc_dir(group_folder)
-        ipc_dir.mkdir(parents=True, exist_ok=True)
-
         filtered = tasks if is_main else [t for t in tasks if t.get("groupFolder") == group_folder]
 
-        tasks_file = ipc_dir / "current_tasks.json"
-        tasks_file.write_text(json.dumps(filtered, indent=2))
+        content = json.dumps(filtered, indent=2)
+        self._write_snapshot(GroupPaths.ipc_dir(group_folder) / "current_tasks.json", content, content, skip_unchanged)
 
     def write_session_history(
         self,
         group_folder: str,
         sessions: list[dict],
+        skip_unchanged: bool = False,
     ) -> None:
         """Write session history snapshot."""
-        ipc_dir = GroupPaths.ipc_dir(group_folder)
-        ipc_dir.mkdir(parents=True, exist_ok=True)
-        (ipc_dir / "session_history.json").write_text(json.dumps(sessions, indent=2))
+        content = json.dumps(sessions, indent=2)
+        self._write_snapshot(GroupPaths.ipc_dir(group_folder) / "session_history.json", content, content, skip_unchanged)
 
     def write_groups(
         self,
@@ -55,38 +91,37 @@ class SnapshotWriter:
         is_main: bool,
         groups: list[AvailableGroup],
         _registered_jids: set[str],
+        skip_unchanged: bool = False,
     ) -> None:
         """Write available groups snapshot. Only main sees all groups."""
-        ipc_dir = GroupPaths.ipc_dir(group_folder)
-        ipc_dir.mkdir(parents=True, exist_ok=True)
-
         visible = [{"jid": g.jid, "name": g.name, "lastActivity": g.last_activity, "isRegistered": g.is_registered} for g in groups] if is_main else []
 
-        (ipc_dir / "available_groups.json").write_text(
-            json.dumps({"groups": visible, "lastSync": datetime.now().isoformat()}, indent=2)
+        self._write_snapshot(
+            GroupPaths.ipc_dir(group_folder) / "available_groups.json",
+            json.dumps(visible),
+            json.dumps({"groups": visible, "lastSync": datetime.now().isoformat()}, indent=2),
+            skip_unchanged,
         )
 
+    def _task_snapshot(self) -> list[dict]:
+        return [
+            {
+                "id": t.id,
+                "groupFolder": t.group_folder,
+                "prompt": t.prompt,
+                "schedule_type": t.schedule_type,
+                "schedule_value": t.schedule_value,
+                "status": t.status,
+                "next_run": t.next_run,
+            }
+            for t in self._task_manager.get_all()
+        ]
+
     def refresh_tasks(self, group_folder: str, is_main: bool) -> None:
         """Refresh tasks snapshot from the database."""
-        tasks = self._task_manager.get_all()
-        self.write_tasks(
-            group_folder,
-            is_main,
-            [
-                {
-                    "id": t.id,
-                    "groupFolder": t.group_folder,
-                    "prompt": t.prompt,
-                    "schedule_type": t.schedule_type,
-                    "schedule_value": t.schedule_value,
-                    "status": t.status,
-                    "next_run": t.next_run,
-                }
-                for t in tasks
-            ],
-        )
+        self.write_tasks(group_folder, is_main, self._task_snapshot())
 
-    def prepare_for_execution(
+    async def prepare_for_execution(
         self,
         group_folder: str,
         is_main: bool,
@@ -94,7 +129,13 @@ class SnapshotWriter:
         registered_jids: set[str],
         conversation_archives: list[dict],
     ) -> None:
-        """Prepare all snapshots for a container execution."""
-        self.refresh_tasks(group_folder, is_main)
-        self.write_groups(group_folder, is_main, available_groups, registered_jids)
-        self.write_session_history(group_folder, conversation_archives)
+        """Prepare all snapshots for a container execution.
+
+        Tasks are read from the database on the calling thread, which owns the
+        connection. The files are written by the writer thread, skipping any
+        whose content is unchanged since this writer last wrote it.
+        """
+        self.write_tasks(group_folder, is_main, self._task_snapshot(), skip_unchanged=True)
+        self.write_groups(group_folder, is_main, available_groups, registered_jids, skip_unchanged=True)
+        self.write_session_history(group_folder, conversation_archives, skip_unchanged=True)
+        await self.drain()
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from croniter import croniter
 
-from g2.groups.authorization import AuthContext, AuthorizationPolicy
+from g2.groups.authorization import policy_for
 from g2.infrastructure.config import TIMEZONE
 from g2.scheduling.repository import TaskRepository
 from g2.scheduling.types import ScheduledTask, TaskRunLog
@@ -99,7 +99,7 @@ class TaskManager:
         task = self._task_repo.get_task_by_id(task_id)
         if not task:
             raise ValueError(f"Task not found: {task_id}")
-        auth = AuthorizationPolicy(AuthContext(source_group=source_group, is_main=is_main))
+        auth = policy_for(source_group, is_main)
         if not auth.can_manage_task(task.group_folder):
             raise PermissionError(f"Unauthorized task management: {task_id}")
         return task
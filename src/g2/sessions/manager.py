@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from g2.groups.paths import GroupPaths
 from g2.infrastructure.logger import logger
 from g2.sessions.repository import SessionRepository
 from g2.sessions.types import ArchivedSession
 
+if TYPE_CHECKING:
+    from g2.sessions.repository import ArchiveRow
+
 
 # --- Transcript parsing ---
 
@@ -114,30 +118,26 @@ class SessionManager:
     def delete_archive(self, id: int) -> None:
         self._session_repo.delete_archive(id)
 
+    def _archive_current(self, group_folder: str, save_name: str | None) -> ArchiveRow | None:
+        """Archive entry for the current session under save_name, or None if there is nothing to save."""
+        session_id = self.get(group_folder)
+        if not (session_id and save_name):
+            return None
+        content = read_and_format_transcript(group_folder, session_id, save_name)
+        return session_id, save_name, content or "", datetime.now().isoformat()
+
     def clear(self, group_folder: str, save_name: str | None = None) -> None:
         """Clear the current session, optionally archiving it first."""
-        session_id = self.get(group_folder)
-        if session_id and save_name:
-            content = read_and_format_transcript(group_folder, session_id, save_name)
-            self._session_repo.insert_archive(
-                group_folder, session_id, save_name, content or "", datetime.now().isoformat()
-            )
-        self.delete(group_folder)
-
-    def resume(self, group_folder: str, archive_id: int, save_name: str | None = None) -> str:
-        """Resume a previously archived session."""
+        self._session_repo.clear_session(group_folder, self._archive_current(group_folder, save_name))
+        self._sessions.pop(group_folder, None)
+
+    def resume(self, group_folder: str, archive_id: int, save_name: str | None = None) -> str | None:
+        """Resume a previously archived session. Returns its session ID, or None if the archive entry doesn't exist."""
         target = self._session_repo.get_archive_by_id(archive_id)
         if not target:
-            raise ValueError(f"Conversation archive entry not found: {archive_id}")
-
-        if save_name:
-            current_session_id = self.get(group_folder)
-            if current_session_id:
-                content = read_and_format_transcript(group_folder, current_session_id, save_name)
-                self._session_repo.insert_archive(
-                    group_folder, current_session_id, save_name, content or "", datetime.now().isoformat()
-                )
-
-        self.set(group_folder, target.session_id)
-        self._session_repo.delete_archive(target.id)
+            return None
+
+        archive = self._archive_current(group_folder, save_name)
+        self._session_repo.restore_archive(group_folder, target.id, target.session_id, archive)
+        self._sessions[group_folder] = target.session_id
         return target.session_id
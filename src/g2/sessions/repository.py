@@ -6,6 +6,15 @@ import sqlite3
 
 from g2.sessions.types import ArchivedSession
 
+_UPSERT_SESSION_SQL = "INSERT OR REPLACE INTO sessions (group_folder, session_id) VALUES (?, ?)"
+_DELETE_SESSION_SQL = "DELETE FROM sessions WHERE group_folder = ?"
+_INSERT_ARCHIVE_SQL = """INSERT INTO conversation_archives (group_folder, session_id, name, content, archived_at)
+    VALUES (?, ?, ?, ?, ?)"""
+_DELETE_ARCHIVE_SQL = "DELETE FROM conversation_archives WHERE id = ?"
+
+# An archive entry to write: (session_id, name, content, archived_at)
+ArchiveRow = tuple[str, str, str, str]
+
 
 class SessionRepository:
     def __init__(self, db: sqlite3.Connection) -> None:
@@ -18,13 +27,11 @@ class SessionRepository:
         return row["session_id"] if row else None
 
     def set_session(self, group_folder: str, session_id: str) -> None:
-        self._db.execute(
-            "INSERT OR REPLACE INTO sessions (group_folder, session_id) VALUES (?, ?)", (group_folder, session_id)
-        )
+        self._db.execute(_UPSERT_SESSION_SQL, (group_folder, session_id))
         self._db.commit()
 
     def delete_session(self, group_folder: str) -> None:
-        self._db.execute("DELETE FROM sessions WHERE group_folder = ?", (group_folder,))
+        self._db.execute(_DELETE_SESSION_SQL, (group_folder,))
         self._db.commit()
 
     def get_all_sessions(self) -> dict[str, str]:
@@ -36,11 +43,7 @@ class SessionRepository:
     def insert_archive(
         self, group_folder: str, session_id: str, name: str, content: str, archived_at: str
     ) -> None:
-        self._db.execute(
-            """INSERT INTO conversation_archives (group_folder, session_id, name, content, archived_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            (group_folder, session_id, name, content, archived_at),
-        )
+        self._db.execute(_INSERT_ARCHIVE_SQL, (group_folder, session_id, name, content, archived_at))
         self._db.commit()
 
     def get_archives(self, group_folder: str) -> list[dict]:
@@ -67,5 +70,24 @@ class SessionRepository:
         return [dict(row) for row in rows]
 
     def delete_archive(self, id: int) -> None:
-        self._db.execute("DELETE FROM conversation_archives WHERE id = ?", (id,))
+        self._db.execute(_DELETE_ARCHIVE_SQL, (id,))
         self._db.commit()
+
+    # --- Combined lifecycle writes (one transaction, one commit) ---
+
+    def clear_session(self, group_folder: str, archive: ArchiveRow | None = None) -> None:
+        """Delete the active session, first archiving the given entry if any."""
+        with self._db:
+            if archive:
+                self._db.execute(_INSERT_ARCHIVE_SQL, (group_folder, *archive))
+            self._db.execute(_DELETE_SESSION_SQL, (group_folder,))
+
+    def restore_archive(
+        self, group_folder: str, archive_id: int, session_id: str, archive: ArchiveRow | None = None
+    ) -> None:
+        """Make an archived session active and drop its archive entry, first archiving the given entry if any."""
+        with self._db:
+            if archive:
+                self._db.execute(_INSERT_ARCHIVE_SQL, (group_folder, *archive))
+            self._db.execute(_UPSERT_SESSION_SQL, (group_folder, session_id))
+            self._db.execute(_DELETE_ARCHIVE_SQL, (archive_id,))
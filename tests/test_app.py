@@ -0,0 +1,38 @@
+"""Tests for the orchestrator's group registration."""
+
+from g2.app import Orchestrator
+from g2.groups.types import RegisteredGroup
+
+
+def _group(folder: str) -> RegisteredGroup:
+    return RegisteredGroup(name=folder.title(), folder=folder, trigger="@g2", added_at="2026-01-01")
+
+
+class TestRegisterGroup:
+    def _orchestrator(self, db, tmp_path, monkeypatch) -> Orchestrator:
+        monkeypatch.setattr("g2.app.GROUPS_DIR", tmp_path)
+        orchestrator = Orchestrator()
+        orchestrator._db = db
+        return orchestrator
+
+    def test_registered_folder_resolves_to_jid(self, db, tmp_path, monkeypatch):
+        orchestrator = self._orchestrator(db, tmp_path, monkeypatch)
+        orchestrator._register_group("a@g.us", _group("alpha"))
+        assert orchestrator._jid_for_folder("alpha") == "a@g.us"
+        assert orchestrator._jid_for_folder("missing") is None
+
+    def test_reregistering_under_new_folder_drops_old_folder(self, db, tmp_path, monkeypatch):
+        orchestrator = self._orchestrator(db, tmp_path, monkeypatch)
+        orchestrator._register_group("a@g.us", _group("alpha"))
+        orchestrator._register_group("a@g.us", _group("beta"))
+        assert orchestrator._jid_for_folder("beta") == "a@g.us"
+        assert orchestrator._jid_for_folder("alpha") is None
+
+    def test_reused_folder_resolves_to_its_new_owner(self, db, tmp_path, monkeypatch):
+        orchestrator = self._orchestrator(db, tmp_path, monkeypatch)
+        orchestrator._register_group("a@g.us", _group("alpha"))
+        orchestrator._register_group("b@g.us", _group("alpha"))
+        # a@g.us moving on must not unmap the folder b@g.us now owns
+        orchestrator._register_group("a@g.us", _group("gamma"))
+        assert orchestrator._jid_for_folder("alpha") == "b@g.us"
+        assert orchestrator._jid_for_folder("gamma") == "a@g.us"
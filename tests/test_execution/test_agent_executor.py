@@ -0,0 +1,61 @@
+"""Tests for agent executor session tracking."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from g2.execution.agent_executor import AgentExecutor
+from g2.execution.output_parser import ContainerOutput
+from g2.groups.types import RegisteredGroup
+
+GROUP = RegisteredGroup(name="Main", folder="main", trigger="@g2", added_at="2026-01-01")
+
+
+class FakeRunner:
+    def __init__(self, streamed: list[ContainerOutput], final: ContainerOutput):
+        self.streamed = streamed
+        self.final = final
+
+    async def run(self, group, input_data, on_process=None, on_output=None):
+        for output in self.streamed:
+            await on_output(output)
+        return self.final
+
+
+def make_executor(runner, session_id=None):
+    sessions = MagicMock()
+    sessions.get.return_value = session_id
+    sessions.get_archives.return_value = []
+    executor = AgentExecutor(
+        session_manager=sessions,
+        queue=MagicMock(),
+        get_available_groups=list,
+        get_registered_groups=dict,
+        snapshot_writer=MagicMock(prepare_for_execution=AsyncMock()),
+        container_runner=runner,
+    )
+    return executor, sessions
+
+
+class TestSessionTracking:
+    async def test_records_each_new_session_id_once(self):
+        runner = FakeRunner(
+            [ContainerOutput(new_session_id="s1"), ContainerOutput(new_session_id="s1"), ContainerOutput()],
+            ContainerOutput(new_session_id="s1"),
+        )
+        executor, sessions = make_executor(runner)
+
+        assert await executor.execute(GROUP, "hi", "a@g.us") == "success"
+        sessions.set.assert_called_once_with("main", "s1")
+
+    async def test_skips_write_when_session_unchanged(self):
+        runner = FakeRunner([ContainerOutput(new_session_id="s1")], ContainerOutput(new_session_id="s1"))
+        executor, sessions = make_executor(runner, session_id="s1")
+
+        await executor.execute(GROUP, "hi", "a@g.us")
+        sessions.set.assert_not_called()
+
+    async def test_records_final_session_id_when_not_streamed(self):
+        runner = FakeRunner([], ContainerOutput(new_session_id="s2"))
+        executor, sessions = make_executor(runner, session_id="s1")
+
+        await executor.execute(GROUP, "hi", "a@g.us")
+        sessions.set.assert_called_once_with("main", "s2")
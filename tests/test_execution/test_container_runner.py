@@ -0,0 +1,204 @@
+"""Tests for container runner stream reading."""
+
+import asyncio
+import json
+import logging
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from g2.execution.container_runner import READ_CHUNK_SIZE, ContainerInput, ContainerRunner, read_line_batches
+from g2.execution.output_parser import OUTPUT_END_MARKER, OUTPUT_START_MARKER
+from g2.groups.types import RegisteredGroup
+from g2.infrastructure.config import TimeoutConfig
+
+
+async def collect(chunks: list[bytes]) -> list[bytes]:
+    stream = asyncio.StreamReader()
+    for chunk in chunks:
+        stream.feed_data(chunk)
+    stream.feed_eof()
+    lines: list[bytes] = []
+    async for batch in read_line_batches(stream):
+        lines.extend(batch)
+    return lines
+
+
+class TestReadLineBatches:
+    async def test_splits_lines_within_a_chunk(self):
+        assert await collect([b"one\ntwo\nthree\n"]) == [b"one", b"two", b"three"]
+
+    async def test_joins_lines_split_across_chunks(self):
+        stream = asyncio.StreamReader()
+        batches: list[list[bytes]] = []
+
+        async def reader():
+            async for batch in read_line_batches(stream):
+                batches.append(batch)
+
+        task = asyncio.create_task(reader())
+        for chunk in (b"par", b"tial\nnext", b" line\n"):
+            stream.feed_data(chunk)
+            await asyncio.sleep(0)
+        stream.feed_eof()
+        await task
+        assert [line for batch in batches for line in batch] == [b"partial", b"next line"]
+
+    async def test_yields_unterminated_tail_at_eof(self):
+        assert await collect([b"done\nno newline"]) == [b"done", b"no newline"]
+
+    async def test_handles_lines_longer_than_a_chunk(self):
+        long_line = b"x" * (READ_CHUNK_SIZE * 3)
+        assert await collect([long_line + b"\nshort\n"]) == [long_line, b"short"]
+
+    async def test_accumulates_unterminated_line_over_many_chunks(self):
+        chunks = [b"x" * 100] * 500
+        assert await collect([*chunks, b"\nafter"]) == [b"x" * 50_000, b"after"]
+
+
+class TestLoadSecrets:
+    def test_rereads_env_only_when_it_changes(self, tmp_path, monkeypatch):
+        env_file = tmp_path / ".env"
+        env_file.write_text("ANTHROPIC_API_KEY=first\nOTHER=ignored\n")
+        monkeypatch.chdir(tmp_path)
+        runner = ContainerRunner(mount_factory=NoMounts())
+
+        secrets, env_args = runner._load_secrets()
+        assert secrets == {"ANTHROPIC_API_KEY": "first"}
+        assert env_args == ("-e", "ANTHROPIC_API_KEY=first")
+        assert runner._load_secrets()[0] is secrets
+
+        env_file.write_text("ANTHROPIC_API_KEY=second-key\n")
+        os.utime(env_file, ns=(1, 1))
+        assert runner._load_secrets()[0] == {"ANTHROPIC_API_KEY": "second-key"}
+
+    def test_returns_no_secrets_without_env_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        runner = ContainerRunner(mount_factory=NoMounts())
+        assert runner._load_secrets() == ({}, ())
+
+
+class FakeRuntime:
+    def __init__(self, script):
+        self.bin = str(script)
+
+
+class NoMounts:
+    def build_mounts(self, group, is_main):
+        return []
+
+
+def make_runner(tmp_path, body, timeout_config=None):
+    script = tmp_path / "fake-runtime"
+    script.write_text("#!/bin/sh\ncat > /dev/null\n" + body)
+    script.chmod(0o755)
+    return ContainerRunner(runtime=FakeRuntime(script), mount_factory=NoMounts(), timeout_config=timeout_config)
+
+
+GROUP = RegisteredGroup(name="Main", folder="main", trigger="@g2", added_at="2026-01-01")
+INPUT = ContainerInput(prompt="hi", session_id=None, group_folder="main", chat_jid="a@g.us", is_main=True)
+
+
+class TestRun:
+    async def test_streams_outputs_from_stdout(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        payload = json.dumps({"status": "success", "result": "done", "newSessionId": "s1"})
+        runner = make_runner(
+            tmp_path,
+            f"echo noise >&2\necho '{OUTPUT_START_MARKER}'\necho '{payload}'\necho '{OUTPUT_END_MARKER}'\n",
+        )
+        seen = []
+
+        async def on_output(output):
+            seen.append(output)
+
+        result = await runner.run(GROUP, INPUT, on_output=on_output)
+        assert result.result == "done"
+        assert [o.new_session_id for o in seen] == ["s1"]
+
+    async def test_kills_container_on_hard_timeout(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        # Hard timeout is max(container, idle + 30s), so this gives 100ms
+        runner = make_runner(tmp_path, "exec sleep 5\n", TimeoutConfig(container_timeout=100, idle_timeout=-29_900))
+
+        result = await asyncio.wait_for(runner.run(GROUP, INPUT), timeout=3)
+        assert result.status == "error"
+        assert result.error == "Container timeout"
+
+    async def test_kills_container_when_output_callback_fails(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        payload = json.dumps({"status": "success", "result": "done"})
+        runner = make_runner(
+            tmp_path,
+            f"echo '{OUTPUT_START_MARKER}'\necho '{payload}'\necho '{OUTPUT_END_MARKER}'\nexec sleep 5\n",
+        )
+        procs = []
+
+        async def on_output(output):
+            raise ValueError("callback failed")
+
+        with pytest.raises(ValueError, match="callback failed"):
+            await runner.run(GROUP, INPUT, on_process=lambda proc, name: procs.append(proc), on_output=on_output)
+        assert await asyncio.wait_for(procs[0].wait(), timeout=3) != 0
+
+    async def test_container_names_are_unique_per_launch(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        runner = make_runner(tmp_path, "")
+        names = []
+
+        for _ in range(3):
+            await runner.run(GROUP, INPUT, on_process=lambda proc, name: names.append(name))
+
+        assert len(set(names)) == 3
+        assert all(name.startswith("g2-main-") for name in names)
+
+    async def test_logs_stderr_only_when_debug_enabled(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        runner = make_runner(tmp_path, "echo first >&2\necho second >&2\n")
+        fake_logger = MagicMock()
+        monkeypatch.setattr("g2.execution.container_runner.logger", fake_logger)
+        root = logging.getLogger()
+        previous_level = root.level
+        try:
+            root.setLevel(logging.INFO)
+            procs = []
+            await runner.run(GROUP, INPUT, on_process=lambda proc, name: procs.append(proc))
+            assert procs[0].stderr is None
+            assert not any(c.args[0] == "Container stderr" for c in fake_logger.debug.call_args_list)
+
+            root.setLevel(logging.DEBUG)
+            await runner.run(GROUP, INPUT)
+        finally:
+            root.setLevel(previous_level)
+        logged = [c.kwargs["line"] for c in fake_logger.debug.call_args_list if c.args[0] == "Container stderr"]
+        assert "\n".join(logged) == "first\nsecond"
+
+    async def test_logs_one_info_record_per_launch(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        runner = make_runner(tmp_path, "")
+        fake_logger = MagicMock()
+        monkeypatch.setattr("g2.execution.container_runner.logger", fake_logger)
+
+        await runner.run(GROUP, INPUT)
+
+        [record] = fake_logger.info.call_args_list
+        assert record.args == ("Container finished",)
+        assert record.kwargs["group"] == "Main"
+        assert record.kwargs["status"] == "success"
+        assert record.kwargs["duration_ms"] >= 0
+
+
+class TestHardTimeout:
+    def test_computed_once_per_timeout_override(self):
+        timeout_config = MagicMock(wraps=TimeoutConfig(container_timeout=60_000, idle_timeout=10_000))
+        runner = ContainerRunner(mount_factory=NoMounts(), timeout_config=timeout_config)
+        custom = RegisteredGroup(
+            name="Other", folder="other", trigger="@g2", added_at="2026-01-01", container_config={"timeout": 120_000}
+        )
+
+        assert runner._hard_timeout_s(GROUP) == 60
+        assert runner._hard_timeout_s(GROUP) == 60
+        assert runner._hard_timeout_s(custom) == 120
+        assert runner._hard_timeout_s(custom) == 120
+        assert timeout_config.for_group.call_count == 2
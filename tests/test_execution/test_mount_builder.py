@@ -0,0 +1,91 @@
+"""Tests for container mount construction."""
+
+import pytest
+
+from g2.execution import mount_builder
+from g2.execution.mount_builder import DefaultMountFactory
+from g2.groups.types import RegisteredGroup
+
+GROUP = RegisteredGroup(name="Team", folder="team", trigger="@g2", added_at="2026-01-01")
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    groups_dir = tmp_path / "groups"
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr("g2.groups.paths.GROUPS_DIR", groups_dir)
+    monkeypatch.setattr("g2.groups.paths.DATA_DIR", data_dir)
+    monkeypatch.setattr(mount_builder, "GROUPS_DIR", groups_dir)
+    return groups_dir, data_dir
+
+
+class TestDefaultMountFactory:
+    def test_does_not_load_allowlist_without_additional_mounts(self, dirs, monkeypatch):
+        def fail():
+            raise AssertionError("allowlist loaded")
+
+        monkeypatch.setattr("g2.execution.mount_builder.get_resolved_allowlist", fail)
+        factory = DefaultMountFactory()
+        factory.build_mounts(GROUP, is_main=True)
+        assert not hasattr(factory, "__dict__")
+
+    def test_mounts_group_ipc_and_sessions(self, dirs):
+        groups_dir, data_dir = dirs
+        mounts = DefaultMountFactory().build_mounts(GROUP, is_main=False)
+
+        assert f"{groups_dir / 'team'}:/workspace/group" in mounts
+        assert f"{data_dir / 'ipc' / 'team'}:/workspace/ipc" in mounts
+        assert (data_dir / "sessions" / "team" / ".claude").is_dir()
+
+    def test_main_claude_md_check_is_cached(self, dirs, monkeypatch):
+        groups_dir, _ = dirs
+        factory = DefaultMountFactory()
+        clock = [100.0]
+        monkeypatch.setattr(mount_builder.time, "monotonic", lambda: clock[0])
+
+        assert not any("CLAUDE.md" in arg for arg in factory.build_mounts(GROUP, is_main=False))
+
+        (groups_dir / "main").mkdir(parents=True)
+        (groups_dir / "main" / "CLAUDE.md").write_text("# Main")
+        assert not any("CLAUDE.md" in arg for arg in factory.build_mounts(GROUP, is_main=False))
+
+        clock[0] += mount_builder.MAIN_CLAUDE_MD_TTL_S
+        assert any("CLAUDE.md" in arg for arg in factory.build_mounts(GROUP, is_main=False))
+
+    def test_creates_directories_once(self, dirs, monkeypatch):
+        factory = DefaultMountFactory()
+        factory.build_mounts(GROUP, is_main=True)
+        created = set(factory._known_dirs)
+        assert len(created) == 3
+        assert all(path.is_dir() for path in created)
+
+        calls = []
+        monkeypatch.setattr(mount_builder.Path, "mkdir", lambda self, **kwargs: calls.append(self))
+        factory.build_mounts(GROUP, is_main=True)
+        assert calls == []
+
+    def test_additional_mount_resolution_is_cached(self, dirs, tmp_path, monkeypatch):
+        monkeypatch.setattr("g2.execution.mount_builder.get_resolved_allowlist", lambda: None)
+        (tmp_path / "real").mkdir()
+        (tmp_path / "other").mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(tmp_path / "real")
+        group = RegisteredGroup(
+            name="Team",
+            folder="team",
+            trigger="@g2",
+            added_at="2026-01-01",
+            container_config={"additional_mounts": [{"host_path": str(link)}]},
+        )
+        factory = DefaultMountFactory()
+        clock = [100.0]
+        monkeypatch.setattr(mount_builder.time, "monotonic", lambda: clock[0])
+
+        assert f"{tmp_path / 'real'}:/workspace/extra/real:ro" in factory.build_mounts(group, is_main=True)
+
+        link.unlink()
+        link.symlink_to(tmp_path / "other")
+        assert f"{tmp_path / 'real'}:/workspace/extra/real:ro" in factory.build_mounts(group, is_main=True)
+
+        clock[0] += mount_builder.HOST_PATH_TTL_S
+        assert f"{tmp_path / 'other'}:/workspace/extra/other:ro" in factory.build_mounts(group, is_main=True)
@@ -0,0 +1,112 @@
+"""Tests for mount allowlist loading and validation."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from g2.execution import mount_security
+from g2.execution.mount_security import (
+    get_mount_allowlist,
+    get_resolved_allowlist,
+    load_mount_allowlist,
+    validate_mount,
+)
+
+
+@pytest.fixture
+def allowlist_path(tmp_path, monkeypatch):
+    path = tmp_path / "mount-allowlist.json"
+    monkeypatch.setattr(mount_security, "MOUNT_ALLOWLIST_PATH", path)
+    monkeypatch.setattr(mount_security, "_allowlist_cache", None)
+    return path
+
+
+def write_allowlist(path, roots, blocked=()):
+    path.write_text(json.dumps({"allowed_roots": roots, "blocked_patterns": list(blocked)}))
+
+
+class TestGetMountAllowlist:
+    def test_returns_none_without_file(self, allowlist_path):
+        assert get_mount_allowlist() is None
+
+    def test_invalid_file_returns_none(self, allowlist_path):
+        for raw in ("not json", "[]", '{"allowed_roots": "nope", "blocked_patterns": []}'):
+            allowlist_path.write_text(raw)
+            assert load_mount_allowlist() is None, raw
+
+    def test_reparses_only_when_file_changes(self, allowlist_path, tmp_path):
+        write_allowlist(allowlist_path, [{"path": str(tmp_path)}])
+        first = get_mount_allowlist()
+        assert first is not None
+        assert get_mount_allowlist() is first
+
+        write_allowlist(allowlist_path, [{"path": str(tmp_path), "allow_read_write": True}, {"path": "/srv"}])
+        os.utime(allowlist_path, ns=(1, 1))
+        second = get_mount_allowlist()
+        assert second is not first
+        assert len(second.allowed_roots) == 2
+
+    def test_picks_up_deleted_file(self, allowlist_path, tmp_path):
+        write_allowlist(allowlist_path, [{"path": str(tmp_path)}])
+        assert get_mount_allowlist() is not None
+        allowlist_path.unlink()
+        assert get_mount_allowlist() is None
+
+    def test_resolves_roots_once_per_load(self, allowlist_path, tmp_path):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        write_allowlist(
+            allowlist_path, [{"path": str(tmp_path / "link"), "allow_read_write": True}], blocked=["~/.ssh"]
+        )
+
+        resolved = get_resolved_allowlist()
+        assert resolved is get_resolved_allowlist()
+        assert resolved.blocked == {str(Path.home() / ".ssh")}
+        assert validate_mount(str(tmp_path / "real"), resolved, is_main=True) == (True, False)
+        assert validate_mount(str(tmp_path / "link" / "sub"), resolved, is_main=True) == (True, False)
+
+
+class TestValidateMount:
+    def test_allows_paths_under_roots(self, allowlist_path, tmp_path):
+        (tmp_path / "projects" / "app").mkdir(parents=True)
+        write_allowlist(allowlist_path, [{"path": str(tmp_path / "projects"), "allow_read_write": True}])
+        allowlist = get_mount_allowlist()
+
+        assert validate_mount(str(tmp_path / "projects" / "app"), allowlist, is_main=True) == (True, False)
+        assert validate_mount(str(tmp_path / "projects" / "app"), allowlist, is_main=False) == (True, True)
+        assert validate_mount(str(tmp_path / "projects-other"), allowlist, is_main=True) == (False, True)
+
+    def test_blocked_patterns_win(self, allowlist_path, tmp_path):
+        write_allowlist(allowlist_path, [{"path": str(tmp_path)}], blocked=[str(tmp_path / ".ssh")])
+        allowlist = get_mount_allowlist()
+
+        assert validate_mount(str(tmp_path / ".ssh"), allowlist, is_main=True) == (False, True)
+        assert validate_mount(str(tmp_path / "code"), allowlist, is_main=True) == (True, True)
+
+    def test_first_listed_root_wins(self, allowlist_path, tmp_path):
+        write_allowlist(
+            allowlist_path,
+            [
+                {"path": str(tmp_path / "a" / "rw"), "allow_read_write": True},
+                {"path": str(tmp_path / "a")},
+                {"path": str(tmp_path / "a" / "ro-shadowed"), "allow_read_write": True},
+            ],
+        )
+        allowlist = get_resolved_allowlist()
+
+        assert validate_mount(str(tmp_path / "a" / "rw" / "x"), allowlist, is_main=True) == (True, False)
+        assert validate_mount(str(tmp_path / "a" / "other"), allowlist, is_main=True) == (True, True)
+        assert validate_mount(str(tmp_path / "a" / "ro-shadowed"), allowlist, is_main=True) == (True, True)
+        assert validate_mount(str(tmp_path / "ab"), allowlist, is_main=True) == (False, True)
+
+    def test_blocked_patterns_match_string_prefixes(self, allowlist_path, tmp_path):
+        write_allowlist(allowlist_path, [{"path": str(tmp_path)}], blocked=[str(tmp_path / "secret"), "/nope"])
+        allowlist = get_resolved_allowlist()
+
+        assert validate_mount(str(tmp_path / "secrets-dir"), allowlist, is_main=True) == (False, True)
+        assert validate_mount(str(tmp_path / "public"), allowlist, is_main=True) == (True, True)
+
+    def test_no_allowlist_allows_read_only(self):
+        assert validate_mount("/anywhere", None, is_main=True) == (True, True)
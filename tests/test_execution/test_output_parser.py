@@ -81,3 +81,65 @@ class TestContainerOutputParser:
         parser.feed(json.dumps({"result": "Done"}))
         output = parser.feed(OUTPUT_END_MARKER)
         assert output.status == "success"
+
+    def test_feed_chunk_parses_utf8_block(self):
+        parser = ContainerOutputParser()
+        stream = (
+            b"log line \xff\n"
+            + OUTPUT_START_MARKER.encode()
+            + b"\r\n"
+            + json.dumps({"result": "café"}, ensure_ascii=False).encode()
+            + b"\n"
+            + OUTPUT_END_MARKER.encode()
+            + b"\n"
+        )
+        [output] = parser.feed_chunk(stream)
+        assert output.result == "café"
+
+    def test_feed_chunk_reports_undecodable_block(self):
+        parser = ContainerOutputParser()
+        [output] = parser.feed_chunk(
+            OUTPUT_START_MARKER.encode() + b'\n{"result": "\xff"}\n' + OUTPUT_END_MARKER.encode() + b"\n"
+        )
+        assert output.status == "error"
+        assert "Failed to parse output" in output.error
+
+    def test_feed_chunk_handles_any_split(self):
+        blocks = [json.dumps({"result": f"r{i}", "newSessionId": "s"}) for i in range(3)]
+        stream = "".join(
+            f"noise {i} {OUTPUT_START_MARKER}\n{OUTPUT_START_MARKER}\n{block}\n{OUTPUT_END_MARKER}\n"
+            for i, block in enumerate(blocks)
+        ).encode()
+
+        for size in (1, 2, 7, 64, len(stream)):
+            parser = ContainerOutputParser()
+            outputs = []
+            for i in range(0, len(stream), size):
+                outputs.extend(parser.feed_chunk(stream[i : i + size]))
+            outputs.extend(parser.finish())
+            assert [o.result for o in outputs] == ["r0", "r1", "r2"], size
+
+    def test_marker_must_fill_its_line(self):
+        parser = ContainerOutputParser()
+        stream = f"{OUTPUT_START_MARKER}x\n{{}}\n{OUTPUT_END_MARKER}x\n".encode()
+        assert parser.feed_chunk(stream) == []
+
+    def test_stray_end_marker_reports_empty_block(self):
+        stream = f"log\n{OUTPUT_END_MARKER}\n{OUTPUT_START_MARKER}\n{{\"result\": \"ok\"}}\n{OUTPUT_END_MARKER}\n".encode()
+        for size in (1, 5, len(stream)):
+            parser = ContainerOutputParser()
+            outputs = []
+            for i in range(0, len(stream), size):
+                outputs.extend(parser.feed_chunk(stream[i : i + size]))
+            outputs.extend(parser.finish())
+            assert [(o.status, o.error, o.result) for o in outputs] == [
+                ("error", "Failed to parse output: ", None),
+                ("success", None, "ok"),
+            ], size
+
+    def test_repeated_start_marker_restarts_block(self):
+        parser = ContainerOutputParser()
+        stream = f'{OUTPUT_START_MARKER}\npartial\n{OUTPUT_START_MARKER}\n{{"result": "ok"}}\n{OUTPUT_END_MARKER}'
+        assert parser.feed_chunk(stream.encode()) == []
+        [output] = parser.finish()
+        assert output.result == "ok"
@@ -1,10 +1,11 @@
 """Tests for execution queue."""
 
 import asyncio
+from unittest.mock import MagicMock
 
 import pytest
 
-from g2.execution.execution_queue import GroupQueue, GroupState
+from g2.execution.execution_queue import GroupQueue, GroupState, default_concurrency_limit
 
 
 class TestGroupQueue:
@@ -19,7 +20,8 @@ class TestGroupQueue:
         assert isinstance(state, GroupState)
         assert not state.active
         assert not state.pending_messages
-        assert state.pending_tasks == []
+        assert not state.pending_tasks
+        assert not state.pending_task_ids
 
     def test_get_group_returns_same_state(self):
         queue = GroupQueue()
@@ -29,7 +31,7 @@ class TestGroupQueue:
 
     def test_enqueue_message_check_during_shutdown(self):
         queue = GroupQueue()
-        queue._shutting_down = True
+        queue._shutdown_evt.set()
         queue.enqueue_message_check("test@g.us")
         assert "test@g.us" not in queue._groups
 
@@ -69,6 +71,56 @@ class TestGroupQueue:
         await asyncio.sleep(0.2)
         assert call_count == 1  # First call happened
 
+    @pytest.mark.asyncio
+    async def test_shutdown_ends_pending_retry_backoff(self):
+        queue = GroupQueue()
+
+        async def process_fn(group_jid: str) -> bool:
+            return False
+
+        queue.set_process_messages_fn(process_fn)
+        queue.enqueue_message_check("test@g.us")
+        await asyncio.sleep(0.05)
+
+        retries = asyncio.all_tasks() - {asyncio.current_task()}
+        assert len(retries) == 1  # backing off for BASE_RETRY_S
+
+        await queue.shutdown()
+        await asyncio.sleep(0.01)
+        assert all(task.done() for task in retries)
+
+    @pytest.mark.asyncio
+    async def test_retry_backoff_doubles_up_to_cap(self, monkeypatch):
+        monkeypatch.setattr("g2.execution.execution_queue.MAX_RETRIES", 20)
+        fake_logger = MagicMock()
+        monkeypatch.setattr("g2.execution.execution_queue.logger", fake_logger)
+        queue = GroupQueue()
+        state = queue._get_group("test@g.us")
+
+        for _ in range(13):
+            queue._schedule_retry("test@g.us", state)
+
+        delays = [c.kwargs["delay_s"] for c in fake_logger.info.call_args_list]
+        assert delays[:3] == [5.0, 10.0, 20.0]
+        assert delays[-3:] == [5.0 * 1024] * 3
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_coalesces_burst_of_message_checks(self):
+        queue = GroupQueue()
+        calls = []
+
+        async def process_fn(group_jid: str) -> bool:
+            calls.append(group_jid)
+            return True
+
+        queue.set_process_messages_fn(process_fn)
+        for _ in range(5):
+            queue.enqueue_message_check("test@g.us")
+
+        await asyncio.sleep(0.05)
+        assert calls == ["test@g.us"]
+
     @pytest.mark.asyncio
     async def test_queues_when_active(self):
         queue = GroupQueue()
@@ -92,6 +144,132 @@ class TestGroupQueue:
         gate.set()
         await asyncio.sleep(0.1)
 
+    @pytest.mark.asyncio
+    async def test_deduplicates_queued_tasks(self):
+        queue = GroupQueue()
+        gate = asyncio.Event()
+        ran = []
+
+        async def process_fn(group_jid: str) -> bool:
+            await gate.wait()
+            return True
+
+        def make_task(task_id: str):
+            async def fn() -> None:
+                ran.append(task_id)
+
+            return fn
+
+        queue.set_process_messages_fn(process_fn)
+        queue.enqueue_message_check("test@g.us")
+        await asyncio.sleep(0.05)
+
+        queue.enqueue_task("test@g.us", "task-1", make_task("task-1"))
+        queue.enqueue_task("test@g.us", "task-1", make_task("task-1"))
+        queue.enqueue_task("test@g.us", "task-2", make_task("task-2"))
+        state = queue._get_group("test@g.us")
+        assert [t.id for t in state.pending_tasks] == ["task-1", "task-2"]
+
+        gate.set()
+        await asyncio.sleep(0.1)
+        assert ran == ["task-1", "task-2"]
+        assert not state.pending_task_ids
+
+        # Once run, the same id can be queued again
+        queue.enqueue_task("test@g.us", "task-1", make_task("task-1"))
+        await asyncio.sleep(0.05)
+        assert ran == ["task-1", "task-2", "task-1"]
+
+    @pytest.mark.asyncio
+    async def test_waiting_groups_drain_in_arrival_order(self, monkeypatch):
+        monkeypatch.setattr("g2.execution.execution_queue.MAX_CONCURRENT_CONTAINERS", 1)
+        queue = GroupQueue()
+        gates: dict[str, asyncio.Event] = {}
+        calls = []
+
+        async def process_fn(group_jid: str) -> bool:
+            calls.append(group_jid)
+            await gates.setdefault(group_jid, asyncio.Event()).wait()
+            return True
+
+        queue.set_process_messages_fn(process_fn)
+        queue.enqueue_message_check("a@g.us")
+        await asyncio.sleep(0.05)
+
+        for jid in ("d@g.us", "b@g.us", "c@g.us", "d@g.us"):
+            queue.enqueue_message_check(jid)
+        assert list(queue._waiting_order) == ["d@g.us", "b@g.us", "c@g.us"]
+
+        # Each freed slot starts only the oldest waiter
+        for finished, expected in (("a@g.us", "d@g.us"), ("d@g.us", "b@g.us"), ("b@g.us", "c@g.us")):
+            gates[finished].set()
+            await asyncio.sleep(0.05)
+            assert calls[-1] == expected
+            assert queue._active_count == 1
+        assert calls == ["a@g.us", "d@g.us", "b@g.us", "c@g.us"]
+        assert not queue._waiting_set
+        gates["c@g.us"].set()
+        await asyncio.sleep(0.05)
+
+    def test_concurrency_limit_is_capped_by_usable_cpus(self, monkeypatch):
+        monkeypatch.setattr("g2.execution.execution_queue.MAX_CONCURRENT_CONTAINERS", 5)
+        monkeypatch.setattr("os.sched_getaffinity", lambda pid: {0}, raising=False)
+        assert default_concurrency_limit() == 2
+        assert GroupQueue().max_concurrent == 2
+        assert GroupQueue(max_concurrent=4).max_concurrent == 4
+
+        monkeypatch.setattr("os.sched_getaffinity", lambda pid: set(range(16)), raising=False)
+        assert default_concurrency_limit() == 5
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_starts_waiting_groups(self):
+        queue = GroupQueue(max_concurrent=1)
+        gate = asyncio.Event()
+        calls = []
+
+        async def process_fn(group_jid: str) -> bool:
+            calls.append(group_jid)
+            await gate.wait()
+            return True
+
+        queue.set_process_messages_fn(process_fn)
+        queue.enqueue_message_check("a@g.us")
+        await asyncio.sleep(0.05)
+        queue.enqueue_message_check("b@g.us")
+        await asyncio.sleep(0.05)
+        assert calls == ["a@g.us"]
+
+        queue.set_max_concurrent(2)
+        await asyncio.sleep(0.05)
+        assert calls == ["a@g.us", "b@g.us"]
+        gate.set()
+        await asyncio.sleep(0.05)
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_by_one_starts_exactly_one_waiter(self):
+        queue = GroupQueue(max_concurrent=1)
+        gate = asyncio.Event()
+        calls = []
+
+        async def process_fn(group_jid: str) -> bool:
+            calls.append(group_jid)
+            await gate.wait()
+            return True
+
+        queue.set_process_messages_fn(process_fn)
+        queue.enqueue_message_check("a@g.us")
+        await asyncio.sleep(0.05)
+        for jid in ("b@g.us", "c@g.us", "d@g.us", "e@g.us"):
+            queue.enqueue_message_check(jid)
+
+        queue.set_max_concurrent(2)
+        await asyncio.sleep(0.05)
+        assert calls == ["a@g.us", "b@g.us"]
+        assert queue._active_count == 2
+        assert list(queue._waiting_order) == ["c@g.us", "d@g.us", "e@g.us"]
+        gate.set()
+        await asyncio.sleep(0.05)
+
     @pytest.mark.asyncio
     async def test_shutdown(self):
         queue = GroupQueue()
@@ -1,6 +1,8 @@
 """Tests for authorization policy."""
 
-from g2.groups.authorization import AuthContext, AuthorizationPolicy
+import pytest
+
+from g2.groups.authorization import AuthContext, AuthorizationPolicy, policy_for
 
 
 def _main_policy() -> AuthorizationPolicy:
@@ -87,3 +89,20 @@ class TestAuthContext:
     def test_is_main_property(self):
         assert _main_policy().is_main is True
         assert _non_main_policy().is_main is False
+
+    def test_context_is_immutable(self):
+        ctx = AuthContext(source_group="my-group", is_main=False)
+        with pytest.raises(AttributeError):
+            ctx.is_main = True  # type: ignore[misc]
+
+
+class TestPolicyFor:
+    def test_reuses_policy_per_context(self):
+        assert policy_for("my-group", False) is policy_for("my-group", False)
+        assert policy_for("my-group", False) is not policy_for("my-group", True)
+
+    def test_matches_constructed_policy(self):
+        policy = policy_for("project-a", False)
+        assert policy.source_group == "project-a"
+        assert policy.can_manage_task("project-a") is True
+        assert policy.can_manage_task("project-b") is False
@@ -0,0 +1,36 @@
+"""Tests for group path construction."""
+
+from g2.groups.paths import GroupPaths
+
+
+class TestGroupPaths:
+    def test_builds_group_and_data_paths(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("g2.groups.paths.GROUPS_DIR", tmp_path / "groups")
+        monkeypatch.setattr("g2.groups.paths.DATA_DIR", tmp_path / "data")
+
+        assert GroupPaths.group_dir("team") == tmp_path / "groups" / "team"
+        assert GroupPaths.logs_dir("team") == tmp_path / "groups" / "team" / "logs"
+        assert GroupPaths.ipc_tasks_dir("team") == tmp_path / "data" / "ipc" / "team" / "tasks"
+        assert GroupPaths.session_transcript("team", "s1") == (
+            tmp_path / "data" / "sessions" / "team" / ".claude" / "projects" / "-workspace-group" / "s1.jsonl"
+        )
+
+    def test_reuses_paths_per_folder(self):
+        assert GroupPaths.ipc_dir("team") is GroupPaths.ipc_dir("team")
+
+    def test_follows_reassigned_base_dirs(self, tmp_path, monkeypatch):
+        before = GroupPaths.ipc_dir("team")
+        monkeypatch.setattr("g2.groups.paths.DATA_DIR", tmp_path)
+        assert GroupPaths.ipc_dir("team") == tmp_path / "ipc" / "team"
+        assert GroupPaths.ipc_dir("team") != before
+
+    def test_ensure_dir_creates_once(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("g2.groups.paths.DATA_DIR", tmp_path)
+        input_dir = GroupPaths.ensure_ipc_input_dir("team")
+        assert input_dir == tmp_path / "ipc" / "team" / "input"
+        assert input_dir.is_dir()
+
+        calls = []
+        monkeypatch.setattr("g2.groups.paths.Path.mkdir", lambda self, **kwargs: calls.append(self))
+        assert GroupPaths.ensure_ipc_input_dir("team") == input_dir
+        assert calls == []
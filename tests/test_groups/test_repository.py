@@ -56,6 +56,12 @@ class TestGroupRepository:
         assert result.container_config is not None
         assert result.container_config.timeout == 600000
 
+    def test_unusable_container_config_reads_as_none(self, group_repo):
+        for raw in ("not json", "[1, 2]", '{"timeout": "soon"}', "{}"):
+            group_repo.set_registered_group("test@g.us", _group())
+            group_repo._db.execute("UPDATE registered_groups SET container_config = ? WHERE jid = ?", (raw, "test@g.us"))
+            assert group_repo.get_registered_group("test@g.us").container_config is None, raw
+
     def test_dict_input_for_migrations(self, group_repo):
         group_repo.set_registered_group("test@g.us", {
             "name": "Migrated",
@@ -71,3 +77,14 @@ class TestGroupRepository:
         group_repo.set_registered_group("test@g.us", _group())
         result = group_repo.get_registered_group("test@g.us")
         assert result.requires_trigger is True
+
+
+class TestBulkUpsert:
+    def test_set_registered_groups(self, group_repo):
+        group_repo.set_registered_groups({
+            "g1@g.us": _group(name="Group 1", folder="g1"),
+            "g2@g.us": {"name": "Group 2", "folder": "g2", "trigger": "@G2", "added_at": "2024-01-01"},
+        })
+        all_groups = group_repo.get_all_registered_groups()
+        assert sorted(all_groups) == ["g1@g.us", "g2@g.us"]
+        assert all_groups["g2@g.us"].name == "Group 2"
@@ -4,7 +4,9 @@ import os
 import tempfile
 from pathlib import Path
 
-from g2.infrastructure.config import read_env_file, TimeoutConfig
+from g2.groups.types import ContainerConfig, RegisteredGroup
+from g2.infrastructure import config
+from g2.infrastructure.config import TRIGGER_PATTERN, is_trigger, read_env_file, TimeoutConfig
 
 
 class TestReadEnvFile:
@@ -33,6 +35,22 @@ class TestReadEnvFile:
         result = read_env_file(["KEY1"])
         assert result == {"KEY1": "value1"}
 
+    def test_line_edge_cases(self, tmp_path, monkeypatch):
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "  KEY1 = spaced  \r\n"
+            "KEY2=a=b # kept\n"
+            "  # KEY3=commented\n"
+            "KEY4=\n"
+            'KEY5="\n'
+            "KEY6='unbalanced\n"
+            "KEY1=last wins\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        result = read_env_file(["KEY1", "KEY2", "KEY3", "KEY4", "KEY5", "KEY6"])
+        assert result == {"KEY1": "last wins", "KEY2": "a=b # kept", "KEY6": "'unbalanced"}
+
     def test_skips_empty_lines(self, tmp_path, monkeypatch):
         env_file = tmp_path / ".env"
         env_file.write_text("\n\nKEY1=value1\n\n")
@@ -81,3 +99,48 @@ class TestTimeoutConfig:
         config = TimeoutConfig(container_timeout=5000, idle_timeout=10000)
         assert config.container_timeout == 5000
         assert config.idle_timeout == 10000
+
+    def test_for_group_reuses_config_without_override(self):
+        config = TimeoutConfig(container_timeout=5000, idle_timeout=10000)
+        group = RegisteredGroup(name="G", folder="g", trigger="@G2", added_at="2024-01-01")
+        assert config.for_group(group) is config
+
+        group.container_config = ContainerConfig(timeout=90000)
+        custom = config.for_group(group)
+        assert (custom.container_timeout, custom.idle_timeout) == (90000, 10000)
+
+
+class TestIsTrigger:
+    def test_matches_trigger_pattern(self):
+        for text in ["@G2 hello", "@g2", "@G2, hi", "@G2x", "@G2_bot", "hi @G2", "@G", "", "@G2é", "@G2\nmore"]:
+            assert is_trigger(text) == bool(TRIGGER_PATTERN.match(text)), text
+
+
+class TestResolveTimezone:
+    def test_reads_localtime_symlink(self, monkeypatch):
+        monkeypatch.delenv("TZ", raising=False)
+        monkeypatch.setattr(config.os, "readlink", lambda path: "/usr/share/zoneinfo/America/New_York")
+        assert config._resolve_timezone() == "America/New_York"
+
+    def test_relative_localtime_symlink(self, monkeypatch):
+        monkeypatch.delenv("TZ", raising=False)
+        monkeypatch.setattr(config.os, "readlink", lambda path: "../usr/share/zoneinfo/Europe/Berlin")
+        assert config._resolve_timezone() == "Europe/Berlin"
+
+    def test_non_zoneinfo_symlink_falls_back_to_etc_timezone(self, monkeypatch):
+        monkeypatch.delenv("TZ", raising=False)
+        monkeypatch.setattr(config.os, "readlink", lambda path: "/var/lib/localtime")
+        monkeypatch.setattr(config.Path, "read_bytes", lambda self: b"Australia/Sydney\n")
+        assert config._resolve_timezone() == "Australia/Sydney"
+
+    def test_tz_env_wins(self, monkeypatch):
+        monkeypatch.setenv("TZ", "Asia/Tokyo")
+        assert config._resolve_timezone() == "Asia/Tokyo"
+
+    def test_invalid_tz_falls_back_to_utc(self, monkeypatch):
+        monkeypatch.setenv("TZ", "Not/AZone")
+        assert config._resolve_timezone() == "UTC"
+
+    def test_get_timezone_is_memoized(self, monkeypatch):
+        monkeypatch.setattr(config, "_timezone", "Europe/Paris")
+        assert config.get_timezone() == "Europe/Paris"
@@ -1,6 +1,13 @@
 """Tests for database initialization and schema."""
 
-from g2.infrastructure.database import AppDatabase
+import asyncio
+import contextlib
+import sqlite3
+
+import pytest
+
+from g2.infrastructure.config import ASSISTANT_NAME
+from g2.infrastructure.database import SCHEMA_VERSION, AppDatabase, create_schema
 
 
 class TestAppDatabase:
@@ -35,6 +42,31 @@ class TestAppDatabase:
         db._init_test()
         db._init_test()  # Should not raise
 
+    def test_schema_version_recorded(self):
+        db = AppDatabase()
+        db._init_test()
+        assert db.db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    def test_migrates_legacy_tables(self):
+        conn = sqlite3.connect(":memory:")
+        conn.executescript("""
+            CREATE TABLE chats (jid TEXT PRIMARY KEY, name TEXT, last_message_time TEXT);
+            CREATE TABLE messages (id TEXT, chat_jid TEXT, sender TEXT, sender_name TEXT, content TEXT,
+                timestamp TEXT, is_from_me INTEGER, PRIMARY KEY (id, chat_jid));
+            INSERT INTO chats (jid) VALUES ('123@g.us'), ('tg:42');
+        """)
+        conn.executemany(
+            "INSERT INTO messages (id, chat_jid, content) VALUES (?, ?, ?)",
+            [("m1", "123@g.us", f"{ASSISTANT_NAME}: hi"), ("m2", "tg:42", "hey")],
+        )
+        create_schema(conn)
+
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert dict(conn.execute("SELECT jid, channel FROM chats")) == {"123@g.us": "whatsapp", "tg:42": "telegram"}
+        assert dict(conn.execute("SELECT id, is_bot_message FROM messages")) == {"m1": 1, "m2": 0}
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(messages)")}
+        assert {"media_type", "media_mimetype", "media_path"} <= columns
+
 
 class TestStateRepo:
     def test_set_and_get(self):
@@ -48,6 +80,50 @@ class TestStateRepo:
         db._init_test()
         assert db.state_repo.get_router_state("nonexistent") is None
 
+    async def test_commit_deferred_on_event_loop(self, monkeypatch):
+        monkeypatch.setattr("g2.infrastructure.state_repo.COMMIT_DELAY_S", 0.01)
+        db = AppDatabase()
+        db._init_test()
+        db.state_repo.set_router_state("key1", "value1")
+        db.state_repo.set_router_state("key2", "value2")
+        assert db.db.execute("SELECT COUNT(*) FROM router_state").fetchone()[0] == 0
+        assert db.state_repo.get_router_state("key2") == "value2"
+
+        await asyncio.sleep(0.05)
+        assert db.db.execute("SELECT COUNT(*) FROM router_state").fetchone()[0] == 2
+        assert not db.db.in_transaction
+
+    async def test_pending_writes_survive_another_repos_rollback(self):
+        db = AppDatabase()
+        db._init_test()
+        db.state_repo.set_router_state("key1", "value1")
+        with contextlib.suppress(RuntimeError), db.db:
+            db.db.execute("INSERT OR REPLACE INTO router_state (key, value) VALUES ('other', 'x')")
+            raise RuntimeError("rolled back")
+
+        db.state_repo.flush()
+        assert db.state_repo.get_router_state("key1") == "value1"
+
+    async def test_flush_commits_immediately(self):
+        db = AppDatabase()
+        db._init_test()
+        db.state_repo.set_router_state("key1", "value1")
+        db.state_repo.flush()
+        assert not db.db.in_transaction
+
+    async def test_failed_flush_keeps_pending_writes(self):
+        db = AppDatabase()
+        db._init_test()
+        db.state_repo.set_router_state("key1", "value1")
+        db.db.execute("ALTER TABLE router_state RENAME TO router_state_moved")
+        with pytest.raises(sqlite3.OperationalError):
+            db.state_repo.flush()
+        db.db.execute("ALTER TABLE router_state_moved RENAME TO router_state")
+
+        assert db.state_repo.get_router_state("key1") == "value1"
+        db.state_repo.flush()
+        assert db.db.execute("SELECT value FROM router_state WHERE key = 'key1'").fetchone()[0] == "value1"
+
     def test_upsert(self):
         db = AppDatabase()
         db._init_test()
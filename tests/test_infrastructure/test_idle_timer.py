@@ -0,0 +1,44 @@
+"""Tests for the resettable idle timer."""
+
+import asyncio
+
+from g2.infrastructure.idle_timer import IdleTimer
+
+
+class TestIdleTimer:
+    async def test_fires_after_timeout(self):
+        fired = []
+        timer = IdleTimer(lambda: fired.append(1), 0.01)
+        timer.reset()
+        await asyncio.sleep(0.03)
+        assert fired == [1]
+
+    async def test_reset_postpones(self):
+        fired = []
+        timer = IdleTimer(lambda: fired.append(1), 0.03)
+        timer.reset()
+        await asyncio.sleep(0.02)
+        timer.reset()
+        await asyncio.sleep(0.02)
+        assert fired == []
+        await asyncio.sleep(0.03)
+        assert fired == [1]
+
+    async def test_clear_cancels(self):
+        fired = []
+        timer = IdleTimer(lambda: fired.append(1), 0.01)
+        timer.reset()
+        timer.clear()
+        await asyncio.sleep(0.03)
+        assert fired == []
+
+    async def test_awaits_async_callback(self):
+        fired = []
+
+        async def callback():
+            fired.append(1)
+
+        timer = IdleTimer(callback, 0.01)
+        timer.reset()
+        await asyncio.sleep(0.03)
+        assert fired == [1]
@@ -0,0 +1,53 @@
+"""Tests for the shared polling loop."""
+
+import asyncio
+
+from g2.infrastructure.poll_loop import PollLoop
+
+
+class TestPollLoop:
+    async def test_wake_runs_before_interval(self):
+        calls = []
+
+        async def fn():
+            calls.append(1)
+
+        loop = PollLoop("Test", 60.0, fn)
+        loop.start()
+        await asyncio.sleep(0.01)
+        assert len(calls) == 1
+
+        loop.wake()
+        await asyncio.sleep(0.01)
+        loop.stop()
+        assert len(calls) == 2
+
+    async def test_wakes_within_batch_window_share_one_run(self):
+        calls = []
+
+        async def fn():
+            calls.append(1)
+
+        loop = PollLoop("Test", 60.0, fn, min_batch_s=0.05)
+        loop.start()
+        await asyncio.sleep(0.01)
+
+        loop.wake()
+        await asyncio.sleep(0.01)
+        loop.wake()
+        loop.wake()
+        await asyncio.sleep(0.1)
+        loop.stop()
+        assert len(calls) == 2
+
+    async def test_polls_at_interval_without_wake(self):
+        calls = []
+
+        async def fn():
+            calls.append(1)
+
+        loop = PollLoop("Test", 0.01, fn)
+        loop.start()
+        await asyncio.sleep(0.055)
+        loop.stop()
+        assert len(calls) >= 3
@@ -2,6 +2,7 @@
 
 import pytest
 
+from g2.ipc import dispatcher as dispatcher_module
 from g2.ipc.dispatcher import IpcCommandDispatcher, IpcCommandHandler, IpcHandlerError, HandlerContext
 from typing import Any
 
@@ -67,3 +68,19 @@ class TestIpcDispatcher:
         _, context = handler.called_with
         assert context.source_group == "project-a"
         assert context.is_main is False
+
+    @pytest.mark.asyncio
+    async def test_unknown_command_warnings_rate_limited(self, monkeypatch):
+        warnings = []
+        monkeypatch.setattr(dispatcher_module.logger, "warning", lambda event, **kw: warnings.append(kw))
+        clock = [100.0]
+        monkeypatch.setattr(dispatcher_module.time, "monotonic", lambda: clock[0])
+        dispatcher = IpcCommandDispatcher([MockHandler("known")])
+
+        for _ in range(dispatcher_module.UNKNOWN_LOG_LIMIT + 5):
+            await dispatcher.dispatch({"type": "unknown"}, "main", True, None)
+        assert len(warnings) == dispatcher_module.UNKNOWN_LOG_LIMIT
+
+        clock[0] += dispatcher_module.UNKNOWN_LOG_WINDOW_S
+        await dispatcher.dispatch({"type": "unknown"}, "main", True, None)
+        assert warnings[-1] == {"type": "unknown", "suppressed": 5}
@@ -0,0 +1,56 @@
+"""Tests for channel registry."""
+
+import pytest
+
+from g2.messaging.channel_registry import ChannelRegistry
+
+
+class FakeChannel:
+    def __init__(self, name: str, prefix: str, connected: bool = True):
+        self.name = name
+        self._prefix = prefix
+        self.connected = connected
+        self.owns_calls = 0
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def owns_jid(self, jid: str) -> bool:
+        self.owns_calls += 1
+        return jid.startswith(self._prefix)
+
+
+class TestChannelRegistry:
+    def test_routes_jid_to_owning_channel(self):
+        registry = ChannelRegistry()
+        wa = FakeChannel("whatsapp", "wa:")
+        gmail = FakeChannel("gmail", "gmail:")
+        registry.register(wa)
+        registry.register(gmail)
+
+        assert registry.find_by_jid("gmail:123") is gmail
+        assert registry.find_connected_by_jid("wa:1") is wa
+        assert registry.find_by_jid("other:1") is None
+
+    def test_rejects_duplicate_channel_names(self):
+        registry = ChannelRegistry()
+        registry.register(FakeChannel("whatsapp", "wa:"))
+        with pytest.raises(ValueError):
+            registry.register(FakeChannel("whatsapp", "wa:"))
+
+    def test_repeat_lookups_reuse_ownership_but_recheck_connection(self):
+        registry = ChannelRegistry()
+        wa = FakeChannel("whatsapp", "wa:")
+        registry.register(wa)
+
+        assert registry.find_connected_by_jid("wa:1") is wa
+        wa.connected = False
+        assert registry.find_connected_by_jid("wa:1") is None
+        assert wa.owns_calls == 1
+
+    def test_registering_a_channel_resets_routing(self):
+        registry = ChannelRegistry()
+        assert registry.find_by_jid("gmail:1") is None
+        gmail = FakeChannel("gmail", "gmail:")
+        registry.register(gmail)
+        assert registry.find_by_jid("gmail:1") is gmail
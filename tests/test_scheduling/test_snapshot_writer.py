@@ -0,0 +1,83 @@
+"""Tests for snapshot writer."""
+
+import asyncio
+import json
+
+import pytest
+
+from g2.infrastructure.database import AppDatabase
+from g2.scheduling.snapshot_writer import AvailableGroup, SnapshotWriter
+from g2.scheduling.task_service import TaskManager
+
+
+@pytest.fixture
+def task_manager():
+    db = AppDatabase()
+    db._init_test()
+    return TaskManager(db.task_repo)
+
+
+@pytest.fixture
+def ipc_root(tmp_path, monkeypatch):
+    monkeypatch.setattr("g2.groups.paths.DATA_DIR", tmp_path)
+    return tmp_path / "ipc"
+
+
+GROUPS = [AvailableGroup(jid="a@g.us", name="A", last_activity="2026-01-01", is_registered=True)]
+
+
+class TestPrepareForExecution:
+    async def test_writes_all_snapshots(self, task_manager, ipc_root):
+        task_manager.create("main", "a@g.us", "Say hello", "once", "2099-01-01T00:00:00")
+        writer = SnapshotWriter(task_manager)
+
+        await writer.prepare_for_execution("main", True, GROUPS, {"a@g.us"}, [{"id": "s1"}])
+
+        folder = ipc_root / "main"
+        tasks = json.loads((folder / "current_tasks.json").read_text())
+        assert [t["prompt"] for t in tasks] == ["Say hello"]
+        groups = json.loads((folder / "available_groups.json").read_text())
+        assert groups["groups"][0]["jid"] == "a@g.us"
+        assert json.loads((folder / "session_history.json").read_text()) == [{"id": "s1"}]
+
+    async def test_skips_unchanged_snapshots(self, task_manager, ipc_root):
+        writer = SnapshotWriter(task_manager)
+        await writer.prepare_for_execution("main", True, GROUPS, {"a@g.us"}, [])
+        groups_file = ipc_root / "main" / "available_groups.json"
+        first = groups_file.read_text()
+
+        await writer.prepare_for_execution("main", True, GROUPS, {"a@g.us"}, [])
+        assert groups_file.read_text() == first
+
+        renamed = [AvailableGroup(jid="a@g.us", name="Renamed", last_activity="2026-01-01", is_registered=True)]
+        await writer.prepare_for_execution("main", True, renamed, {"a@g.us"}, [])
+        assert json.loads(groups_file.read_text())["groups"][0]["name"] == "Renamed"
+
+    async def test_rewrites_deleted_snapshot(self, task_manager, ipc_root):
+        writer = SnapshotWriter(task_manager)
+        await writer.prepare_for_execution("main", True, GROUPS, {"a@g.us"}, [])
+        history = ipc_root / "main" / "session_history.json"
+        history.unlink()
+
+        await writer.prepare_for_execution("main", True, GROUPS, {"a@g.us"}, [])
+        assert history.exists()
+
+    async def test_refresh_after_prepare_is_not_overwritten(self, task_manager, ipc_root):
+        task_manager.create("main", "a@g.us", "Say hello", "once", "2099-01-01T00:00:00")
+        writer = SnapshotWriter(task_manager)
+
+        prepare = asyncio.create_task(writer.prepare_for_execution("main", True, GROUPS, {"a@g.us"}, []))
+        await asyncio.sleep(0)  # prepare has read its task snapshot and queued its writes
+        task_manager.create("main", "a@g.us", "Say bye", "once", "2099-01-01T00:00:00")
+        writer.refresh_tasks("main", True)
+        await prepare
+        await writer.drain()
+
+        folder = ipc_root / "main"
+        assert sorted(p.name for p in folder.iterdir()) == [
+            "available_groups.json",
+            "current_tasks.json",
+            "session_history.json",
+        ]
+        tasks = json.loads((folder / "current_tasks.json").read_text())
+        assert sorted(t["prompt"] for t in tasks) == ["Say bye", "Say hello"]
@@ -72,9 +72,27 @@ class TestArchiveLifecycle:
         assert restored == "sess-old"
         assert session_manager.get("main") == "sess-old"
 
-    def test_resume_nonexistent_raises(self, session_manager):
-        with pytest.raises(ValueError, match="not found"):
-            session_manager.resume("main", 999)
+    def test_clear_with_save_archives_current(self, session_manager):
+        session_manager.set("main", "sess-1")
+        session_manager.clear("main", save_name="Saved")
+        assert session_manager.get("main") is None
+        archives = session_manager.get_archives("main")
+        assert [(a["session_id"], a["name"]) for a in archives] == [("sess-1", "Saved")]
+
+    def test_resume_with_save_swaps_sessions(self, session_manager):
+        session_manager.archive("main", "sess-old", "Old Session", "content")
+        archive_id = session_manager.get_archives("main")[0]["id"]
+        session_manager.set("main", "sess-current")
+
+        assert session_manager.resume("main", archive_id, save_name="Current") == "sess-old"
+        assert session_manager.get("main") == "sess-old"
+        archives = session_manager.get_archives("main")
+        assert [(a["session_id"], a["name"]) for a in archives] == [("sess-current", "Current")]
+
+    def test_resume_nonexistent_returns_none(self, session_manager):
+        session_manager.set("main", "sess-current")
+        assert session_manager.resume("main", 999) is None
+        assert session_manager.get("main") == "sess-current"
 
 
 class TestTranscriptParsing:
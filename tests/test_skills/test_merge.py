@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from skills_engine.merge import is_git_repo, merge_file, setup_rerere_adapter
+from skills_engine.merge import apply_patches, is_git_repo, merge_file, setup_rerere_adapter
 
 from .conftest import init_git_repo
 
@@ -89,3 +91,70 @@ class TestMergeFile:
         merged = current.read_text()
         assert "<<<<<<<" in merged
         assert ">>>>>>>" in merged
+
+
+class TestApplyPatches:
+    @pytest.fixture(autouse=True)
+    def _setup_git(self, skills_tmp: Path) -> None:
+        self.tmp_dir = skills_tmp
+        init_git_repo(skills_tmp)
+        for name in ("a.txt", "b.txt"):
+            (skills_tmp / name).write_text("line1\nline2\nline3\n")
+        run_opts = {"cwd": str(skills_tmp), "capture_output": True, "check": True}
+        subprocess.run(["git", "add", "-A"], **run_opts)
+        subprocess.run(["git", "commit", "-m", "files"], **run_opts)
+
+    def _make_patch(self, name: str, new_content: str) -> Path:
+        file_path = self.tmp_dir / name
+        original = file_path.read_text()
+        file_path.write_text(new_content)
+        diff = subprocess.run(
+            ["git", "diff", "--", name],
+            cwd=str(self.tmp_dir),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        file_path.write_text(original)
+        # Make the rewritten file stat-dirty regardless of timestamp granularity
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        patch_path = self.tmp_dir / f"{name}.patch"
+        patch_path.write_text(diff)
+        return patch_path
+
+    def test_applies_all_clean_patches(self) -> None:
+        patch_a = self._make_patch("a.txt", "line1\nline2-a\nline3\n")
+        patch_b = self._make_patch("b.txt", "line1\nline2-b\nline3\n")
+
+        failed = apply_patches([patch_a, patch_b], self.tmp_dir)
+
+        assert failed == []
+        assert "line2-a" in (self.tmp_dir / "a.txt").read_text()
+        assert "line2-b" in (self.tmp_dir / "b.txt").read_text()
+
+    def test_clean_patches_apply_in_one_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        patch_a = self._make_patch("a.txt", "line1\nline2-a\nline3\n")
+        patch_b = self._make_patch("b.txt", "line1\nline2-b\nline3\n")
+        applies: list[list[str]] = []
+        real_run = subprocess.run
+
+        def spy_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+            if cmd[:3] == ["git", "apply", "--3way"]:
+                applies.append(cmd[3:])
+            return real_run(cmd, **kwargs)
+
+        monkeypatch.setattr("skills_engine.merge.subprocess.run", spy_run)
+
+        assert apply_patches([patch_a, patch_b], self.tmp_dir) == []
+        assert applies == [[str(patch_a), str(patch_b)]]
+
+    def test_reports_only_the_failing_patch(self) -> None:
+        patch_a = self._make_patch("a.txt", "line1\nline2-a\nline3\n")
+        bad_patch = self.tmp_dir / "bad.patch"
+        bad_patch.write_text("not a patch\n")
+
+        failed = apply_patches([patch_a, bad_patch], self.tmp_dir)
+
+        assert failed == [bad_patch]
+        assert "line2-a" in (self.tmp_dir / "a.txt").read_text()
@@ -2,17 +2,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from pathlib import Path
 
 import pytest
 
+from skills_engine import path_remap
+from skills_engine.constants import G2_DIR, STATE_FILE
 from skills_engine.path_remap import load_path_remap, record_path_remap, resolve_path_remap
 
 from .conftest import create_minimal_state
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 
 class TestResolvePathRemap:
     def test_returns_remapped_path_when_entry_exists(self) -> None:
@@ -33,6 +32,10 @@ class TestLoadPathRemap:
         self.tmp_dir = g2_dir
         create_minimal_state(g2_dir)
 
+    @staticmethod
+    def _state_path() -> Path:
+        return Path.cwd() / G2_DIR / STATE_FILE
+
     def test_returns_empty_dict_when_no_remap_in_state(self) -> None:
         remap = load_path_remap()
         assert remap == {}
@@ -42,6 +45,27 @@ class TestLoadPathRemap:
         remap = load_path_remap()
         assert remap == {"src/a.ts": "src/b.ts"}
 
+    def test_sees_remap_recorded_after_a_cached_load(self) -> None:
+        assert load_path_remap() == {}
+        record_path_remap({"src/a.ts": "src/b.ts"})
+        assert load_path_remap() == {"src/a.ts": "src/b.ts"}
+
+    def test_recently_written_state_is_not_cached(self) -> None:
+        record_path_remap({"src/a.ts": "src/b.ts"})
+        assert load_path_remap() == {"src/a.ts": "src/b.ts"}
+        assert self._state_path() not in path_remap._remap_cache
+
+    def test_settled_state_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        record_path_remap({"src/a.ts": "src/b.ts"})
+        monkeypatch.setattr(path_remap, "_RACY_WINDOW_NS", -1)
+        load_path_remap()
+        assert path_remap._remap_cache[self._state_path()][1] == {"src/a.ts": "src/b.ts"}
+
+    def test_returned_remap_is_not_shared_with_cache(self) -> None:
+        record_path_remap({"src/a.ts": "src/b.ts"})
+        load_path_remap()["src/x.ts"] = "src/y.ts"
+        assert load_path_remap() == {"src/a.ts": "src/b.ts"}
+
 
 class TestRecordPathRemap:
     @pytest.fixture(autouse=True)
@@ -7,7 +7,8 @@ from typing import TYPE_CHECKING
 import pytest
 import yaml
 
-from skills_engine.replay import find_skill_dir, replay_skills
+from skills_engine.replay import find_skill_dir, index_skill_dirs, replay_skills
+from skills_engine.state import compute_file_hash
 
 from .conftest import (
     create_minimal_state,
@@ -53,6 +54,42 @@ class TestFindSkillDir:
         assert result is None
 
 
+class TestIndexSkillDirs:
+    @pytest.fixture(autouse=True)
+    def _setup(self, g2_dir: Path) -> None:
+        self.tmp_dir = g2_dir
+        create_minimal_state(g2_dir)
+
+    def _write_manifest(self, dir_name: str, skill: str) -> Path:
+        skill_dir = self.tmp_dir / ".claude" / "skills" / dir_name
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        (skill_dir / "manifest.yaml").write_text(
+            yaml.safe_dump(
+                {
+                    "skill": skill,
+                    "version": "1.0.0",
+                    "core_version": "1.0.0",
+                    "adds": [],
+                    "modifies": [],
+                }
+            )
+        )
+        return skill_dir
+
+    def test_maps_manifest_names_to_directories(self) -> None:
+        telegram = self._write_manifest("telegram-pkg", "telegram")
+        discord = self._write_manifest("discord", "discord")
+        (self.tmp_dir / ".claude" / "skills" / "no-manifest").mkdir()
+        broken = self.tmp_dir / ".claude" / "skills" / "broken"
+        broken.mkdir()
+        (broken / "manifest.yaml").write_text("not: [valid")
+
+        assert index_skill_dirs(self.tmp_dir) == {"telegram": telegram, "discord": discord}
+
+    def test_returns_empty_when_skills_dir_does_not_exist(self) -> None:
+        assert index_skill_dirs(self.tmp_dir) == {}
+
+
 class TestReplaySkills:
     @pytest.fixture(autouse=True)
     def _setup(self, g2_dir: Path) -> None:
@@ -99,6 +136,12 @@ class TestReplaySkills:
         config = (self.tmp_dir / "src" / "config.ts").read_text()
         assert "telegram config" in config
 
+        # Hashes of the replayed files are returned per skill
+        assert result.file_hashes is not None
+        assert set(result.file_hashes["telegram"]) == {"src/telegram.ts", "src/config.ts"}
+        for rel_path, digest in result.file_hashes["telegram"].items():
+            assert digest == compute_file_hash(self.tmp_dir / rel_path)
+
     def test_replays_two_skills_in_order(self) -> None:
         # Set up base
         base_dir = self.tmp_dir / ".g2" / "base" / "src"
@@ -0,0 +1,33 @@
+"""Tests for the skill test runner."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from skills_engine.skill_tests import run_skill_test, run_skill_tests
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestRunSkillTests:
+    def test_single_passing_command(self, skills_tmp: Path) -> None:
+        assert run_skill_test("true", skills_tmp) is True
+
+    def test_single_failing_command(self, skills_tmp: Path) -> None:
+        assert run_skill_test("exit 1", skills_tmp) is False
+
+    def test_runs_commands_in_project_root(self, skills_tmp: Path) -> None:
+        (skills_tmp / "marker.txt").write_text("x")
+        assert run_skill_test("test -f marker.txt", skills_tmp) is True
+
+    def test_reports_each_skill_in_order(self, skills_tmp: Path) -> None:
+        results = run_skill_tests(
+            [("alpha", "true"), ("beta", "exit 1"), ("gamma", "true")],
+            skills_tmp,
+        )
+        assert list(results) == ["alpha", "beta", "gamma"]
+        assert results == {"alpha": True, "beta": False, "gamma": True}
+
+    def test_no_tests_returns_empty(self, skills_tmp: Path) -> None:
+        assert run_skill_tests([], skills_tmp) == {}
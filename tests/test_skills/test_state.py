@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 import pytest
 
 from skills_engine.state import (
     compare_semver,
+    compute_bytes_hash,
     compute_file_hash,
+    compute_file_hashes,
     get_custom_modifications,
     read_state,
     record_custom_modification,
@@ -85,6 +88,31 @@ class TestState:
         assert len(hash1) == 64
         assert all(c in "0123456789abcdef" for c in hash1)
 
+    def test_compute_file_hashes_matches_single_file_hash(self) -> None:
+        paths = []
+        for i in range(5):
+            file_path = self.tmp_dir / f"batch-{i}.txt"
+            file_path.write_text(f"content {i}")
+            paths.append(file_path)
+        hashes = compute_file_hashes(paths)
+        assert hashes == {p: compute_file_hash(p) for p in paths}
+
+    def test_compute_bytes_hash_matches_file_hash(self) -> None:
+        file_path = self.tmp_dir / "bytes.txt"
+        file_path.write_bytes(b"merged content\n")
+        assert compute_bytes_hash(b"merged content\n") == compute_file_hash(file_path)
+
+    def test_compute_file_hash_detects_rewrite_of_cached_file(self) -> None:
+        file_path = self.tmp_dir / "cached.txt"
+        file_path.write_text("aaaa")
+        os.utime(file_path, ns=(1_000_000_000, 1_000_000_000))
+        first = compute_file_hash(file_path)
+        assert compute_file_hash(file_path) == first
+
+        file_path.write_text("bbbb")
+        os.utime(file_path, ns=(2_000_000_000, 2_000_000_000))
+        assert compute_file_hash(file_path) != first
+
 
 class TestCompareSemver:
     def test_1_0_0_less_than_1_1_0(self) -> None:
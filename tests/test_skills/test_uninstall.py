@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import subprocess
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 import pytest
 import yaml
 
+from skills_engine.state import compute_file_hashes
 from skills_engine.uninstall import uninstall_skill
 
 from .conftest import init_git_repo, write_state
@@ -241,3 +243,54 @@ class TestUninstall:
         config = (self.tmp_dir / "src" / "config.ts").read_text()
         assert "discord import" in config
         assert "telegram import" not in config
+
+    def test_records_hashes_after_reapplying_custom_patches(self) -> None:
+        base_dir = self.tmp_dir / ".g2" / "base" / "src"
+        base_dir.mkdir(parents=True, exist_ok=True)
+        (base_dir / "config.ts").write_text("base config\n")
+
+        (self.tmp_dir / "src").mkdir(parents=True, exist_ok=True)
+        (self.tmp_dir / "src" / "config.ts").write_text("base config\n")
+        (self.tmp_dir / "src" / "telegram.ts").write_text("tg code\n")
+        (self.tmp_dir / "src" / "discord.ts").write_text("dc code\n")
+        subprocess.run(["git", "add", "src"], cwd=self.tmp_dir, capture_output=True, check=True)
+        (self.tmp_dir / "src" / "discord.ts").write_text("dc code\ncustom tweak\n")
+
+        self._setup_skill_package("telegram", adds={"src/telegram.ts": "tg code\n"})
+        self._setup_skill_package("discord", adds={"src/discord.ts": "dc code\n"})
+
+        patch_dir = self.tmp_dir / ".g2" / "custom"
+        patch_dir.mkdir(parents=True, exist_ok=True)
+        (patch_dir / "001-tweak.patch").write_text(
+            "--- a/src/discord.ts\n+++ b/src/discord.ts\n@@ -1 +1,2 @@\n dc code\n+custom tweak\n"
+        )
+
+        now = datetime.now(UTC).isoformat()
+        write_state(
+            self.tmp_dir,
+            {
+                "skills_system_version": "0.1.0",
+                "core_version": "1.0.0",
+                "applied_skills": [
+                    {"name": "telegram", "version": "1.0.0", "applied_at": now, "file_hashes": {"src/telegram.ts": "a"}},
+                    {"name": "discord", "version": "1.0.0", "applied_at": now, "file_hashes": {"src/discord.ts": "b"}},
+                ],
+                "custom_modifications": [
+                    {
+                        "description": "tweak",
+                        "applied_at": now,
+                        "files_modified": ["src/discord.ts"],
+                        "patch_file": ".g2/custom/001-tweak.patch",
+                    },
+                ],
+            },
+        )
+
+        result = uninstall_skill("telegram")
+        assert result.success is True
+
+        discord_file = self.tmp_dir / "src" / "discord.ts"
+        assert discord_file.read_text() == "dc code\ncustom tweak\n"
+        state = yaml.safe_load((self.tmp_dir / ".g2" / "state.yaml").read_text())
+        (discord,) = state["applied_skills"]
+        assert discord["file_hashes"] == {"src/discord.ts": compute_file_hashes([discord_file])[discord_file]}
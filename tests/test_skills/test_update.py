@@ -102,6 +102,31 @@ class TestPreviewUpdate(TestUpdate):
         preview = preview_update(new_core_dir)
         assert "src/index.ts" not in preview.files_changed
 
+    def test_same_size_edits_are_still_detected(self) -> None:
+        base_dir = self.tmp_dir / ".g2" / "base"
+        (base_dir / "src").mkdir(parents=True, exist_ok=True)
+        (base_dir / "src" / "index.ts").write_text("const a = 1;")
+        (base_dir / "src" / "linked.ts").write_text("shared")
+
+        self._write_state(
+            {
+                "skills_system_version": "0.1.0",
+                "core_version": "1.0.0",
+                "applied_skills": [],
+            }
+        )
+
+        new_core_dir = self._create_new_core_dir(
+            {
+                "src/index.ts": "const b = 2;",
+            }
+        )
+        (new_core_dir / "src" / "linked.ts").hardlink_to(base_dir / "src" / "linked.ts")
+
+        preview = preview_update(new_core_dir)
+        assert "src/index.ts" in preview.files_changed
+        assert "src/linked.ts" not in preview.files_changed
+
     def test_identifies_conflict_risk_with_applied_skills(self) -> None:
         base_dir = self.tmp_dir / ".g2" / "base"
         (base_dir / "src").mkdir(parents=True, exist_ok=True)
@@ -284,6 +309,113 @@ class TestApplyUpdate(TestUpdate):
         assert "core update" in merged
         assert "user addition" in merged
 
+    def test_merges_several_files_in_one_update(self) -> None:
+        base_dir = self.tmp_dir / ".g2" / "base"
+        (base_dir / "src").mkdir(parents=True, exist_ok=True)
+        (self.tmp_dir / "src").mkdir(parents=True, exist_ok=True)
+
+        names = [f"mod{i}.ts" for i in range(4)]
+        for name in names:
+            (base_dir / "src" / name).write_text("line 1\nline 2\nline 3\n")
+            (self.tmp_dir / "src" / name).write_text(f"line 1\nline 2\nline 3\nuser {name}\n")
+
+        self._write_state(
+            {
+                "skills_system_version": "0.1.0",
+                "core_version": "1.0.0",
+                "applied_skills": [],
+            }
+        )
+
+        new_core_dir = self._create_new_core_dir(
+            {f"src/{name}": f"core {name}\nline 1\nline 2\nline 3\n" for name in names}
+        )
+
+        result = apply_update(new_core_dir)
+        assert result.success is True
+
+        for name in names:
+            merged = (self.tmp_dir / "src" / name).read_text()
+            assert f"core {name}" in merged
+            assert f"user {name}" in merged
+
+    def test_runs_skill_tests_after_releasing_the_lock(self) -> None:
+        self._write_state(
+            {
+                "skills_system_version": "0.1.0",
+                "core_version": "1.0.0",
+                "applied_skills": [
+                    {
+                        "name": "telegram",
+                        "version": "1.0.0",
+                        "applied_at": datetime.now(UTC).isoformat(),
+                        "file_hashes": {},
+                        "structured_outcomes": {"test": "test ! -e .g2/lock"},
+                    },
+                ],
+            }
+        )
+
+        new_core_dir = self._create_new_core_dir({"src/index.ts": "new core"})
+
+        result = apply_update(new_core_dir)
+        assert result.success is True
+        assert result.skill_reapply_results == {"telegram": True}
+
+    def test_merge_keeps_file_mode_and_leaves_no_scratch_files(self) -> None:
+        base_dir = self.tmp_dir / ".g2" / "base"
+        (base_dir / "src").mkdir(parents=True, exist_ok=True)
+        (base_dir / "src" / "run.sh").write_text("line 1\nline 2\nline 3\n")
+
+        (self.tmp_dir / "src").mkdir(parents=True, exist_ok=True)
+        current = self.tmp_dir / "src" / "run.sh"
+        current.write_text("line 1\nline 2\nline 3\nuser line\n")
+        current.chmod(0o755)
+
+        self._write_state(
+            {
+                "skills_system_version": "0.1.0",
+                "core_version": "1.0.0",
+                "applied_skills": [],
+            }
+        )
+
+        new_core_dir = self._create_new_core_dir({"src/run.sh": "core line\nline 1\nline 2\nline 3\n"})
+
+        result = apply_update(new_core_dir)
+        assert result.success is True
+        assert "core line" in current.read_text()
+        assert current.stat().st_mode & 0o777 == 0o755
+        assert sorted(p.name for p in (self.tmp_dir / "src").iterdir()) == ["run.sh"]
+
+    def test_failed_merge_leaves_no_scratch_files(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        base_dir = self.tmp_dir / ".g2" / "base"
+        (base_dir / "src").mkdir(parents=True, exist_ok=True)
+        (base_dir / "src" / "index.ts").write_text("line 1\nline 2\n")
+
+        (self.tmp_dir / "src").mkdir(parents=True, exist_ok=True)
+        current = self.tmp_dir / "src" / "index.ts"
+        current.write_text("line 1\nline 2\nuser line\n")
+
+        self._write_state(
+            {
+                "skills_system_version": "0.1.0",
+                "core_version": "1.0.0",
+                "applied_skills": [],
+            }
+        )
+
+        def fail_merges(pending: list[Any]) -> list[Any]:
+            raise RuntimeError("merge exploded")
+
+        monkeypatch.setattr("skills_engine.update._run_merges", fail_merges)
+        new_core_dir = self._create_new_core_dir({"src/index.ts": "core line\nline 1\nline 2\n"})
+
+        result = apply_update(new_core_dir)
+        assert result.success is False
+        assert current.read_text() == "line 1\nline 2\nuser line\n"
+        assert sorted(p.name for p in (self.tmp_dir / "src").iterdir()) == ["index.ts"]
+
     def test_updates_base_directory_after_successful_merge(self) -> None:
         base_dir = self.tmp_dir / ".g2" / "base"
         (base_dir / "src").mkdir(parents=True, exist_ok=True)
@@ -311,6 +443,25 @@ class TestApplyUpdate(TestUpdate):
         new_base = (self.tmp_dir / ".g2" / "base" / "src" / "index.ts").read_text()
         assert new_base == "new base content"
 
+    def test_base_does_not_share_files_with_new_core(self) -> None:
+        (self.tmp_dir / "src").mkdir(parents=True, exist_ok=True)
+        (self.tmp_dir / "src" / "index.ts").write_text("old base")
+        self._write_state(
+            {
+                "skills_system_version": "0.1.0",
+                "core_version": "1.0.0",
+                "applied_skills": [],
+            }
+        )
+        new_core_dir = self._create_new_core_dir({"src/index.ts": "new base content"})
+
+        apply_update(new_core_dir)
+
+        base_file = self.tmp_dir / ".g2" / "base" / "src" / "index.ts"
+        base_file.write_text("edited base")
+        assert (new_core_dir / "src" / "index.ts").read_text() == "new base content"
+        assert not base_file.samefile(new_core_dir / "src" / "index.ts")
+
     def test_updates_core_version_in_state_after_success(self) -> None:
         self._write_state(
             {